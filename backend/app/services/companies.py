@@ -36,7 +36,7 @@ class CompanyRepository:
 
     def save_companies(self, companies: List[Company], payload: Dict[str, object]) -> None:
         with self._lock:
-            dump_companies(self._companies_path, payload, companies)
+            dump_companies(self._companies_path, payload, companies, fsync=True)
 
     def mutate(
         self,
@@ -45,5 +45,5 @@ class CompanyRepository:
         with self._lock:
             companies, payload = self._load()
             result = mutator(companies, payload)
-            dump_companies(self._companies_path, payload, companies)
+            dump_companies(self._companies_path, payload, companies, fsync=True)
             return result
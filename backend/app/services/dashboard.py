@@ -3,97 +3,102 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
 from backend.domain.models import Company
+from backend.domain.utils.companies import company_columns
+
+
+# Numeric fields stored as float64 arrays; None becomes NaN.
+_FLOAT_COLUMNS = (
+    "scope_1",
+    "scope_2",
+    "scope_1_conf",
+    "scope_2_conf",
+    "revenue_mm",
+    "net_income_mm",
+    "ebitda_mm",
+    "assets_mm",
+    "profitability_ratio",
+    "profitability_emissions_ratio",
+    "ebitda_emissions_ratio",
+    "net_zero_mentions_per_page",
+    "reputational_concern_ratio",
+)
+
+# Frame columns copied straight from Annotations, fetched in one attrgetter call.
+_ANNOTATION_COLUMNS = {
+    "anzsic_division": "anzsic_division",
+    "anzsic_context": "anzsic_context",
+    "anzsic_source": "anzsic_source",
+    "revenue_mm": "profitability_revenue_mm_aud",
+    "net_income_mm": "profitability_net_income_mm_aud",
+    "ebitda_mm": "profitability_ebitda_mm_aud",
+    "assets_mm": "profitability_total_assets_mm_aud",
+    "profitability_ratio": "profitability_ratio",
+    "profitability_emissions_ratio": "profitability_emissions_ratio",
+    "ebitda_emissions_ratio": "ebitda_emissions_ratio",
+    "net_zero_mentions_per_page": "net_zero_mentions_per_page",
+    "reputational_concern_ratio": "reputational_concern_ratio",
+    "reporting_group": "reporting_group",
+    "company_country": "company_country",
+    "company_region": "company_region",
+    "company_state": "company_state",
+    "rbics_sector": "rbics_sector",
+    "rbics_sub_sector": "rbics_sub_sector",
+    "rbics_industry_group": "rbics_industry_group",
+    "rbics_industry": "rbics_industry",
+    "year": "profitability_year",
+}
+
+_DATAFRAME_COLUMNS = (
+    "ticker",
+    "name",
+    "scope_1",
+    "scope_2",
+    "scope_1_conf",
+    "scope_2_conf",
+    "anzsic_division",
+    "anzsic_context",
+    "anzsic_source",
+    "revenue_mm",
+    "net_income_mm",
+    "ebitda_mm",
+    "assets_mm",
+    "profitability_ratio",
+    "profitability_emissions_ratio",
+    "ebitda_emissions_ratio",
+    "net_zero_mentions_per_page",
+    "employees",
+    "net_zero_mentions",
+    "reputational_concern_ratio",
+    "reporting_group",
+    "company_country",
+    "company_region",
+    "company_state",
+    "rbics_sector",
+    "rbics_sub_sector",
+    "rbics_industry_group",
+    "rbics_industry",
+    "analysis_method",
+    "year",
+)
 
 
 def companies_to_dataframe(companies: Sequence[Company]) -> pd.DataFrame:
-    rows: List[Dict[str, Any]] = []
-    for company in companies:
-        identity = company.identity
-        emissions = company.emissions
-        annotations = company.annotations
-
-        scope1 = emissions.scope_1.value if emissions.scope_1 else None
-        scope2 = emissions.scope_2.value if emissions.scope_2 else None
-        scope1_conf = emissions.scope_1.confidence if emissions.scope_1 else None
-        scope2_conf = emissions.scope_2.confidence if emissions.scope_2 else None
-        net_income = annotations.profitability_net_income_mm_aud
-        revenue = annotations.profitability_revenue_mm_aud
-        ebitda = annotations.profitability_ebitda_mm_aud
-        assets = annotations.profitability_total_assets_mm_aud
-        employees = annotations.size_employee_count
-        reporting_group = annotations.reporting_group
-        country = annotations.company_country
-        region = annotations.company_region
-        state = annotations.company_state
-        rbics_sector = annotations.rbics_sector
-        rbics_sub_sector = annotations.rbics_sub_sector
-        rbics_group = annotations.rbics_industry_group
-        rbics_industry = annotations.rbics_industry
-        analysis_method = company.analysis_record.method if company.analysis_record else None
-        profitability_ratio = annotations.profitability_ratio
-        reputational_ratio = annotations.reputational_concern_ratio
-        profitability_emissions_ratio = annotations.profitability_emissions_ratio
-        ebitda_emissions_ratio = annotations.ebitda_emissions_ratio
-        net_zero_mentions_per_page = annotations.net_zero_mentions_per_page
-
-        rows.append(
-            {
-                "ticker": identity.ticker,
-                "name": identity.name or identity.ticker,
-                "scope_1": float(scope1) if scope1 is not None else None,
-                "scope_2": float(scope2) if scope2 is not None else None,
-                "scope_1_conf": float(scope1_conf) if scope1_conf is not None else None,
-                "scope_2_conf": float(scope2_conf) if scope2_conf is not None else None,
-                "anzsic_division": annotations.anzsic_division,
-                "anzsic_context": annotations.anzsic_context,
-                "anzsic_source": annotations.anzsic_source,
-                "revenue_mm": float(revenue) if revenue is not None else None,
-                "net_income_mm": float(net_income) if net_income is not None else None,
-                "ebitda_mm": float(ebitda) if ebitda is not None else None,
-                "assets_mm": float(assets) if assets is not None else None,
-                "profitability_ratio": float(profitability_ratio)
-                if profitability_ratio is not None
-                else None,
-                "profitability_emissions_ratio": float(profitability_emissions_ratio)
-                if profitability_emissions_ratio is not None
-                else None,
-                "ebitda_emissions_ratio": float(ebitda_emissions_ratio)
-                if ebitda_emissions_ratio is not None
-                else None,
-                "net_zero_mentions_per_page": float(net_zero_mentions_per_page)
-                if net_zero_mentions_per_page is not None
-                else None,
-                "employees": int(employees) if employees is not None else None,
-                "net_zero_mentions": int(annotations.net_zero_claims)
-                if annotations.net_zero_claims is not None
-                else None,
-                "reputational_concern_ratio": float(reputational_ratio)
-                if reputational_ratio is not None
-                else None,
-                "reporting_group": reporting_group,
-                "company_country": country,
-                "company_region": region,
-                "company_state": state,
-                "rbics_sector": rbics_sector,
-                "rbics_sub_sector": rbics_sub_sector,
-                "rbics_industry_group": rbics_group,
-                "rbics_industry": rbics_industry,
-                "analysis_method": analysis_method,
-                "year": annotations.profitability_year,
-            }
-        )
-
-    if not rows:
+    if not companies:
         return pd.DataFrame()
-    df = pd.DataFrame(rows)
-    s1 = pd.to_numeric(df["scope_1"], errors="coerce")
-    s2 = pd.to_numeric(df["scope_2"], errors="coerce")
-    combined = s1.fillna(0) + s2.fillna(0)
-    combined[(s1.isna()) & (s2.isna())] = pd.NA
-    df["scope_1_total"] = combined
+
+    data = company_columns(
+        companies, _DATAFRAME_COLUMNS, _ANNOTATION_COLUMNS, _FLOAT_COLUMNS
+    )
+    df = pd.DataFrame(data, columns=list(_DATAFRAME_COLUMNS))
+    s1 = data["scope_1"]
+    s2 = data["scope_2"]
+    df["scope_1_total"] = np.where(
+        np.isnan(s1) & np.isnan(s2), np.nan, np.nan_to_num(s1) + np.nan_to_num(s2)
+    )
     return df
 
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-import base64
 import re
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
@@ -23,6 +23,7 @@ from backend.domain.utils.documents import (
     infer_year_from_text,
     normalise_pdf_url,
 )
+from backend.domain.utils.files import uploaded_pdf_payload, write_uploaded_pdf
 from backend.domain.utils.pdf_preview import previews_as_data_urls
 from backend.domain.utils.query import derive_filename
 
@@ -55,6 +56,8 @@ def next_pending_key(
     allowed_methods: Optional[set[str]] = None,
 ) -> Optional[str]:
     pending_keys: List[str] = []
+    # First position of each key, so membership and lookup don't rescan the list.
+    pending_index: Dict[str, int] = {}
     for company in companies:
         if company.verification and company.verification.status == "accepted":
             continue
@@ -63,15 +66,16 @@ def next_pending_key(
             continue
         key = company_key(company)
         if key:
+            pending_index.setdefault(key, len(pending_keys))
             pending_keys.append(key)
     if not pending_keys:
         return None
-    if current_key not in pending_keys:
+    if current_key not in pending_index:
         return pending_keys[0]
     if skip_current:
         if len(pending_keys) == 1:
             return pending_keys[0]
-        current_index = pending_keys.index(current_key)
+        current_index = pending_index[current_key]
         return pending_keys[(current_index + 1) % len(pending_keys)]
     return current_key
 
@@ -344,42 +348,27 @@ def _normalise_upload_filename(filename: Optional[str]) -> str:
     return re.sub(r"[^A-Za-z0-9_.-]", "_", name)
 
 
-def _decode_uploaded_pdf(contents: str) -> bytes:
-    if not contents:
-        raise ValueError("No upload payload provided.")
-    try:
-        header, encoded = contents.split(",", 1)
-    except ValueError as exc:  # pragma: no cover - malformed payload
-        raise ValueError("Uploaded file payload is malformed.") from exc
-    if "pdf" not in header.lower():
-        raise ValueError("Uploaded file does not appear to be a PDF.")
-    try:
-        data = base64.b64decode(encoded)
-    except ValueError as exc:  # pragma: no cover - malformed base64
-        raise ValueError("Failed to decode uploaded PDF.") from exc
-    if not data.startswith(b"%PDF"):
-        raise ValueError("Uploaded file is not a valid PDF document.")
-    return data
-
-
 def _store_uploaded_pdf(
     base_dir: Path,
     downloads_dir: Path,
     company: Company,
     filename: Optional[str],
-    data: bytes,
+    contents: str,
 ) -> Path:
+    """Validate a data-URL PDF upload and stream it into ``downloads_dir``."""
+    encoded = uploaded_pdf_payload(contents)
     safe_ticker = _clean_company_token(company.identity.ticker)
     safe_name = _clean_company_token(company.identity.name)
     identifier = safe_ticker or safe_name or "company"
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    # Nanosecond stamps keep rapid re-uploads apart and still sort chronologically.
+    timestamp = f"{time.time_ns():020d}"
     sanitized_filename = _normalise_upload_filename(filename)
 
     download_dir = downloads_dir.resolve()
     download_dir.mkdir(parents=True, exist_ok=True)
 
     destination = download_dir / f"{identifier}_{timestamp}_{sanitized_filename}"
-    destination.write_bytes(data)
+    write_uploaded_pdf(encoded, destination)
 
     try:
         relative = destination.relative_to(base_dir)
@@ -401,7 +390,7 @@ def apply_reject(
 ) -> str:
     stages_requested: List[str] = []
     sanitized_url: Optional[str] = None
-    upload_bytes: Optional[bytes] = None
+    stored_path: Optional[Path] = None
 
     if new_url:
         candidate_url, is_pdf = normalise_pdf_url(new_url)
@@ -426,7 +415,13 @@ def apply_reject(
 
     if upload_contents:
         try:
-            upload_bytes = _decode_uploaded_pdf(upload_contents)
+            stored_path = _store_uploaded_pdf(
+                base_dir,
+                downloads_dir,
+                company,
+                upload_filename,
+                upload_contents,
+            )
         except ValueError as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
         if "s2" not in stages_requested:
@@ -458,14 +453,7 @@ def apply_reject(
             doc_type=doc_type,
         )
 
-    if upload_bytes is not None:
-        stored_path = _store_uploaded_pdf(
-            base_dir,
-            downloads_dir,
-            company,
-            upload_filename,
-            upload_bytes,
-        )
+    if stored_path is not None:
         company.download_record = DownloadRecord(pdf_path=str(stored_path))
 
     ordered = _ordered_stage_dependencies(stages_requested)
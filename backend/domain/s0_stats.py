@@ -35,7 +35,7 @@ from backend.domain.utils.documents import (
     infer_year_from_text,
 )
 from backend.domain.utils.documents import normalise_pdf_url  # type: ignore[attr-defined]
-from backend.domain.utils.pdf import extract_pdf_text
+from backend.domain.utils.pdf import iter_pdf_text, load_or_extract_pdf_text
 from backend.domain.utils.query import derive_filename
 
 
@@ -182,7 +182,7 @@ def validate_search_record(
 
     if check_pdf_year:
         if pdf_path and pdf_path.exists() and pdf_path.suffix.lower() == ".pdf":
-            pages = extract_pdf_text(pdf_path, max_pages=1)
+            pages = load_or_extract_pdf_text(pdf_path, max_pages=1)
             pdf_year, future_year = _highest_year_from_pages(pages)
             if future_year:
                 issues.append(
@@ -964,17 +964,19 @@ def main(argv: list[str]) -> int:
                         path, company.download_record.pdf_path
                     )
                     if pdf_candidate.exists():
-                        pdf_pages = extract_pdf_text(
+                        # Pages are read lazily, so the scan stops at the
+                        # first page that mentions a scope keyword.
+                        pages_read = 0
+                        for page_text in iter_pdf_text(
                             pdf_candidate, max_pages=SCOPE_SCAN_MAX_PAGES
-                        )
-                        if not pdf_pages:
+                        ):
+                            pages_read += 1
+                            if page_text and SCOPE_KEYWORDS_RE.search(page_text):
+                                scope_present = True
+                                scope_source = f"pdf page {pages_read}"
+                                break
+                        if not pages_read:
                             scope_notes.append("no text extracted from PDF")
-                        else:
-                            for idx, page_text in enumerate(pdf_pages):
-                                if page_text and SCOPE_KEYWORDS_RE.search(page_text):
-                                    scope_present = True
-                                    scope_source = f"pdf page {idx + 1}"
-                                    break
                     else:
                         scope_notes.append("pdf missing on disk")
 
@@ -1034,7 +1036,7 @@ def main(argv: list[str]) -> int:
             )
 
     if any_changes and write:
-        dump_companies(path, payload, companies)
+        dump_companies(path, payload, companies, fsync=True)
         print(f"[stats] Corrections saved to {path}")
     elif any_changes:
         print("[stats] Corrections available (run with --write to persist).")
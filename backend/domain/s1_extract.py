@@ -36,7 +36,7 @@ def main():
     except ValueError as exc:
         sys.exit(str(exc))
 
-    dump_companies(output_path, {"companies": []}, companies)
+    dump_companies(output_path, {"companies": []}, companies, fsync=True)
     print(f"Wrote {len(companies)} companies to {output_path}")
 
 
@@ -114,7 +114,7 @@ def main():
         )
 
     if restored_records:
-        dump_companies(companies_path, payload, companies)
+        dump_companies(companies_path, payload, companies, fsync=True)
 
     pending = get_unsearched_companies(companies)
 
@@ -130,6 +130,7 @@ def main():
             flush=True,
         )
         review_queue: list[tuple[int, str]] = []
+        saved = False
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             future_map = {
                 executor.submit(
@@ -165,6 +166,10 @@ def main():
                 if accepted and record_payload:
                     company.search_record = SearchRecord.model_validate(record_payload)
                     dump_companies(companies_path, payload, companies)
+                    saved = True
+        if saved:
+            # Per-company checkpoints skip the disk flush; end on a durable write.
+            dump_companies(companies_path, payload, companies, fsync=True)
         if review_queue:
             print("\nReview queue:", flush=True)
             for entry_idx, item in sorted(review_queue):
@@ -174,6 +179,7 @@ def main():
     client = OpenAI()
     auto_mode = args.mode == "auto"
     review_queue: list[tuple[int, str]] = []
+    saved = False
 
     for idx, company in enumerate(pending, start=1):
         identity = company.identity
@@ -208,6 +214,7 @@ def main():
 
         company.search_record = record
         dump_companies(companies_path, payload, companies)
+        saved = True
 
         if auto_mode:
             time.sleep(5.0)
@@ -240,11 +247,16 @@ def main():
                     pending_company = pending[entry_idx - 1]
                     pending_company.search_record = manual_record
                     dump_companies(companies_path, payload, companies)
+                    saved = True
                     print("Recorded manual URL.", flush=True)
                     break
                 except Exception as exc:  # pylint: disable=broad-except
                     print(f"Invalid input ({exc}); try again.", flush=True)
 
+    if saved:
+        # Per-company checkpoints skip the disk flush; end on a durable write.
+        dump_companies(companies_path, payload, companies, fsync=True)
+
 
 if __name__ == "__main__":
     main()
@@ -272,7 +272,7 @@ def main():
                 dump_companies(companies_path, payload, companies)
 
     if sanitised_urls or removed_records:
-        dump_companies(companies_path, payload, companies)
+        dump_companies(companies_path, payload, companies, fsync=True)
 
     print(f"Updated {companies_path}", flush=True)
 
@@ -11,9 +11,8 @@ from backend.domain.utils.companies import dump_companies, load_companies, safe_
 from backend.domain.utils.pdf import (
     build_text_snippet,
     camelot_available,
-    extract_pdf_text,
     extract_scope_tables,
-    keyword_hit_pages,
+    scan_pdf,
 )
 from backend.domain.utils.text import count_tokens
 
@@ -76,6 +75,7 @@ def process_company_task(
     extract_dir: str,
     debug: bool,
     clean: bool,
+    page_jobs: int = 1,
 ) -> Tuple[int, dict[str, Any], List[str], int, bool]:
     company = Company.model_validate(company_data)
     extract_dir_path = Path(extract_dir)
@@ -175,8 +175,11 @@ def process_company_task(
                 log(f"SKIP {progress_prefix} extract {ticker}: already exists")
             return finalize()
 
-    pages = extract_pdf_text(pdf_path)
-    if not pages:
+    # Keyword matching happens page by page during extraction, so only the
+    # hit pages' text is held for the snippet.
+    scan = scan_pdf(pdf_path, KEYWORD_RE, workers=page_jobs)
+    pages = scan.pages
+    if not scan.page_count:
         company.extraction_record = None
         log(
             f"FAIL {progress_prefix} extract {ticker}: no text extracted; extraction record cleared"
@@ -188,10 +191,10 @@ def process_company_task(
         )
         return finalize()
 
-    if sum(len(p) for p in pages) < 200:
+    if scan.total_chars < 200:
         log(f"NOTE {ticker}: low/empty text; OCR may be required for {pdf_path.name}")
 
-    hits = keyword_hit_pages(pages, KEYWORD_RE)
+    hits = scan.hit_pages
     if not hits:
         company.search_record = None
         company.download_record = None
@@ -328,6 +331,7 @@ def main(argv: Optional[List[str]] = None) -> None:
     total_deleted = 0
 
     if jobs == 1 or total_ok <= 1:
+        # With no document-level pool, spare --jobs go to page extraction.
         for progress_idx, (company_index, company) in enumerate(
             indexed_candidates, start=1
         ):
@@ -339,6 +343,7 @@ def main(argv: Optional[List[str]] = None) -> None:
                 str(extract_dir),
                 debug,
                 args.clean,
+                jobs,
             )
             (
                 _,
@@ -391,7 +396,7 @@ def main(argv: Optional[List[str]] = None) -> None:
                 for message in logs:
                     print(message, flush=True)
 
-    dump_companies(companies_path, payload, companies)
+    dump_companies(companies_path, payload, companies, fsync=True)
     print(
         f"Deleted files during extraction: {total_deleted}",
         flush=True,
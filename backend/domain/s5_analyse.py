@@ -4,6 +4,7 @@ import argparse
 import random
 import re
 import sys
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import suppress
 from dataclasses import dataclass
@@ -12,6 +13,15 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from openai import OpenAI
 
+try:  # pragma: no cover - optional dependency
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+try:  # pragma: no cover - optional dependency
+    import h2
+except ImportError:  # pragma: no cover
+    h2 = None
 
 from backend.domain.models import Company
 
@@ -25,6 +35,7 @@ from backend.domain.utils.verification import (
     parse_data_filesearch,
     parse_data_llama,
     parse_data_local,
+    parse_data_local_batch,
     ParsedResult,
     update_company_emissions,
 )
@@ -35,6 +46,24 @@ PAGE_HEADER_RE = re.compile(r"=== Page (\d+)\s*===", re.IGNORECASE)
 TABLE_HEADER_RE = re.compile(r"=== Table \d+\s+\(page\s+(\d+)\)\s*===", re.IGNORECASE)
 
 
+def _build_openai_client() -> OpenAI:
+    """One OpenAI client for the whole run; its connection pool is thread-safe.
+
+    When httpx is importable the pool is sized for --jobs workers issuing
+    requests at once, and speaks HTTP/2 if the optional h2 package is
+    installed; otherwise the SDK's default client is used.
+    """
+    if httpx is None:
+        return OpenAI()
+    from openai import DefaultHttpxClient
+
+    http_client = DefaultHttpxClient(
+        http2=h2 is not None,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    )
+    return OpenAI(http_client=http_client)
+
+
 @dataclass
 class AnalysisResult:
     changed: bool
@@ -309,6 +338,14 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
             "forcing the AI snippet tables workflow."
         ),
     )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help=(
+            "With --reanalyse-python, submit every tables snippet through the OpenAI Batch API "
+            "up front (cheaper, but may take up to 24h) instead of one request per company."
+        ),
+    )
     return parser.parse_args(argv)
 
 
@@ -376,6 +413,7 @@ def analyse_company(
     prompt_accept_fn: Callable[[str, ParsedResult, str, List[int], float], bool],
     test_mode: bool,
     force_ai_tables: bool = False,
+    ai_snippet_results: Optional[Dict[str, Optional[ParsedResult]]] = None,
 ) -> AnalysisResult:
     identity = company.identity
     ticker = identity.ticker or identity.name
@@ -568,7 +606,13 @@ def analyse_company(
                     f"SKIP [{idx}/{total}] {ticker}: reanalysis requires OpenAI snippet access; --local not supported"
                 )
                 continue
-            parsed_ai_snippet = parse_data_local(ensure_client(), snippet_text)
+            if (
+                ai_snippet_results is not None
+                and str(snippet_path) in ai_snippet_results
+            ):
+                parsed_ai_snippet = ai_snippet_results[str(snippet_path)]
+            else:
+                parsed_ai_snippet = parse_data_local(ensure_client(), snippet_text)
             if attempt_method(
                 "ai-snippet",
                 parsed_ai_snippet,
@@ -757,10 +801,13 @@ def main(argv: Optional[list[str]] = None) -> int:
                 return None
         return local_llm_model
 
+    client_lock = threading.Lock()
+
     def ensure_client() -> OpenAI:
         nonlocal client
-        if client is None:
-            client = OpenAI()
+        with client_lock:
+            if client is None:
+                client = _build_openai_client()
         return client
 
     dirty = False
@@ -779,12 +826,6 @@ def main(argv: Optional[list[str]] = None) -> int:
         dirty = False
         persisted = True
     jobs = max(1, args.jobs)
-    if reanalyse_python and jobs > 1:
-        print(
-            "WARN: --reanalyse-python runs sequentially; ignoring --jobs.",
-            flush=True,
-        )
-        jobs = 1
     if jobs > 1:
         if test_mode:
             print(
@@ -804,7 +845,7 @@ def main(argv: Optional[list[str]] = None) -> int:
                 flush=True,
             )
             jobs = 1
-        elif not args.no_upload:
+        elif not (args.no_upload or reanalyse_python):
             print(
                 "WARN: --jobs > 1 currently requires --no-upload; running sequentially.",
                 flush=True,
@@ -869,6 +910,34 @@ def main(argv: Optional[list[str]] = None) -> int:
             print("No companies require analysis.", flush=True)
             return 0
 
+    ai_snippet_results: Optional[Dict[str, Optional[ParsedResult]]] = None
+    if args.batch and not reanalyse_python:
+        print("WARN: --batch only applies to --reanalyse-python; ignoring.", flush=True)
+    elif args.batch:
+        batch_snippets: Dict[str, str] = {}
+        for _, company in company_pairs:
+            extraction = company.extraction_record
+            if (
+                not extraction
+                or not extraction.table_path
+                or extraction.table_count <= 0
+            ):
+                continue
+            table_path = Path(extraction.table_path)
+            with suppress(OSError):
+                batch_snippets[str(table_path)] = table_path.read_text(
+                    encoding="utf-8"
+                )
+        print(
+            f"Submitting {len(batch_snippets)} tables snippet(s) to the OpenAI Batch API.",
+            flush=True,
+        )
+        ai_snippet_results = parse_data_local_batch(
+            ensure_client(),
+            batch_snippets,
+            log=lambda message: print(message, flush=True),
+        )
+
     if jobs == 1:
         for position, (company_index, company) in enumerate(company_pairs, start=1):
 
@@ -903,6 +972,7 @@ def main(argv: Optional[list[str]] = None) -> int:
                 prompt_accept_fn=prompt_accept_wrapper,
                 test_mode=test_mode,
                 force_ai_tables=reanalyse_python,
+                ai_snippet_results=ai_snippet_results,
             )
             vector_store_id = result.vector_store_id
             if result.changed:
@@ -942,14 +1012,6 @@ def main(argv: Optional[list[str]] = None) -> int:
             company_payload: Dict[str, Any],
             position: int,
         ) -> Tuple[int, Dict[str, Any], List[str], bool]:
-            local_client: Optional[OpenAI] = None
-
-            def ensure_client_worker() -> OpenAI:
-                nonlocal local_client
-                if local_client is None:
-                    local_client = OpenAI()
-                return local_client
-
             logs: List[str] = []
             company_obj = Company.model_validate(company_payload)
             worker_result = analyse_company(
@@ -961,12 +1023,14 @@ def main(argv: Optional[list[str]] = None) -> int:
                 local_only=use_local_only,
                 local_llm_path=None,
                 no_upload=True,
-                ensure_client=ensure_client_worker,
+                ensure_client=ensure_client,
                 ensure_local_llm=lambda: None,
                 vector_store_id=None,
                 log=logs.append,
                 prompt_accept_fn=lambda *_: False,
                 test_mode=False,
+                force_ai_tables=reanalyse_python,
+                ai_snippet_results=ai_snippet_results,
             )
             worker_changed = worker_result.changed
             ticker = company_obj.identity.ticker or company_obj.identity.name
@@ -1011,8 +1075,10 @@ def main(argv: Optional[list[str]] = None) -> int:
     if test_mode:
         print("TEST MODE complete: no changes persisted.", flush=True)
     else:
-        if dirty:
-            persist_if_needed()
+        if dirty or persisted:
+            # Checkpoints in the loop skip the disk flush; end on a durable write.
+            dump_companies(companies_path, payload, companies, fsync=True)
+            persisted = True
         if persisted:
             print(f"Updated {companies_path}", flush=True)
         else:
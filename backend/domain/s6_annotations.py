@@ -1,24 +1,35 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import hashlib
+import itertools
 import json
+import os
 import re
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
 
-import pandas as pd
 from pydantic import BaseModel, Field
-from openai import OpenAI
 
 from backend.domain.models import Annotations, Company
 from backend.domain.utils.companies import dump_companies, load_companies
-from backend.domain.utils.pdf import extract_pdf_text
-from backend.domain.utils.verification import _clean_json_response  # type: ignore[attr-defined]
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# openai, openpyxl, PyPDF2 and llama_cpp are imported where they are used so
+# that `--help` and runs that skip those stages start quickly.
 if TYPE_CHECKING:  # pragma: no cover
     from llama_cpp import Llama
+    from openai import AsyncOpenAI
 
 
 class ClassificationResult(BaseModel):
@@ -49,6 +60,65 @@ ANZSIC_DIVISIONS = [
     "Other Services",
 ]
 
+# Zero-based row index of the column titles in the screening workbook.
+PROFITABILITY_HEADER_ROW = 3
+
+# Prompts are built once so every request shares a byte-identical prefix,
+# which lets OpenAI's prompt caching (and llama.cpp prefix reuse) kick in.
+_DIVISION_LIST = "\n".join(f"- {div}" for div in ANZSIC_DIVISIONS)
+_PRIMARY_INSTRUCTIONS = (
+    "Classify each of the following Australian companies into its most likely ANZSIC division. "
+    "The companies are given as a numbered list. For every company, choose exactly one "
+    "division from the provided list and return one entry in results with keys: index "
+    "(the company's number), company_name, division (exact match), confidence (0-1), and "
+    "context (short supporting sentence).\n"
+    f"Divisions:\n{_DIVISION_LIST}"
+)
+_LOCAL_PROMPT_PREFIX = (
+    "You are an assistant that maps Australian companies to their ANZSIC division.\n"
+    "Choose the single most likely division from the following list:\n"
+    f"{_DIVISION_LIST}\n\n"
+    "Respond with JSON containing keys: division (one of the divisions exactly), "
+    "confidence (0.0-1.0), and context (short sentence justifying the choice).\n"
+    "Company name: "
+)
+
+# Strict structured-output schema for a batch of classifications, built once
+# and sent verbatim so responses can be read without a pydantic round trip.
+_BATCH_RESULT_FORMAT: Dict[str, Any] = {
+    "type": "json_schema",
+    "name": "BatchClassificationResult",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "additionalProperties": False,
+        "required": ["results"],
+        "properties": {
+            "results": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "additionalProperties": False,
+                    "required": [
+                        "index",
+                        "company_name",
+                        "division",
+                        "confidence",
+                        "context",
+                    ],
+                    "properties": {
+                        "index": {"type": "integer"},
+                        "company_name": {"type": ["string", "null"]},
+                        "division": {"type": ["string", "null"]},
+                        "confidence": {"type": ["number", "null"]},
+                        "context": {"type": ["string", "null"]},
+                    },
+                },
+            }
+        },
+    },
+}
+
 PROFITABILITY_COLUMNS = {
     "Year": "profitability_year",
     "Revenue (MM) (AUD)": "profitability_revenue_mm_aud",
@@ -58,6 +128,25 @@ PROFITABILITY_COLUMNS = {
     "Number of Employees": "size_employee_count",
 }
 
+CLASSIFICATION_CACHE_FILE = Path(".anzsic_cache.jsonl")
+
+PRIMARY_MODEL = "gpt-4o-mini"
+PRIMARY_BATCH_SIZE = 20
+PRIMARY_OUTPUT_TOKENS_PER_COMPANY = 128
+# ggml_type ids accepted by Llama(type_k=..., type_v=...).
+LOCAL_KV_CACHE_TYPES = {"f16": 1, "q8_0": 8, "q4_0": 2}
+# GGUF general.file_type values for unquantised weights.
+_UNQUANTISED_GGUF_FILE_TYPES = {"0": "F32", "1": "F16", "32": "BF16"}
+
+NAME_RULE_SOURCE = "rule-based"
+NAME_RULE_CONFIDENCE = 0.85
+
+CHECKPOINT_EVERY = 50
+RATE_LIMIT_MAX_ATTEMPTS = 5
+RATE_LIMIT_COOLDOWN_SECONDS = 15.0
+TRANSIENT_RETRY_SECONDS = 2.0
+RATE_LIMITER_TICK_SECONDS = 0.05
+
 TEXT_COLUMNS = {
     "Primary FactSet RBICS Sector": "rbics_sector",
     "Primary FactSet RBICS Sub Sector": "rbics_sub_sector",
@@ -68,6 +157,10 @@ TEXT_COLUMNS = {
     "Company State": "company_state",
 }
 
+_PROFITABILITY_ANNOTATION_FIELDS = tuple(PROFITABILITY_COLUMNS.values()) + tuple(
+    TEXT_COLUMNS.values()
+)
+
 
 def parse_args(argv: List[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -85,21 +178,75 @@ def parse_args(argv: List[str]) -> argparse.Namespace:
         default=0,
         help="Number of layers to offload to GPU when loading the local model (default: 0).",
     )
+    parser.add_argument(
+        "--local-llm-threshold",
+        type=float,
+        default=0.9,
+        help=(
+            "Skip the local check when the primary confidence is at least this value "
+            "(default: 0.9; use a value above 1 to always run it)."
+        ),
+    )
+    parser.add_argument(
+        "--local-llm-kv-cache-type",
+        choices=sorted(LOCAL_KV_CACHE_TYPES),
+        default="f16",
+        help="KV cache precision for the local model; q8_0 roughly halves its memory (default: f16).",
+    )
     parser.add_argument(
         "--force",
         action="store_true",
         help="Re-run annotations even if existing values are present.",
     )
+    parser.add_argument(
+        "--no-name-rules",
+        action="store_true",
+        help="Send every company to the model instead of classifying obvious names (e.g. '... Resources Ltd') by rule.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Ignore cached classifications in {CLASSIFICATION_CACHE_FILE} (new results are still recorded).",
+    )
     parser.add_argument(
         "--jobs",
         type=int,
-        default=1,
-        help="Number of parallel workers to use for classification (default: 1).",
+        default=20,
+        help="Maximum number of concurrent gpt-4o-mini requests (default: 20).",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=PRIMARY_BATCH_SIZE,
+        help=f"Number of companies classified per gpt-4o-mini request (default: {PRIMARY_BATCH_SIZE}).",
+    )
+    parser.add_argument(
+        "--max-rpm",
+        type=float,
+        default=500,
+        help="Request-per-minute budget for gpt-4o-mini calls (default: 500).",
+    )
+    parser.add_argument(
+        "--max-tpm",
+        type=float,
+        default=200_000,
+        help="Token-per-minute budget for gpt-4o-mini calls (default: 200000).",
+    )
+    parser.add_argument(
+        "--openai-keys",
+        default=os.environ.get("OPENAI_API_KEYS", ""),
+        help=(
+            "Comma-separated OpenAI API keys to spread requests across (default: "
+            "$OPENAI_API_KEYS, else the standard OPENAI_API_KEY). --max-rpm and "
+            "--max-tpm apply to each key separately."
+        ),
     )
     return parser.parse_args(argv)
 
 
-def ensure_local_llm(model_path: Path, gpu_layers: int) -> Optional["Llama"]:
+def ensure_local_llm(
+    model_path: Path, gpu_layers: int, kv_cache_type: str = "f16"
+) -> Optional["Llama"]:
     try:
         from llama_cpp import Llama  # type: ignore[import]
     except ImportError:
@@ -110,11 +257,17 @@ def ensure_local_llm(model_path: Path, gpu_layers: int) -> Optional["Llama"]:
         return None
 
     try:
-        return Llama(
+        cache_type = LOCAL_KV_CACHE_TYPES[kv_cache_type]
+        llm = Llama(
             model_path=str(model_path),
             n_ctx=2048,
+            n_batch=512,
             embedding=False,
             n_gpu_layers=max(0, gpu_layers),
+            type_k=cache_type,
+            type_v=cache_type,
+            # llama.cpp only supports a quantised V cache with flash attention.
+            flash_attn=kv_cache_type != "f16",
         )
     except Exception as exc:  # pragma: no cover - hardware dependent
         print(
@@ -122,95 +275,336 @@ def ensure_local_llm(model_path: Path, gpu_layers: int) -> Optional["Llama"]:
             flush=True,
         )
         return None
+    warn_if_unquantised(llm, model_path)
+    warm_local_prompt_cache(llm)
+    return llm
+
+
+def warn_if_unquantised(llm: "Llama", model_path: Path) -> None:
+    metadata = getattr(llm, "metadata", None) or {}
+    file_type = _UNQUANTISED_GGUF_FILE_TYPES.get(str(metadata.get("general.file_type")))
+    if file_type is None:
+        return
+    print(
+        f"WARN: {model_path.name} stores {file_type} weights; a Q4_K_M or Q5_K_M quant "
+        "classifies 2-4x faster with negligible accuracy loss "
+        f"(e.g. llama-quantize {model_path.name} model-q4_k_m.gguf q4_k_m).",
+        flush=True,
+    )
+
+
+def warm_local_prompt_cache(llm: "Llama") -> None:
+    """Evaluate the shared prompt prefix once so its KV entries stay cached.
+
+    llama-cpp-python reuses the longest matching token prefix between calls,
+    so every later completion only has to evaluate the company name suffix.
+    """
+    try:
+        llm.eval(llm.tokenize(_LOCAL_PROMPT_PREFIX.encode("utf-8")))
+    except Exception as exc:  # pragma: no cover - runtime safety
+        print(f"WARN: unable to pre-evaluate local prompt prefix ({exc}).", flush=True)
+
+
+def _is_blank_cell(value: object) -> bool:
+    return (
+        value is None or (isinstance(value, str) and not value.strip()) or value == "-"
+    )
+
+
+def _coerce_profitability_value(field_name: str, value: object) -> Optional[object]:
+    if _is_blank_cell(value):
+        return None
+    try:
+        if field_name == "profitability_year":
+            return int(value)  # type: ignore[arg-type]
+        if field_name == "size_employee_count":
+            return int(float(value))  # type: ignore[arg-type]
+        return float(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return None
 
 
 def load_profitability_map(xlsx_path: Path) -> Dict[str, Dict[str, object]]:
     if not xlsx_path.exists():
         print(f"WARN: profitability file not found ({xlsx_path}).", flush=True)
         return {}
-    df = pd.read_excel(xlsx_path, header=3)
-    if "Identifier" not in df.columns:
-        print("WARN: profitability sheet missing 'Identifier' column.", flush=True)
-        return {}
-    df = df.dropna(subset=["Identifier"])
-    mapping: Dict[str, Dict[str, object]] = {}
-    for _, row in df.iterrows():
-        ident = str(row["Identifier"]).strip().upper()
-        if not ident:
-            continue
-        entry: Dict[str, object] = {}
-        for col, field in PROFITABILITY_COLUMNS.items():
-            val = row.get(col)
-            if pd.isna(val) or (isinstance(val, str) and not val.strip()) or val == "-":
-                entry[field] = None
-            else:
-                if field == "profitability_year":
-                    try:
-                        entry[field] = int(val)
-                    except (TypeError, ValueError):
-                        entry[field] = None
-                elif field == "size_employee_count":
-                    try:
-                        entry[field] = int(float(val))
-                    except (TypeError, ValueError):
-                        entry[field] = None
-                else:
-                    try:
-                        entry[field] = float(val)
-                    except (TypeError, ValueError):
-                        entry[field] = None
-        for col, field in TEXT_COLUMNS.items():
-            raw_val = row.get(col)
-            if pd.isna(raw_val):
-                entry[field] = None
-            else:
-                text_val = str(raw_val).strip()
-                entry[field] = text_val or None
-        company_type = row.get("Company Type Main")
-        entry["company_type_main"] = (
-            str(company_type).strip() if isinstance(company_type, str) else None
+
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(xlsx_path, data_only=True, read_only=True)
+    try:
+        sheet = workbook.active
+        if sheet is None:
+            print("WARN: profitability workbook has no active sheet.", flush=True)
+            return {}
+        rows = sheet.iter_rows(values_only=True)
+        header: Optional[Tuple[object, ...]] = None
+        for _ in range(PROFITABILITY_HEADER_ROW + 1):
+            header = next(rows, None)
+        columns: Dict[str, int] = {}
+        for position, title in enumerate(header or ()):
+            if title is not None:
+                columns.setdefault(str(title).strip(), position)
+        if "Identifier" not in columns:
+            print("WARN: profitability sheet missing 'Identifier' column.", flush=True)
+            return {}
+
+        def lookup(row: Tuple[object, ...], column: str) -> object:
+            position = columns.get(column)
+            if position is None or position >= len(row):
+                return None
+            return row[position]
+
+        mapping: Dict[str, Dict[str, object]] = {}
+        for row in rows:
+            raw_ident = lookup(row, "Identifier")
+            if raw_ident is None:
+                continue
+            ident = str(raw_ident).strip().upper()
+            if not ident or ident in mapping:
+                continue
+            entry: Dict[str, object] = {}
+            for col, field_name in PROFITABILITY_COLUMNS.items():
+                entry[field_name] = _coerce_profitability_value(
+                    field_name, lookup(row, col)
+                )
+            for col, field_name in TEXT_COLUMNS.items():
+                raw_val = lookup(row, col)
+                entry[field_name] = (
+                    (str(raw_val).strip() or None) if raw_val is not None else None
+                )
+            company_type = lookup(row, "Company Type Main")
+            entry["company_type_main"] = (
+                company_type.strip() if isinstance(company_type, str) else None
+            )
+            raw_name = lookup(row, "Name")
+            entry["name"] = raw_name.strip() if isinstance(raw_name, str) else None
+            mapping[ident] = entry
+        return mapping
+    finally:
+        workbook.close()
+
+
+@dataclass
+class RateLimiter:
+    """Token-bucket throttle for the OpenAI request and token budgets.
+
+    Capacity refills continuously at ``max_requests_per_minute / 60`` and
+    ``max_tokens_per_minute / 60`` per second, so requests are held back before
+    they would trip a 429 rather than retried afterwards.
+    """
+
+    max_requests_per_minute: float
+    max_tokens_per_minute: float
+    available_request_capacity: float = field(init=False)
+    available_token_capacity: float = field(init=False)
+    last_update_time: float = field(init=False)
+    cooldown_until: float = field(init=False, default=0.0)
+
+    def __post_init__(self) -> None:
+        self.available_request_capacity = self.max_requests_per_minute
+        self.available_token_capacity = self.max_tokens_per_minute
+        self.last_update_time = time.monotonic()
+
+    def _replenish(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self.last_update_time
+        self.available_request_capacity = min(
+            self.available_request_capacity
+            + elapsed * self.max_requests_per_minute / 60.0,
+            self.max_requests_per_minute,
+        )
+        self.available_token_capacity = min(
+            self.available_token_capacity + elapsed * self.max_tokens_per_minute / 60.0,
+            self.max_tokens_per_minute,
+        )
+        self.last_update_time = now
+
+    async def acquire(self, token_cost: int) -> None:
+        # Never wait for more tokens than the bucket can ever hold.
+        token_cost = min(token_cost, int(self.max_tokens_per_minute))
+        while True:
+            now = time.monotonic()
+            if now < self.cooldown_until:
+                await asyncio.sleep(self.cooldown_until - now)
+                continue
+            self._replenish()
+            if (
+                self.available_request_capacity >= 1
+                and self.available_token_capacity >= token_cost
+            ):
+                self.available_request_capacity -= 1
+                self.available_token_capacity -= token_cost
+                return
+            await asyncio.sleep(RATE_LIMITER_TICK_SECONDS)
+
+    def pause(self, seconds: float) -> None:
+        self.cooldown_until = max(self.cooldown_until, time.monotonic() + seconds)
+
+
+def _json_loads(text: str) -> Any:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+    # catch the stdlib exception either way.
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _extract_json(text: str) -> Optional[str]:
+    """Return the first balanced ``{...}`` object in ``text``, ignoring prose or fences."""
+    start = text.find("{")
+    if start == -1:
+        return None
+    depth = 0
+    in_string = False
+    escaped = False
+    for position in range(start, len(text)):
+        char = text[position]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start : position + 1]
+    return None
+
+
+def _json_line(record: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+class ClassificationCache:
+    """Append-only JSONL cache of primary classifications.
+
+    Entries are keyed by a hash of the model, instructions and company name, so
+    editing the prompt or switching models naturally invalidates old results.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.entries: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def key(company_name: str) -> str:
+        raw = f"{PRIMARY_MODEL}|{_PRIMARY_INSTRUCTIONS}|{company_name}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def load(self) -> None:
+        if not self.path.exists():
+            return
+        with self.path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = _json_loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(record, dict) and isinstance(record.get("hash"), str):
+                    self.entries[record["hash"]] = record
+
+    def get(self, company_name: str) -> Optional[ClassificationResult]:
+        record = self.entries.get(self.key(company_name))
+        if record is None:
+            return None
+        return ClassificationResult(
+            division=record.get("division"),
+            confidence=record.get("confidence"),
+            context=record.get("context"),
         )
-        raw_name = row.get("Name")
-        entry["name"] = str(raw_name).strip() if isinstance(raw_name, str) else None
-        mapping.setdefault(ident, entry)
-    return mapping
-
-
-def call_primary_gpt(
-    client: OpenAI, company_name: str
-) -> Optional[ClassificationResult]:
-    division_list = "\n".join(f"- {div}" for div in ANZSIC_DIVISIONS)
-    instructions = (
-        "Classify the following Australian company into its most likely ANZSIC division. "
-        "Choose exactly one division from the provided list and respond with JSON keys: "
-        "division (exact match), confidence (0-1), and context (short supporting sentence).\n"
-        f"Divisions:\n{division_list}"
+
+    def put(self, company_name: str, result: ClassificationResult) -> None:
+        record = {"hash": self.key(company_name), **result.model_dump()}
+        self.entries[record["hash"]] = record
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("ab") as handle:
+            handle.write(_json_line(record))
+            handle.flush()
+
+
+def estimate_primary_tokens(company_names: Sequence[str]) -> int:
+    prompt_chars = len(_PRIMARY_INSTRUCTIONS) + sum(
+        len(name) + 8 for name in company_names
+    )
+    return prompt_chars // 4 + PRIMARY_OUTPUT_TOKENS_PER_COMPANY * len(company_names)
+
+
+def _classification_from_payload(item: Dict[str, Any]) -> ClassificationResult:
+    # The strict schema already guarantees the shape; only the value ranges need
+    # checking, so build the model without re-running pydantic validation.
+    division = item.get("division")
+    confidence = item.get("confidence")
+    context = item.get("context")
+    return ClassificationResult.model_construct(
+        division=division if isinstance(division, str) else None,
+        confidence=(
+            float(confidence)
+            if isinstance(confidence, (int, float)) and 0.0 <= confidence <= 1.0
+            else None
+        ),
+        context=context if isinstance(context, str) else None,
     )
+
+
+def _format_batch_input(company_names: Sequence[str]) -> str:
+    lines = [f"{position}. {name}" for position, name in enumerate(company_names, 1)]
+    return "Companies to classify:\n" + "\n".join(lines)
+
+
+async def call_primary_gpt(
+    client: AsyncOpenAI, company_names: Sequence[str]
+) -> List[Optional[ClassificationResult]]:
+    """Classify a batch of companies, returning results aligned with the input."""
+    from openai import APIConnectionError, InternalServerError, RateLimitError
+
+    aligned: List[Optional[ClassificationResult]] = [None] * len(company_names)
     try:
-        resp = client.responses.parse(
-            instructions=instructions,
-            input=f"Company name: {company_name}",
-            text_format=ClassificationResult,
-            model="gpt-4o-mini",
+        resp = await client.responses.create(
+            instructions=_PRIMARY_INSTRUCTIONS,
+            input=_format_batch_input(company_names),
+            text={"format": _BATCH_RESULT_FORMAT},
+            model=PRIMARY_MODEL,
             temperature=0,
         )
-        return resp.output_parsed
+    except (RateLimitError, APIConnectionError, InternalServerError):
+        # Left to call_primary_gpt_throttled, which retries them.
+        raise
     except Exception as exc:  # pragma: no cover - network error
         print(f"WARN: primary gpt-4o-mini call failed ({exc}); skipping.", flush=True)
-        return None
+        return aligned
+    try:
+        payload = _json_loads(resp.output_text or "")
+    except json.JSONDecodeError:
+        print(
+            "WARN: primary gpt-4o-mini returned malformed JSON; skipping.", flush=True
+        )
+        return aligned
+    items = payload.get("results") if isinstance(payload, dict) else None
+    for item in items if isinstance(items, list) else []:
+        if not isinstance(item, dict):
+            continue
+        position = item.get("index")
+        if not isinstance(position, int) or not 0 < position <= len(aligned):
+            continue
+        if aligned[position - 1] is None:
+            aligned[position - 1] = _classification_from_payload(item)
+    return aligned
 
 
 def call_local_llm(llm: "Llama", company_name: str) -> Optional[Dict[str, object]]:
-    division_list = "\n".join(f"- {div}" for div in ANZSIC_DIVISIONS)
-    prompt = (
-        "You are an assistant that maps Australian companies to their ANZSIC division.\n"
-        "Choose the single most likely division from the following list:\n"
-        f"{division_list}\n\n"
-        "Respond with JSON containing keys: division (one of the divisions exactly), "
-        "confidence (0.0-1.0), and context (short sentence justifying the choice).\n"
-        f"Company name: {company_name}\n"
-        "JSON:"
-    )
+    prompt = f"{_LOCAL_PROMPT_PREFIX}{company_name}\nJSON:"
     try:
         response = llm.create_completion(
             prompt=prompt, temperature=0, max_tokens=256, stop=["\n\n"]
@@ -221,10 +615,9 @@ def call_local_llm(llm: "Llama", company_name: str) -> Optional[Dict[str, object
             flush=True,
         )
         return None
-    text = response["choices"][0]["text"]
-    cleaned = _clean_json_response(text)
+    extracted = _extract_json(response["choices"][0]["text"])
     try:
-        payload = json.loads(cleaned)
+        payload = _json_loads(extracted or "")
     except json.JSONDecodeError:
         print(
             "WARN: unable to parse local LLM response as JSON; skipping local classification.",
@@ -234,16 +627,29 @@ def call_local_llm(llm: "Llama", company_name: str) -> Optional[Dict[str, object
     return payload if isinstance(payload, dict) else None
 
 
+_DIVISION_KEY_RE = re.compile(r"[^a-z]+")
+
+
+def _division_key(value: str) -> str:
+    # "Professional Scientific & Technical Services" -> "professional scientific and technical services"
+    return " ".join(_DIVISION_KEY_RE.split(value.lower().replace("&", " and "))).strip()
+
+
+_DIVISION_BY_LOWER = {division.lower(): division for division in ANZSIC_DIVISIONS}
+_DIVISION_BY_KEY = {_division_key(division): division for division in ANZSIC_DIVISIONS}
+
+
 def normalise_division(value: Optional[str]) -> Optional[str]:
     if value is None:
         return None
     value = value.strip()
     if not value:
         return None
-    for division in ANZSIC_DIVISIONS:
-        if value.lower() == division.lower():
-            return division
-    return value
+    lowered = value.lower()
+    division = _DIVISION_BY_LOWER.get(lowered)
+    if division is None:
+        division = _DIVISION_BY_KEY.get(_division_key(lowered))
+    return division or value
 
 
 RBICS_KEYWORD_MAP: Dict[str, str] = {
@@ -312,10 +718,67 @@ def derive_anzsic_from_rbics(info: Dict[str, object]) -> Optional[str]:
                 candidates.append(text)
 
     for candidate in candidates:
-        lowered = candidate.lower()
-        for keyword, division in RBICS_KEYWORD_MAP.items():
-            if keyword in lowered:
-                return division
+        division = _rbics_keyword_division(candidate)
+        if division:
+            return division
+    return None
+
+
+@lru_cache(maxsize=None)
+def _rbics_keyword_division(text: str) -> Optional[str]:
+    # Only a few hundred distinct RBICS labels exist, so memoise the keyword scan.
+    lowered = text.lower()
+    for keyword, division in RBICS_KEYWORD_MAP.items():
+        if keyword in lowered:
+            return division
+    return None
+
+
+# Whole-word name patterns that pin a company's division without asking a model.
+# Checked in order; only words that hold across the listed companies belong
+# here, since matches skip classification. "Energy", "investments", "capital"
+# and "logistics" all span several divisions and are left to the model.
+_NAME_RULES: List[Tuple[re.Pattern[str], str]] = [
+    (
+        re.compile(
+            r"\b(mining|minerals?|resources|gold|copper|lithium|iron ore|nickel"
+            r"|uranium|exploration|rare earths?)\b",
+            re.IGNORECASE,
+        ),
+        "Mining",
+    ),
+    (
+        re.compile(
+            r"\b(bank|banking|insurance|insurer|asset management|superannuation"
+            r"|funds? management)\b",
+            re.IGNORECASE,
+        ),
+        "Financial and Insurance Services",
+    ),
+    (
+        re.compile(r"\b(reit|property trust|properties)\b", re.IGNORECASE),
+        "Rental, Hiring and Real Estate Services",
+    ),
+    (
+        re.compile(r"\b(telecom|telecommunications)\b", re.IGNORECASE),
+        "Information Media and Telecommunications",
+    ),
+    (
+        re.compile(r"\b(airlines?|airways)\b", re.IGNORECASE),
+        "Transport, Postal and Warehousing",
+    ),
+]
+
+
+def classify_by_name_rules(company_name: str) -> Optional[ClassificationResult]:
+    for pattern, division in _NAME_RULES:
+        match = pattern.search(company_name)
+        if match:
+            return ClassificationResult(
+                division=division,
+                confidence=NAME_RULE_CONFIDENCE,
+                context=f"Company name contains '{match.group(0)}'.",
+            )
     return None
 
 
@@ -339,7 +802,10 @@ def count_net_zero_in_pdf(
         return None
 
     try:
-        pages = extract_pdf_text(pdf_path)
+        from backend.domain.utils.pdf import load_or_extract_pdf_text
+
+        # Page text is cached on disk, so reruns skip PDF parsing entirely.
+        pages = load_or_extract_pdf_text(pdf_path)
         if not pages:
             return None
 
@@ -442,31 +908,17 @@ def update_profitability(
     ticker: Optional[str],
     data: Dict[str, Dict[str, object]],
 ) -> bool:
-    numeric_fields = [
-        "profitability_year",
-        "profitability_revenue_mm_aud",
-        "profitability_ebitda_mm_aud",
-        "profitability_net_income_mm_aud",
-        "profitability_total_assets_mm_aud",
-        "size_employee_count",
-    ]
-    text_fields = list(TEXT_COLUMNS.values())
     key = (ticker or "").strip().upper()
     info = data.get(key)
+    # A missing row clears every field, so both cases share one diff pass.
+    values = info or {}
     changed = False
+    for field_name in _PROFITABILITY_ANNOTATION_FIELDS:
+        new_value = values.get(field_name)
+        if getattr(annotations, field_name) != new_value:
+            setattr(annotations, field_name, new_value)
+            changed = True
     if info:
-        for field in numeric_fields:
-            new_value = info.get(field)
-            if field == "size_employee_count" and isinstance(new_value, float):
-                new_value = int(new_value)
-            if getattr(annotations, field) != new_value:
-                setattr(annotations, field, new_value)
-                changed = True
-        for field in text_fields:
-            new_text = info.get(field)
-            if getattr(annotations, field, None) != new_text:
-                setattr(annotations, field, new_text)
-                changed = True
         mapped_division = derive_anzsic_from_rbics(info)
         if mapped_division:
             normalised = normalise_division(mapped_division)
@@ -481,11 +933,6 @@ def update_profitability(
                     "rbics_industry_group"
                 )
                 changed = True
-    else:
-        for field in numeric_fields + text_fields:
-            if getattr(annotations, field) is not None:
-                setattr(annotations, field, None)
-                changed = True
     new_group = determine_reporting_group(info)
     if annotations.reporting_group != new_group:
         annotations.reporting_group = new_group
@@ -493,74 +940,222 @@ def update_profitability(
     return changed
 
 
-def annotate_company(
-    company: Company,
-    *,
-    ensure_client: Callable[[], OpenAI],
-    llm: Optional["Llama"],
-    force: bool,
-    log: Callable[[str], None],
-) -> bool:
-    changed = False
-    name = company.identity.name or company.identity.ticker or "Unknown company"
-    annotations: Annotations = company.annotations
+def company_display_name(company: Company) -> str:
+    return company.identity.name or company.identity.ticker or "Unknown company"
+
 
-    ticker = company.identity.ticker or ""
+def needs_primary_classification(annotations: Annotations, force: bool) -> bool:
     derived_from_rbics = annotations.anzsic_source == "rbics"
-    needs_primary = (annotations.anzsic_division is None) or (
-        force and not derived_from_rbics
+    return (annotations.anzsic_division is None) or (force and not derived_from_rbics)
+
+
+def apply_primary_result(
+    annotations: Annotations,
+    primary: ClassificationResult,
+    source: str = PRIMARY_MODEL,
+) -> None:
+    confidence = primary.confidence
+    context = primary.context
+    annotations.anzsic_division = normalise_division(primary.division)
+    annotations.anzsic_confidence = (
+        float(confidence) if confidence is not None else None
     )
-    if needs_primary:
-        log(f"ANNOTATE {name}")
-        primary = call_primary_gpt(ensure_client(), name)
-        if primary:
-            division = normalise_division(primary.division)
-            confidence = primary.confidence
-            context = primary.context
-            annotations.anzsic_division = division
-            annotations.anzsic_confidence = (
-                float(confidence) if confidence is not None else None
-            )
-            annotations.anzsic_context = (
-                context.strip() if isinstance(context, str) else None
-            )
-            annotations.anzsic_source = "gpt-4o-mini"
-            changed = True
-        else:
-            log(f"FAIL annotate {name}: gpt-4o-mini returned no result")
-            return changed
+    annotations.anzsic_context = context.strip() if isinstance(context, str) else None
+    annotations.anzsic_source = source
+    annotations.anzsic_local_division = None
+    annotations.anzsic_local_confidence = None
+    annotations.anzsic_local_context = None
+    annotations.anzsic_agreement = None
 
-        annotations.anzsic_local_division = None
-        annotations.anzsic_local_confidence = None
-        annotations.anzsic_local_context = None
+
+def apply_local_result(
+    annotations: Annotations,
+    local: Dict[str, object],
+    name: str,
+    log: Callable[[str], None],
+) -> None:
+    division = normalise_division(local.get("division"))  # type: ignore[arg-type]
+    confidence = local.get("confidence")
+    context = local.get("context")
+    annotations.anzsic_local_division = division
+    annotations.anzsic_local_confidence = (
+        float(confidence) if isinstance(confidence, (int, float)) else None
+    )
+    annotations.anzsic_local_context = (
+        context.strip() if isinstance(context, str) else None
+    )
+    if annotations.anzsic_division and division:
+        annotations.anzsic_agreement = (
+            annotations.anzsic_division.lower() == division.lower()
+        )
+    else:
         annotations.anzsic_agreement = None
+    log(
+        f"LOCAL CHECK {name}: gpt='{annotations.anzsic_division}' vs local='{division}'"
+    )
+
 
-    if llm is not None:
-        local = call_local_llm(llm, name)
-        if local:
-            division = normalise_division(local.get("division"))
-            confidence = local.get("confidence")
-            context = local.get("context")
-            annotations.anzsic_local_division = division
-            annotations.anzsic_local_confidence = (
-                float(confidence) if isinstance(confidence, (int, float)) else None
+async def call_primary_gpt_throttled(
+    client: AsyncOpenAI, limiter: RateLimiter, company_names: Sequence[str]
+) -> List[Optional[ClassificationResult]]:
+    from openai import APIConnectionError, InternalServerError, RateLimitError
+
+    token_cost = estimate_primary_tokens(company_names)
+    label = ", ".join(company_names[:3]) + (" ..." if len(company_names) > 3 else "")
+    for attempt in range(RATE_LIMIT_MAX_ATTEMPTS):
+        await limiter.acquire(token_cost)
+        try:
+            return await call_primary_gpt(client, company_names)
+        except RateLimitError:
+            delay = min(RATE_LIMIT_COOLDOWN_SECONDS * (2**attempt), 120.0)
+            print(
+                f"WARN: rate limited classifying {label}; retrying in {delay:.0f}s.",
+                flush=True,
             )
-            annotations.anzsic_local_context = (
-                context.strip() if isinstance(context, str) else None
+            limiter.pause(delay)
+        except (APIConnectionError, InternalServerError) as exc:
+            # Connection drops, timeouts and 5xx are transient; back off this
+            # batch only, since the key's budget is not the problem.
+            delay = min(TRANSIENT_RETRY_SECONDS * (2**attempt), 60.0)
+            print(
+                f"WARN: classifying {label} failed ({exc}); retrying in {delay:.0f}s.",
+                flush=True,
             )
-            if annotations.anzsic_division and division:
-                annotations.anzsic_agreement = (
-                    annotations.anzsic_division.lower() == division.lower()
-                )
-            else:
-                annotations.anzsic_agreement = None
-            changed = True
-            log(
-                f"LOCAL CHECK {name}: gpt='{annotations.anzsic_division}' "
-                f"vs local='{division}'"
+            await asyncio.sleep(delay)
+    print(
+        f"WARN: giving up on {label} after {RATE_LIMIT_MAX_ATTEMPTS} attempts.",
+        flush=True,
+    )
+    return [None] * len(company_names)
+
+
+async def classify_primary(
+    names: List[str],
+    *,
+    cache: ClassificationCache,
+    use_cache: bool,
+    batch_size: int,
+    concurrency: int,
+    max_requests_per_minute: float,
+    max_tokens_per_minute: float,
+    api_keys: Sequence[str] = (),
+    on_result: Optional[Callable[[int, Optional[ClassificationResult]], None]] = None,
+) -> List[Optional[ClassificationResult]]:
+    results: List[Optional[ClassificationResult]] = [None] * len(names)
+
+    def record(index: int, result: Optional[ClassificationResult]) -> None:
+        results[index] = result
+        if on_result is not None:
+            on_result(index, result)
+
+    uncached: List[int] = []
+    for index, name in enumerate(names):
+        cached = cache.get(name) if use_cache else None
+        if cached is not None:
+            record(index, cached)
+        else:
+            uncached.append(index)
+    if not uncached:
+        return results
+
+    queue: asyncio.Queue[Tuple[int, List[int]]] = asyncio.Queue()
+    indices = iter(uncached)
+    for batch_number in itertools.count():
+        batch = list(itertools.islice(indices, max(1, batch_size)))
+        if not batch:
+            break
+        queue.put_nowait((batch_number, batch))
+
+    from openai import AsyncOpenAI
+
+    # One client per API key, each with its own budget; batches are dealt out
+    # round-robin. Retries (429s and transient failures alike) are driven by
+    # call_primary_gpt_throttled, not the SDK's backoff.
+    lanes = [
+        (
+            AsyncOpenAI(api_key=key, max_retries=0),
+            RateLimiter(max_requests_per_minute, max_tokens_per_minute),
+        )
+        for key in api_keys
+    ] or [
+        (
+            AsyncOpenAI(max_retries=0),
+            RateLimiter(max_requests_per_minute, max_tokens_per_minute),
+        )
+    ]
+
+    async def worker() -> None:
+        while True:
+            try:
+                batch_number, batch_indices = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            client, limiter = lanes[batch_number % len(lanes)]
+            batch_names = [names[index] for index in batch_indices]
+            batch_results = await call_primary_gpt_throttled(
+                client, limiter, batch_names
             )
+            for index, name, result in zip(batch_indices, batch_names, batch_results):
+                if result is not None:
+                    cache.put(name, result)
+                record(index, result)
 
-    return changed
+    try:
+        await asyncio.gather(
+            *[worker() for _ in range(max(1, min(concurrency, queue.qsize())))]
+        )
+    finally:
+        for client, _ in lanes:
+            await client.close()
+    return results
+
+
+async def classify_all(
+    names: List[str],
+    pending_positions: List[int],
+    llm: Optional["Llama"],
+    *,
+    wants_local_check: Callable[[int], bool],
+    on_primary: Callable[[int, Optional[ClassificationResult]], None],
+    **primary_options: Any,
+) -> Dict[int, Optional[Dict[str, object]]]:
+    """Run the gpt-4o-mini batches and local llama.cpp checks side by side.
+
+    ``names`` holds every company's display name and ``pending_positions`` the
+    companies that need a primary classification. Local checks for the other
+    companies start immediately; for pending ones they start once the primary
+    result has been applied, and only if ``wants_local_check`` still agrees.
+    """
+    loop = asyncio.get_running_loop()
+    local_futures: Dict[int, "asyncio.Future[Optional[Dict[str, object]]]"] = {}
+    pending_set = set(pending_positions)
+    # llama.cpp contexts are not re-entrant, so local inference is serialised on
+    # a single worker thread while the event loop keeps the API requests moving.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+
+        def submit_local(position: int) -> None:
+            if llm is not None and wants_local_check(position):
+                local_futures[position] = loop.run_in_executor(
+                    executor, call_local_llm, llm, names[position]
+                )
+
+        for position in range(len(names)):
+            if position not in pending_set:
+                submit_local(position)
+
+        def handle_primary(index: int, result: Optional[ClassificationResult]) -> None:
+            position = pending_positions[index]
+            on_primary(position, result)
+            if result is not None:
+                submit_local(position)
+
+        await classify_primary(
+            [names[position] for position in pending_positions],
+            on_result=handle_primary,
+            **primary_options,
+        )
+        local_results = await asyncio.gather(*local_futures.values())
+    return dict(zip(local_futures.keys(), local_results))
 
 
 def main(argv: Optional[List[str]] = None) -> int:
@@ -583,115 +1178,100 @@ def main(argv: Optional[List[str]] = None) -> int:
                 flush=True,
             )
         else:
-            llm = ensure_local_llm(local_model_path, args.local_llm_gpu_layers)
+            llm = ensure_local_llm(
+                local_model_path,
+                args.local_llm_gpu_layers,
+                args.local_llm_kv_cache_type,
+            )
+
+    changed = False
+    base_dir = companies_path.parent
+
+    def log(message: str) -> None:
+        print(message, flush=True)
+
+    pending_positions: List[int] = []
+    for position, company in enumerate(companies):
+        ticker = company.identity.ticker or ""
+        if update_profitability(company.annotations, ticker, profitability_map):
+            changed = True
+        if update_net_zero_claims(company.annotations, company, base_dir):
+            changed = True
+        if needs_primary_classification(company.annotations, args.force):
+            pending_positions.append(position)
 
     jobs = max(1, args.jobs)
-    if jobs > 1 and llm is not None:
+    api_keys = [key.strip() for key in args.openai_keys.split(",") if key.strip()]
+    names = [company_display_name(company) for company in companies]
+    if not args.no_name_rules:
+        unmatched_positions: List[int] = []
+        for position in pending_positions:
+            rule_result = classify_by_name_rules(names[position])
+            if rule_result is None:
+                unmatched_positions.append(position)
+                continue
+            log(f"RULE {names[position]}: {rule_result.division}")
+            apply_primary_result(
+                companies[position].annotations, rule_result, NAME_RULE_SOURCE
+            )
+            changed = True
+        pending_positions = unmatched_positions
+    if pending_positions:
         print(
-            "WARN: --jobs > 1 currently requires --local-llm to be disabled; running sequentially.",
+            f"Classifying {len(pending_positions)} companies with up to {jobs} concurrent requests.",
             flush=True,
         )
-        jobs = 1
 
-    changed = False
+    applied = 0
 
-    base_dir = companies_path.parent
+    def handle_primary(position: int, primary: Optional[ClassificationResult]) -> None:
+        nonlocal changed, applied
+        name = names[position]
+        if primary is None:
+            log(f"FAIL annotate {name}: gpt-4o-mini returned no result")
+            return
+        log(f"ANNOTATE {name}")
+        apply_primary_result(companies[position].annotations, primary)
+        changed = True
+        applied += 1
+        if applied % CHECKPOINT_EVERY == 0:
+            dump_companies(companies_path, payload, companies)
+            log(f"CHECKPOINT {applied}/{len(pending_positions)}")
+
+    def wants_local_check(position: int) -> bool:
+        confidence = companies[position].annotations.anzsic_confidence
+        return confidence is None or confidence < args.local_llm_threshold
+
+    if pending_positions or llm is not None:
+        cache = ClassificationCache(CLASSIFICATION_CACHE_FILE)
+        cache.load()
+        local_results = asyncio.run(
+            classify_all(
+                names,
+                pending_positions,
+                llm,
+                wants_local_check=wants_local_check,
+                on_primary=handle_primary,
+                cache=cache,
+                use_cache=not args.no_cache,
+                batch_size=args.batch_size,
+                concurrency=jobs,
+                max_requests_per_minute=max(1.0, args.max_rpm),
+                max_tokens_per_minute=max(1.0, args.max_tpm),
+                api_keys=api_keys,
+            )
+        )
+        for position, local in sorted(local_results.items()):
+            if not local:
+                continue
+            apply_local_result(
+                companies[position].annotations, local, names[position], log
+            )
+            changed = True
 
-    def process_company(
-        company_obj: Company,
-        *,
-        ensure_client_fn: Callable[[], OpenAI],
-        llm_instance: Optional["Llama"],
-        force_flag: bool,
-        log_fn: Callable[[str], None],
-        base_directory: Path,
-    ) -> bool:
-        local_changed = False
-        ticker = company_obj.identity.ticker or ""
-        if update_profitability(company_obj.annotations, ticker, profitability_map):
-            local_changed = True
-        if update_net_zero_claims(company_obj.annotations, company_obj, base_directory):
-            local_changed = True
-        if annotate_company(
-            company_obj,
-            ensure_client=ensure_client_fn,
-            llm=llm_instance,
-            force=force_flag,
-            log=log_fn,
-        ):
-            local_changed = True
-        return local_changed
-
-    if jobs == 1:
-        cached_client: Optional[OpenAI] = None
-
-        def ensure_client_single() -> OpenAI:
-            nonlocal cached_client
-            if cached_client is None:
-                cached_client = OpenAI()
-            return cached_client
-
-        for company in companies:
-            name = company.identity.ticker or company.identity.name or "Unknown company"
-
-            def log_single(message: str) -> None:
-                print(message, flush=True)
-
-            if process_company(
-                company,
-                ensure_client_fn=ensure_client_single,
-                llm_instance=llm,
-                force_flag=args.force,
-                log_fn=log_single,
-                base_directory=base_dir,
-            ):
-                changed = True
-                dump_companies(companies_path, payload, companies)
+    if changed:
+        dump_companies(companies_path, payload, companies, fsync=True)
     else:
-        print(f"Annotating with {jobs} parallel workers.", flush=True)
-
-        def worker(
-            index: int,
-            company_payload: Dict[str, Any],
-        ) -> Tuple[int, Dict[str, Any], List[str], bool]:
-            company_obj = Company.model_validate(company_payload)
-            logs: List[str] = []
-            cached_worker_client: Optional[OpenAI] = None
-
-            def ensure_client_worker() -> OpenAI:
-                nonlocal cached_worker_client
-                if cached_worker_client is None:
-                    cached_worker_client = OpenAI()
-                return cached_worker_client
-
-            def log_worker(message: str) -> None:
-                logs.append(message)
-
-            local_changed = process_company(
-                company_obj,
-                ensure_client_fn=ensure_client_worker,
-                llm_instance=None,
-                force_flag=args.force,
-                log_fn=log_worker,
-                base_directory=base_dir,
-            )
-            return index, company_obj.model_dump(mode="json"), logs, local_changed
-
-        with ThreadPoolExecutor(max_workers=jobs) as executor:
-            futures = [
-                executor.submit(worker, idx, company.model_dump(mode="json"))
-                for idx, company in enumerate(companies)
-            ]
-            for future in as_completed(futures):
-                idx, payload_data, logs, local_changed = future.result()
-                for line in logs:
-                    print(line, flush=True)
-                companies[idx] = Company.model_validate(payload_data)
-                if local_changed:
-                    changed = True
-                    dump_companies(companies_path, payload, companies)
-
-    if not changed:
         print("No changes.", flush=True)
     return 0
 
@@ -1,23 +1,38 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import math
+from collections import OrderedDict
 from datetime import datetime
-import base64
+from functools import wraps
 import re
 import sys
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, cast
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, cast
 from urllib.parse import urlparse
 
 import dash
-from dash import Dash, Input, Output, State, dcc, html, no_update
+from dash import Dash, Input, Output, Patch, State, dcc, html, no_update
 from dash.dash_table import DataTable
 from dash.exceptions import PreventUpdate
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
+
+try:
+    import polars as pl
+except ImportError:  # pragma: no cover - optional dependency
+    pl = None
+
 from backend.domain.models import (
     AnalysisRecord,
     Company,
@@ -27,8 +42,13 @@ from backend.domain.models import (
     ScopeValue,
     SearchRecord,
 )
-from backend.domain.utils.companies import dump_companies, load_companies
+from backend.domain.utils.companies import (
+    company_columns,
+    dump_companies,
+    load_companies,
+)
 from backend.domain.utils.pdf_preview import previews_as_data_urls
+from backend.domain.utils.files import uploaded_pdf_payload, write_uploaded_pdf
 from backend.domain.utils.documents import (
     classify_document_type,
     infer_year_from_text,
@@ -38,6 +58,201 @@ from backend.domain.utils.query import derive_filename
 from backend.domain.s0_stats import reset_company_stages, STAGE_DEPENDENCIES
 
 
+FIGURE_CACHE_SIZE = 64
+
+
+def _and_range_mask_numpy(
+    values: np.ndarray, low: float, high: float, mask: np.ndarray
+) -> None:
+    mask &= np.isnan(values) | ((values >= low) & (values <= high))
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _and_range_mask(values, low, high, mask):  # pragma: no cover - numba
+        # Clears mask[i] for values outside [low, high]; missing values pass.
+        for i in range(values.size):
+            value = values[i]
+            if not (np.isnan(value) or (low <= value <= high)):
+                mask[i] = False
+
+else:
+    _and_range_mask = _and_range_mask_numpy
+
+
+def _isin_mask(series: pd.Series, selected: Iterable[str]) -> np.ndarray:
+    """Boolean membership mask computed on category codes rather than per-row strings."""
+    categorical = pd.Categorical(series)
+    allowed = np.isin(np.asarray(categorical.categories, dtype=object), list(selected))
+    # Missing values have code -1, which indexes the trailing False.
+    return np.append(allowed, False)[categorical.codes]
+
+
+COMPANY_TABLE_PAGE_SIZE = 25
+# Operators emitted by DataTable's filter_query, longest-match first; each entry
+# maps every spelling Dash may use to the canonical name.
+_TABLE_FILTER_OPERATORS: Tuple[Tuple[str, ...], ...] = (
+    ("ge ", ">="),
+    ("le ", "<="),
+    ("lt ", "<"),
+    ("gt ", ">"),
+    ("ne ", "!="),
+    ("eq ", "="),
+    ("contains ",),
+    ("datestartswith ",),
+)
+
+
+def _split_filter_part(filter_part: str) -> Tuple[Optional[str], Optional[str], Any]:
+    for spellings in _TABLE_FILTER_OPERATORS:
+        for spelling in spellings:
+            if spelling not in filter_part:
+                continue
+            name_part, value_part = filter_part.split(spelling, 1)
+            name = name_part[name_part.find("{") + 1 : name_part.rfind("}")]
+            value_part = value_part.strip()
+            if not value_part:
+                return name, spellings[0].strip(), ""
+            quote = value_part[0]
+            if quote == value_part[-1] and quote in ("'", '"', "`"):
+                value: Any = value_part[1:-1].replace("\\" + quote, quote)
+            else:
+                try:
+                    value = float(value_part)
+                except ValueError:
+                    value = value_part
+            return name, spellings[0].strip(), value
+    return None, None, None
+
+
+def query_company_table(
+    frame: pd.DataFrame,
+    filter_query: Optional[str],
+    sort_by: Optional[List[Dict[str, str]]],
+    numeric_columns: Set[str],
+) -> pd.DataFrame:
+    """Apply DataTable's custom filter_query and sort_by to the table rows."""
+    for filter_part in (filter_query or "").split(" && "):
+        column, operator, value = _split_filter_part(filter_part)
+        if column is None or column not in frame:
+            continue
+        series = frame[column]
+        if operator in ("eq", "ne", "lt", "le", "gt", "ge"):
+            if isinstance(value, float) or column in numeric_columns:
+                series = pd.to_numeric(series, errors="coerce")
+                value = pd.to_numeric(value, errors="coerce")
+            else:
+                series = series.astype(str)
+                value = str(value)
+            frame = frame.loc[getattr(series, operator)(value)]
+        elif operator == "contains":
+            frame = frame.loc[
+                series.astype(str).str.contains(str(value), case=False, regex=False)
+            ]
+        elif operator == "datestartswith":
+            frame = frame.loc[series.astype(str).str.startswith(str(value))]
+    entries = [entry for entry in sort_by or [] if entry.get("column_id") in frame]
+    if entries:
+        frame = frame.sort_values(
+            [entry["column_id"] for entry in entries],
+            ascending=[entry.get("direction") == "asc" for entry in entries],
+            key=lambda column: (
+                pd.to_numeric(column, errors="coerce")
+                if column.name in numeric_columns
+                else column.astype(str)
+            ),
+        )
+    return frame
+
+
+def _group_industry_matrix(
+    group_data: pd.DataFrame,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Distinct tickers and scope 1 totals per reporting group and industry.
+
+    Uses Polars when installed: its hash aggregation runs multithreaded outside
+    the GIL, so concurrent dashboard sessions don't serialise on it.
+    """
+    keys = ["reporting_group", "anzsic_division"]
+    if pl is not None:
+        frame = pl.DataFrame(
+            {
+                "reporting_group": group_data["reporting_group"].tolist(),
+                "anzsic_division": group_data["anzsic_division"].tolist(),
+                "ticker": group_data["ticker"].tolist(),
+                "scope_1_numeric": group_data["scope_1_numeric"].to_numpy(),
+            },
+            nan_to_null=True,
+        )
+        aggregated = frame.group_by(keys).agg(
+            pl.col("ticker").drop_nulls().n_unique().alias("companies"),
+            pl.col("scope_1_numeric").sum().alias("emissions"),
+        )
+        grouped = (
+            pd.DataFrame(aggregated.to_dict(as_series=False))
+            .set_index(keys)
+            .sort_index()
+        )
+    else:
+        grouped = group_data.groupby(keys, sort=True, observed=True).agg(
+            companies=("ticker", "nunique"),
+            emissions=("scope_1_numeric", "sum"),
+        )
+    return (
+        grouped["companies"].unstack(fill_value=0),
+        grouped["emissions"].unstack(fill_value=0.0),
+    )
+
+
+def _holding(
+    lock: threading.RLock,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorator running a callback while holding ``lock``."""
+
+    def decorate(func: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with lock:
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def _heatmap_axes(figure: Any) -> Optional[List[List[Any]]]:
+    """Column and row labels of a cached heatmap figure dict, if it has one."""
+    if not isinstance(figure, dict):
+        return None
+    data = figure.get("data") or []
+    if not data or data[0].get("type") != "heatmap":
+        return None
+    return [list(data[0]["x"]), list(data[0]["y"])]
+
+
+def _frame_digest(frame: pd.DataFrame) -> str:
+    """Content hash of a frame (values and index) for memoising derived figures."""
+    hashed = pd.util.hash_pandas_object(frame, index=True)
+    digest = hashlib.sha1(hashed.to_numpy().tobytes())
+    digest.update(",".join(map(str, frame.columns)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _frame_records(frame: pd.DataFrame, missing: Any = None) -> List[Dict[str, Any]]:
+    """Row dicts built column-wise, with missing cells replaced by ``missing``.
+
+    Converting each column once and zipping the lists avoids both the
+    per-row work of ``to_dict("records")`` and a full ``fillna`` copy.
+    """
+    columns = [str(name) for name in frame.columns]
+    values = [
+        frame[name].astype(object).where(frame[name].notna(), missing).tolist()
+        for name in frame.columns
+    ]
+    return [dict(zip(columns, row)) for row in zip(*values)]
+
+
 def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         prog="s7_dashboard",
@@ -58,78 +273,169 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
-def companies_to_dataframe(companies: List[Company]) -> pd.DataFrame:
-    rows: List[Dict[str, Any]] = []
-    for company in companies:
-        identity = company.identity
-        emissions = company.emissions
-        annotations = company.annotations
+# Flat dashboard columns, filled one list per column (see company_columns).
+_FLOAT_COLUMNS = (
+    "scope_1",
+    "scope_2",
+    "scope_1_conf",
+    "scope_2_conf",
+    "revenue_mm",
+    "net_income_mm",
+    "ebitda_mm",
+    "assets_mm",
+)
+_DATAFRAME_COLUMNS = (
+    "ticker",
+    "name",
+    "scope_1",
+    "scope_2",
+    "scope_1_conf",
+    "scope_2_conf",
+    "anzsic_division",
+    "anzsic_context",
+    "anzsic_local_division",
+    "anzsic_source",
+    "revenue_mm",
+    "net_income_mm",
+    "ebitda_mm",
+    "assets_mm",
+    "employees",
+    "reporting_group",
+    "company_country",
+    "company_region",
+    "company_state",
+    "rbics_sector",
+    "rbics_sub_sector",
+    "rbics_industry_group",
+    "rbics_industry",
+    "analysis_method",
+    "year",
+)
+# Low-cardinality labels the callbacks filter and group on; stored as categoricals
+# so membership tests and groupbys work on integer codes.
+_CATEGORY_COLUMNS = (
+    "anzsic_division",
+    "reporting_group",
+    "company_state",
+    "rbics_sector",
+)
 
-        scope1 = emissions.scope_1.value if emissions.scope_1 else None
-        scope2 = emissions.scope_2.value if emissions.scope_2 else None
-        scope1_conf = emissions.scope_1.confidence if emissions.scope_1 else None
-        scope2_conf = emissions.scope_2.confidence if emissions.scope_2 else None
-        net_income = annotations.profitability_net_income_mm_aud
-        revenue = annotations.profitability_revenue_mm_aud
-        ebitda = annotations.profitability_ebitda_mm_aud
-        assets = annotations.profitability_total_assets_mm_aud
-        employees = annotations.size_employee_count
-        reporting_group = annotations.reporting_group
-        country = annotations.company_country
-        region = annotations.company_region
-        state = annotations.company_state
-        rbics_sector = annotations.rbics_sector
-        rbics_sub_sector = annotations.rbics_sub_sector
-        rbics_group = annotations.rbics_industry_group
-        rbics_industry = annotations.rbics_industry
-        analysis_method = (
-            company.analysis_record.method if company.analysis_record else None
-        )
 
-        rows.append(
-            {
-                "ticker": identity.ticker,
-                "name": identity.name or identity.ticker,
-                "scope_1": float(scope1) if scope1 is not None else None,
-                "scope_2": float(scope2) if scope2 is not None else None,
-                "scope_1_conf": float(scope1_conf) if scope1_conf is not None else None,
-                "scope_2_conf": float(scope2_conf) if scope2_conf is not None else None,
-                "anzsic_division": annotations.anzsic_division,
-                "anzsic_context": annotations.anzsic_context,
-                "anzsic_local_division": annotations.anzsic_local_division,
-                "anzsic_source": annotations.anzsic_source,
-                "revenue_mm": float(revenue) if revenue is not None else None,
-                "net_income_mm": float(net_income) if net_income is not None else None,
-                "ebitda_mm": float(ebitda) if ebitda is not None else None,
-                "assets_mm": float(assets) if assets is not None else None,
-                "employees": int(employees) if employees is not None else None,
-                "reporting_group": reporting_group,
-                "company_country": country,
-                "company_region": region,
-                "company_state": state,
-                "rbics_sector": rbics_sector,
-                "rbics_sub_sector": rbics_sub_sector,
-                "rbics_industry_group": rbics_group,
-                "rbics_industry": rbics_industry,
-                "analysis_method": analysis_method,
-                "year": annotations.profitability_year,
-            }
-        )
+# Dashboard columns copied straight from Annotations, fetched in one attrgetter call.
+_ANNOTATION_COLUMNS = {
+    "anzsic_division": "anzsic_division",
+    "anzsic_context": "anzsic_context",
+    "anzsic_local_division": "anzsic_local_division",
+    "anzsic_source": "anzsic_source",
+    "revenue_mm": "profitability_revenue_mm_aud",
+    "net_income_mm": "profitability_net_income_mm_aud",
+    "ebitda_mm": "profitability_ebitda_mm_aud",
+    "assets_mm": "profitability_total_assets_mm_aud",
+    "reporting_group": "reporting_group",
+    "company_country": "company_country",
+    "company_region": "company_region",
+    "company_state": "company_state",
+    "rbics_sector": "rbics_sector",
+    "rbics_sub_sector": "rbics_sub_sector",
+    "rbics_industry_group": "rbics_industry_group",
+    "rbics_industry": "rbics_industry",
+    "year": "profitability_year",
+}
+
 
-    if not rows:
+def companies_to_dataframe(companies: List[Company]) -> pd.DataFrame:
+    if not companies:
         return pd.DataFrame()
+    data = company_columns(
+        companies, _DATAFRAME_COLUMNS, _ANNOTATION_COLUMNS, _FLOAT_COLUMNS
+    )
+    for name in _CATEGORY_COLUMNS:
+        data[name] = pd.Categorical(data[name])
+    return pd.DataFrame(data)
+
+
+def records_to_dataframe(records: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Rebuild a companies_to_dataframe frame from its JSON records."""
+    frame = pd.DataFrame.from_records(records)
+    # Columns that were entirely empty come back as object dtype; restore float64
+    # so callers can use the numeric columns without per-call coercion.
+    dtypes = {name: "float64" for name in _FLOAT_COLUMNS if name in frame}
+    dtypes.update({name: "category" for name in _CATEGORY_COLUMNS if name in frame})
+    return frame.astype(dtypes) if dtypes else frame
+
+
+def with_scope_total(frame: pd.DataFrame) -> pd.DataFrame:
+    """Add the scope 1 + 2 total the insights filter and plot against.
+
+    The total is missing only when both scopes are missing. It is derived once
+    per frame so the insights callback never recomputes it.
+    """
+    if frame.empty:
+        return frame
+    scope_1 = frame["scope_1"].to_numpy(dtype=np.float64, na_value=np.nan)
+    scope_2 = frame["scope_2"].to_numpy(dtype=np.float64, na_value=np.nan)
+    total = np.where(
+        np.isnan(scope_1) & np.isnan(scope_2),
+        np.nan,
+        np.nan_to_num(scope_1) + np.nan_to_num(scope_2),
+    )
+    return frame.assign(scope_total=total)
+
 
-    return pd.DataFrame(rows)
+def _descending_order(values: np.ndarray) -> np.ndarray:
+    """Stable descending row order for ``values`` with missing values last."""
+    return np.argsort(np.where(np.isnan(values), np.inf, -values), kind="stable")
 
 
-def serialise_companies(companies: List[Company]) -> List[Dict[str, Any]]:
-    return [company.model_dump(mode="json") for company in companies]
+def insights_orders(frame: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Whole-frame row orders for the ranked insights outputs.
 
+    Filtering keeps rows in frame order, so selecting the masked rows out of a
+    precomputed order yields the same ranking as sorting the filtered subset.
+    """
+    if frame.empty:
+        return {}
+    return {
+        column: _descending_order(frame[column].to_numpy())
+        for column in ("revenue_mm", "net_income_mm")
+    }
 
-def deserialise_companies(data: Optional[List[Dict[str, Any]]]) -> List[Company]:
-    if not data:
-        return []
-    return [Company.model_validate(item) for item in data]
+
+def _fill_category(series: pd.Series, label: str) -> pd.Series:
+    """fillna for a categorical column: adds ``label`` as a category if needed.
+
+    The categories are kept in label order, so groupbys over the filled column
+    sort ``label`` among the other values as they did for plain strings.
+    """
+    categories = series.cat.categories
+    if label not in categories:
+        series = series.cat.set_categories(sorted([*categories, label]))
+    return series.fillna(label)
+
+
+def filter_option_values(companies: List[Company]) -> Dict[str, List[str]]:
+    """Sorted distinct values for each dropdown filter, gathered in one pass."""
+    industries: Set[str] = set()
+    rbics_sectors: Set[str] = set()
+    states: Set[str] = set()
+    methods: Set[str] = set()
+    for company in companies:
+        annotations = company.annotations
+        if annotations.anzsic_division is not None:
+            industries.add(str(annotations.anzsic_division))
+        if annotations.rbics_sector is not None:
+            rbics_sectors.add(str(annotations.rbics_sector))
+        if annotations.company_state is not None:
+            states.add(str(annotations.company_state))
+        method = company.analysis_record.method if company.analysis_record else None
+        if method is not None and str(method).strip():
+            methods.add(str(method))
+    return {
+        "anzsic_division": sorted(industries),
+        "rbics_sector": sorted(rbics_sectors),
+        "company_state": sorted(states),
+        "analysis_method": sorted(methods),
+    }
 
 
 def company_key(company: Company) -> str:
@@ -172,9 +478,13 @@ def _ordered_stage_dependencies(stages: Iterable[str]) -> List[str]:
     return ordered
 
 
+_COMPANY_TOKEN_RE = re.compile(r"[^A-Za-z0-9]+")
+_UPLOAD_FILENAME_RE = re.compile(r"[^A-Za-z0-9_.-]")
+
+
 def _clean_company_token(value: Optional[str]) -> str:
     text = (value or "").strip() or "company"
-    return re.sub(r"[^A-Za-z0-9]+", "_", text)
+    return _COMPANY_TOKEN_RE.sub("_", text)
 
 
 def _normalise_upload_filename(filename: Optional[str]) -> str:
@@ -183,44 +493,29 @@ def _normalise_upload_filename(filename: Optional[str]) -> str:
     name = Path(filename).name or "uploaded.pdf"
     if not name.lower().endswith(".pdf"):
         name = f"{name}.pdf"
-    return re.sub(r"[^A-Za-z0-9_.-]", "_", name)
-
-
-def _decode_uploaded_pdf(contents: str) -> bytes:
-    if not contents:
-        raise ValueError("No upload payload provided.")
-    try:
-        header, encoded = contents.split(",", 1)
-    except ValueError as exc:
-        raise ValueError("Uploaded file payload is malformed.") from exc
-    if "pdf" not in header.lower():
-        raise ValueError("Uploaded file does not appear to be a PDF.")
-    try:
-        data = base64.b64decode(encoded)
-    except ValueError as exc:
-        raise ValueError("Failed to decode uploaded PDF.") from exc
-    if not data.startswith(b"%PDF"):
-        raise ValueError("Uploaded file is not a valid PDF document.")
-    return data
+    return _UPLOAD_FILENAME_RE.sub("_", name)
 
 
 def _store_uploaded_pdf(
     base_dir: Path,
     company: Company,
     filename: Optional[str],
-    data: bytes,
+    contents: str,
 ) -> Path:
+    """Validate a data-URL PDF upload and stream it into the downloads folder."""
+    encoded = uploaded_pdf_payload(contents)
     safe_ticker = _clean_company_token(company.identity.ticker)
     safe_name = _clean_company_token(company.identity.name)
     identifier = safe_ticker or safe_name or "company"
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    # Nanosecond stamps keep rapid re-uploads apart and still sort chronologically.
+    timestamp = f"{time.time_ns():020d}"
     sanitized_filename = _normalise_upload_filename(filename)
 
     download_dir = (base_dir / "downloads").resolve()
     download_dir.mkdir(parents=True, exist_ok=True)
 
     destination = download_dir / f"{identifier}_{timestamp}_{sanitized_filename}"
-    destination.write_bytes(data)
+    write_uploaded_pdf(encoded, destination)
 
     try:
         relative = destination.relative_to(base_dir)
@@ -229,6 +524,26 @@ def _store_uploaded_pdf(
         return destination
 
 
+def pending_arrays(
+    companies: List[Company],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Company keys, accepted flags and analysis methods as parallel arrays."""
+    keys = np.array([company_key(company) for company in companies], dtype=object)
+    accepted = np.fromiter(
+        (company.verification.status == "accepted" for company in companies),
+        dtype=bool,
+        count=len(companies),
+    )
+    methods = np.array(
+        [
+            company.analysis_record.method if company.analysis_record else None
+            for company in companies
+        ],
+        dtype=object,
+    )
+    return keys, accepted, methods
+
+
 def next_pending_key(
     companies: List[Company],
     current_key: Optional[str],
@@ -236,23 +551,42 @@ def next_pending_key(
     skip_current: bool = False,
     allowed_methods: Optional[set[str]] = None,
 ) -> Optional[str]:
-    pending_keys: List[str] = []
-    for company in companies:
-        if company.verification.status == "accepted":
-            continue
-        method = company.analysis_record.method if company.analysis_record else None
-        if allowed_methods and method not in allowed_methods:
-            continue
-        pending_keys.append(company_key(company))
-    if not pending_keys:
+    return next_pending_key_from_arrays(
+        *pending_arrays(companies),
+        current_key,
+        skip_current=skip_current,
+        allowed_methods=allowed_methods,
+    )
+
+
+def next_pending_key_from_arrays(
+    keys: np.ndarray,
+    accepted: np.ndarray,
+    methods: np.ndarray,
+    current_key: Optional[str],
+    *,
+    skip_current: bool = False,
+    allowed_methods: Optional[set[str]] = None,
+) -> Optional[str]:
+    """next_pending_key over precomputed ``pending_arrays`` output.
+
+    The eligibility scan and key lookup are array comparisons, so callers that
+    keep the arrays current avoid walking the company objects on every call.
+    """
+    eligible = ~accepted
+    if allowed_methods:
+        allowed = np.zeros(len(methods), dtype=bool)
+        for method in allowed_methods:
+            allowed |= methods == method
+        eligible &= allowed
+    pending_keys = keys[eligible]
+    if not pending_keys.size:
         return None
-    if current_key not in pending_keys:
+    matches = np.flatnonzero(pending_keys == current_key)
+    if not matches.size:
         return pending_keys[0]
     if skip_current:
-        if len(pending_keys) == 1:
-            return pending_keys[0]
-        current_index = pending_keys.index(current_key)
-        return pending_keys[(current_index + 1) % len(pending_keys)]
+        return pending_keys[(matches[0] + 1) % pending_keys.size]
     return current_key
 
 
@@ -265,38 +599,52 @@ def create_dash_app(
     app.title = "Scope Spider"
 
     initial_df = companies_to_dataframe(companies)
-    if not initial_df.empty and "anzsic_division" in initial_df:
-        industries_series = initial_df["anzsic_division"].dropna()
-        industries = sorted([str(i) for i in industries_series.unique()])
-    else:
-        industries = []
-    if not initial_df.empty and "rbics_sector" in initial_df:
-        rbics_sectors_list = sorted(
-            {str(value) for value in initial_df["rbics_sector"].dropna().unique()}
-        )
-    else:
-        rbics_sectors_list = []
-    if not initial_df.empty and "company_state" in initial_df:
-        state_list = sorted(
-            {str(value) for value in initial_df["company_state"].dropna().unique()}
-        )
-    else:
-        state_list = []
-    if not initial_df.empty and "analysis_method" in initial_df:
-        method_list = sorted(
-            {
-                str(value)
-                for value in initial_df["analysis_method"].dropna().unique()
-                if str(value).strip()
-            }
+    # The insights callbacks read this column-oriented frame directly instead of
+    # shipping the rows through a browser store; verification edits patch the
+    # matching record and rebuild it.
+    df_records: List[Dict[str, Any]] = (
+        initial_df.to_dict("records") if not initial_df.empty else []
+    )
+    insights_frame = with_scope_total(initial_df)
+    # Revenue and net income rankings only change when the frame does, so the
+    # top-revenue bar and the table take their rows from these orders.
+    ranked_rows = insights_orders(insights_frame)
+    # The companies list is the authoritative server-side state; browser stores
+    # only carry a revision number. Flask serves callbacks on several threads,
+    # so the verification callbacks that read or edit it take this lock.
+    companies_lock = threading.RLock()
+    # Company keys never change during a session; the accepted flags and
+    # methods are refreshed for the edited company after each verification
+    # action, so picking the next pending company never walks the objects.
+    company_keys, accepted_flags, analysis_methods = pending_arrays(companies)
+    positions_by_key: Dict[str, int] = {}
+    for position, key in enumerate(company_keys):
+        positions_by_key.setdefault(key, position)
+
+    def pending_key(
+        current_key: Optional[str],
+        *,
+        skip_current: bool = False,
+        allowed_methods: Optional[set[str]] = None,
+    ) -> Optional[str]:
+        return next_pending_key_from_arrays(
+            company_keys,
+            accepted_flags,
+            analysis_methods,
+            current_key,
+            skip_current=skip_current,
+            allowed_methods=allowed_methods,
         )
-    else:
-        method_list = []
+    option_values = filter_option_values(companies)
+    industries = option_values["anzsic_division"]
+    rbics_sectors_list = option_values["rbics_sector"]
+    state_list = option_values["company_state"]
+    method_list = option_values["analysis_method"]
 
     def _calc_range(column: str, default: Tuple[float, float]) -> Tuple[float, float]:
         if initial_df.empty or column not in initial_df:
             return default
-        numeric = pd.to_numeric(initial_df[column], errors="coerce").dropna()
+        numeric = initial_df[column].dropna()
         if numeric.empty:
             return default
         minimum = float(numeric.min())
@@ -331,6 +679,39 @@ def create_dash_app(
             marks[key] = f"{value:,.0f}"
         return marks
 
+    company_table_columns: List[Dict[str, str]] = [
+        {"name": "Ticker", "id": "ticker"},
+        {"name": "Name", "id": "name"},
+        {"name": "Industry / Sector", "id": "anzsic_division"},
+        {"name": "Scope 1 (kgCO2e)", "id": "scope_1", "type": "numeric"},
+        {"name": "Scope 2 (kgCO2e)", "id": "scope_2", "type": "numeric"},
+        {"name": "Revenue (MM AUD)", "id": "revenue_mm", "type": "numeric"},
+        {
+            "name": "Net Income (MM AUD)",
+            "id": "net_income_mm",
+            "type": "numeric",
+        },
+        {"name": "EBITDA (MM AUD)", "id": "ebitda_mm", "type": "numeric"},
+        {
+            "name": "Total Assets (MM AUD)",
+            "id": "assets_mm",
+            "type": "numeric",
+        },
+        {"name": "Employees", "id": "employees", "type": "numeric"},
+        {"name": "Reporting Group", "id": "reporting_group"},
+        {"name": "Company State", "id": "company_state"},
+        {"name": "Company Region", "id": "company_region"},
+        {"name": "Company Country", "id": "company_country"},
+        {"name": "RBICS Sector", "id": "rbics_sector"},
+        {"name": "RBICS Sub-Sector", "id": "rbics_sub_sector"},
+        {"name": "RBICS Industry Group", "id": "rbics_industry_group"},
+        {"name": "RBICS Industry", "id": "rbics_industry"},
+        {"name": "Analysis Method", "id": "analysis_method"},
+    ]
+    numeric_table_columns = {
+        column["id"] for column in company_table_columns if column.get("type") == "numeric"
+    }
+
     insights_tab = html.Div(
         [
             html.Div(
@@ -445,41 +826,24 @@ def create_dash_app(
             html.H2("Group vs Industry Summary"),
             dcc.Graph(id="group-industry-table"),
             html.H2("Filtered Companies"),
+            # The table only receives the visible page; filtering, sorting and
+            # paging run server-side over the rows filtered-table-store names.
+            dcc.Store(id="filtered-table-store", data=None),
+            # Axes of the heatmap this browser currently shows, so an update with
+            # the same groups and industries can be sent as a Patch.
+            dcc.Store(id="heatmap-axes-store", data=None),
             DataTable(
                 id="company-table",
-                columns=[
-                    {"name": "Ticker", "id": "ticker"},
-                    {"name": "Name", "id": "name"},
-                    {"name": "Industry / Sector", "id": "anzsic_division"},
-                    {"name": "Scope 1 (kgCO2e)", "id": "scope_1", "type": "numeric"},
-                    {"name": "Scope 2 (kgCO2e)", "id": "scope_2", "type": "numeric"},
-                    {"name": "Revenue (MM AUD)", "id": "revenue_mm", "type": "numeric"},
-                    {
-                        "name": "Net Income (MM AUD)",
-                        "id": "net_income_mm",
-                        "type": "numeric",
-                    },
-                    {"name": "EBITDA (MM AUD)", "id": "ebitda_mm", "type": "numeric"},
-                    {
-                        "name": "Total Assets (MM AUD)",
-                        "id": "assets_mm",
-                        "type": "numeric",
-                    },
-                    {"name": "Employees", "id": "employees", "type": "numeric"},
-                    {"name": "Reporting Group", "id": "reporting_group"},
-                    {"name": "Company State", "id": "company_state"},
-                    {"name": "Company Region", "id": "company_region"},
-                    {"name": "Company Country", "id": "company_country"},
-                    {"name": "RBICS Sector", "id": "rbics_sector"},
-                    {"name": "RBICS Sub-Sector", "id": "rbics_sub_sector"},
-                    {"name": "RBICS Industry Group", "id": "rbics_industry_group"},
-                    {"name": "RBICS Industry", "id": "rbics_industry"},
-                    {"name": "Analysis Method", "id": "analysis_method"},
-                ],
-                data=initial_df.to_dict("records") if not initial_df.empty else [],
-                page_size=10,
-                filter_action="native",
-                sort_action="native",
+                columns=company_table_columns,
+                data=[],
+                page_current=0,
+                page_size=COMPANY_TABLE_PAGE_SIZE,
+                page_action="custom",
+                filter_action="custom",
+                filter_query="",
+                sort_action="custom",
+                sort_mode="single",
+                sort_by=[],
                 style_table={"overflowX": "auto"},
             ),
         ],
@@ -638,7 +1002,12 @@ def create_dash_app(
 
     app.layout = html.Div(
         [
-            dcc.Store(id="companies-store", data=serialise_companies(companies)),
+            # Revision counter bumped on every verification edit. The Company
+            # objects stay server-side in `companies`, so a click never
+            # round-trips the whole dataset through the browser.
+            dcc.Store(id="companies-store", data=0),
+            # Filter values last sent to update_visuals; written in the browser.
+            dcc.Store(id="insights-filters", data=None),
             html.H1("Scope Spider Dashboard"),
             dcc.Tabs(
                 id="main-tabs",
@@ -656,6 +1025,59 @@ def create_dash_app(
         className="container",
     )
 
+    # Insight outputs depend only on the filtered rows, so slider moves that keep
+    # the same rows (or revisit an earlier selection) reuse the built figures.
+    figure_cache: "OrderedDict[str, Tuple[Any, ...]]" = OrderedDict()
+    # Bumped whenever a verification edit changes the insights data. Outputs are
+    # also kept per filter combination, so toggling back to an earlier selection
+    # (or a slider drag re-firing unchanged values) is a dictionary lookup as
+    # long as this revision has not moved.
+    data_revision = 0
+    render_cache: "OrderedDict[Tuple[Any, ...], Tuple[Any, ...]]" = OrderedDict()
+    # Filtered table rows stay on the server, keyed by a digest of the render
+    # key; the browser only holds that key, so paging never re-uploads them.
+    table_rows: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+    # Callbacks run on several threads and verification edits clear
+    # render_cache, so every read-modify of these caches happens under this.
+    cache_lock = threading.Lock()
+
+    # Gate insight renders in the browser: a request only reaches the server
+    # when the insights tab is showing and a filter (or the data revision)
+    # differs from what was last rendered. Tab switches and sliders released
+    # on their previous values never leave the page.
+    app.clientside_callback(
+        """
+        function (version, industries, rbics, states, scope1, netIncome, revenue, tab, previous) {
+            if (tab !== "insights") {
+                return window.dash_clientside.no_update;
+            }
+            const next = {
+                version: version,
+                industries: industries,
+                rbics: rbics,
+                states: states,
+                scope1: scope1,
+                net_income: netIncome,
+                revenue: revenue,
+            };
+            if (previous && JSON.stringify(previous) === JSON.stringify(next)) {
+                return window.dash_clientside.no_update;
+            }
+            return next;
+        }
+        """,
+        Output("insights-filters", "data"),
+        Input("companies-store", "data"),
+        Input("industry-filter", "value"),
+        Input("rbics-filter", "value"),
+        Input("state-filter", "value"),
+        Input("scope1-slider", "value"),
+        Input("netincome-slider", "value"),
+        Input("revenue-slider", "value"),
+        Input("main-tabs", "value"),
+        State("insights-filters", "data"),
+    )
+
     @app.callback(
         Output("scatter-emissions-net-income", "figure"),
         Output("scatter-emissions-revenue", "figure"),
@@ -664,24 +1086,71 @@ def create_dash_app(
         Output("bar-top-revenue", "figure"),
         Output("scope-bar", "figure"),
         Output("group-industry-table", "figure"),
-        Output("company-table", "data"),
-        Input("companies-store", "data"),
-        Input("industry-filter", "value"),
-        Input("rbics-filter", "value"),
-        Input("state-filter", "value"),
-        Input("scope1-slider", "value"),
-        Input("netincome-slider", "value"),
-        Input("revenue-slider", "value"),
+        Output("filtered-table-store", "data"),
+        Output("heatmap-axes-store", "data"),
+        Input("insights-filters", "data"),
+        State("heatmap-axes-store", "data"),
     )
     def update_visuals(
-        store_data: Optional[List[Dict[str, Any]]],
-        industries_selected: Optional[List[str]],
-        rbics_selected: Optional[List[str]],
-        states_selected: Optional[List[str]],
-        scope1_range: List[float],
-        net_income_range: List[float],
-        revenue_range: List[float],
+        filters: Optional[Dict[str, Any]],
+        shown_heatmap_axes: Optional[List[List[Any]]],
     ):
+        if not filters:
+            raise PreventUpdate
+        industries_selected: Optional[List[str]] = filters.get("industries")
+        rbics_selected: Optional[List[str]] = filters.get("rbics")
+        states_selected: Optional[List[str]] = filters.get("states")
+        scope1_range: List[float] = filters["scope1"]
+        net_income_range: List[float] = filters["net_income"]
+        revenue_range: List[float] = filters["revenue"]
+
+        # Take the revision, frame and row orders together so an edit landing
+        # mid-render can't pair the new orders with the old frame.
+        with companies_lock:
+            revision, df, orders = data_revision, insights_frame, ranked_rows
+
+        render_key = (
+            revision,
+            tuple(industries_selected or ()),
+            tuple(rbics_selected or ()),
+            tuple(states_selected or ()),
+            tuple(scope1_range or ()),
+            tuple(net_income_range or ()),
+            tuple(revenue_range or ()),
+        )
+
+        def respond(outputs: Tuple[Any, ...]) -> Tuple[Any, ...]:
+            # Caches always hold the full heatmap. When the browser already shows
+            # one over the same axes, only the cell values and labels are sent.
+            matrix = outputs[6]
+            axes = _heatmap_axes(matrix)
+            if axes is not None and axes == shown_heatmap_axes:
+                patch = Patch()
+                patch["data"][0]["z"] = matrix["data"][0]["z"]
+                patch["layout"]["annotations"] = matrix["layout"]["annotations"]
+                matrix = patch
+            table_key = hashlib.sha1(repr(render_key).encode()).hexdigest()
+            with cache_lock:
+                table_rows[table_key] = outputs[7]
+                table_rows.move_to_end(table_key)
+                if len(table_rows) > FIGURE_CACHE_SIZE:
+                    table_rows.popitem(last=False)
+            return (*outputs[:6], matrix, table_key, axes)
+
+        with cache_lock:
+            rendered = render_cache.get(render_key)
+            if rendered is not None:
+                render_cache.move_to_end(render_key)
+        if rendered is not None:
+            return respond(rendered)
+
+        def remember(outputs: Tuple[Any, ...]) -> Tuple[Any, ...]:
+            with cache_lock:
+                render_cache[render_key] = outputs
+                if len(render_cache) > FIGURE_CACHE_SIZE:
+                    render_cache.popitem(last=False)
+            return respond(outputs)
+
         def empty_response(message: str):
             empty_scatter = px.scatter(title=message)
             empty_bar = px.bar(title="")
@@ -696,235 +1165,250 @@ def create_dash_app(
                 [],
             )
 
-        companies_current = deserialise_companies(store_data)
-        if not companies_current:
-            return empty_response("No data available.")
-
-        df = companies_to_dataframe(companies_current)
+        # companies-store only signals that an edit landed; the rows themselves
+        # come from the server-side frame rather than a browser round-trip.
         if df.empty:
-            return empty_response("No data available.")
-
-        filtered = cast(pd.DataFrame, df.copy())
-        if industries_selected:
-            filtered = cast(
-                pd.DataFrame,
-                filtered[filtered["anzsic_division"].isin(industries_selected)],
-            )
-        if rbics_selected:
-            filtered = cast(
-                pd.DataFrame,
-                filtered[filtered["rbics_sector"].isin(rbics_selected)],
-            )
-        if states_selected:
-            filtered = cast(
-                pd.DataFrame,
-                filtered[filtered["company_state"].isin(states_selected)],
-            )
+            return remember(empty_response("No data available."))
 
-        scope1_series_raw = pd.to_numeric(filtered["scope_1"], errors="coerce")
-        scope2_series_raw = pd.to_numeric(filtered["scope_2"], errors="coerce")
-        scope_total = scope1_series_raw.fillna(0) + scope2_series_raw.fillna(0)
-        scope_total[(scope1_series_raw.isna()) & (scope2_series_raw.isna())] = pd.NA
-
-        filtered = cast(
-            pd.DataFrame,
-            filtered.assign(
-                scope_1_numeric=scope_total,
-                scope_2_numeric=scope2_series_raw,
-                revenue_numeric=pd.to_numeric(filtered["revenue_mm"], errors="coerce"),
-                net_income_numeric=pd.to_numeric(
-                    filtered["net_income_mm"], errors="coerce"
-                ),
-                ebitda_numeric=pd.to_numeric(filtered["ebitda_mm"], errors="coerce"),
-                assets_numeric=pd.to_numeric(filtered["assets_mm"], errors="coerce"),
-            ),
-        )
+        # Combine every filter into a single boolean mask so only one filtered
+        # frame is materialised. The numeric columns (and the scope total) are
+        # float64 from frame construction, so these are views, not coercions.
+        scope_total = df["scope_total"].to_numpy()
+        revenue_values = df["revenue_mm"].to_numpy()
+        net_values = df["net_income_mm"].to_numpy()
 
         s_min, s_max = scope1_range
         n_min, n_max = net_income_range
         r_min, r_max = revenue_range
 
-        scope1_series = filtered["scope_1_numeric"]
-        net_series = filtered["net_income_numeric"]
-        revenue_series = filtered["revenue_numeric"]
-
-        mask_scope1 = (
-            scope1_series.between(s_min, s_max, inclusive="both") | scope1_series.isna()
-        )
-        mask_net = (
-            net_series.between(n_min, n_max, inclusive="both") | net_series.isna()
-        )
-        mask_rev = (
-            revenue_series.between(r_min, r_max, inclusive="both")
-            | revenue_series.isna()
-        )
-
-        filtered = filtered[mask_scope1 & mask_net & mask_rev]
+        mask = np.ones(len(df), dtype=bool)
+        if industries_selected:
+            mask &= _isin_mask(df["anzsic_division"], industries_selected)
+        if rbics_selected:
+            mask &= _isin_mask(df["rbics_sector"], rbics_selected)
+        if states_selected:
+            mask &= _isin_mask(df["company_state"], states_selected)
+        for values, low, high in (
+            (scope_total, s_min, s_max),
+            (net_values, n_min, n_max),
+            (revenue_values, r_min, r_max),
+        ):
+            _and_range_mask(values, float(low), float(high), mask)
+
+        rows = np.flatnonzero(mask)
+        # Keep the filtered numeric columns as plain arrays too, so the figure
+        # builders below index them directly instead of going back through
+        # the frame for every read.
+        metric_arrays: Dict[str, np.ndarray] = {
+            "scope_total": scope_total[rows],
+            "scope_2": df["scope_2"].to_numpy()[rows],
+            "revenue_mm": revenue_values[rows],
+            "net_income_mm": net_values[rows],
+            "ebitda_mm": df["ebitda_mm"].to_numpy()[rows],
+            "assets_mm": df["assets_mm"].to_numpy()[rows],
+        }
+        filtered = cast(pd.DataFrame, df.iloc[rows])
 
         if filtered.empty:
-            return empty_response("No data matches the current filters.")
-
-        size_series = filtered["revenue_numeric"].fillna(1.0)
+            return remember(empty_response("No data matches the current filters."))
+
+        cache_key = _frame_digest(filtered)
+        with cache_lock:
+            cached = figure_cache.get(cache_key)
+            if cached is not None:
+                figure_cache.move_to_end(cache_key)
+        if cached is not None:
+            return remember(cached)
+
+        # The four scatters share x, marker sizes, hover names and the industry
+        # grouping, so those are split into per-industry traces once and each
+        # figure only swaps in its own y values.
+        x_values = metric_arrays["scope_total"]
+        revenue_values = metric_arrays["revenue_mm"]
+        size_values = np.where(np.isnan(revenue_values), 1.0, revenue_values)
+        hover_names = filtered["name"].to_numpy()
+        division_codes, divisions = pd.factorize(filtered["anzsic_division"])
+        colorway = px.colors.qualitative.Plotly
+        # Same area scaling Plotly Express uses for size_max=60.
+        size_ref = float(size_values.max()) / (60**2) if size_values.size else 1.0
+        # Trace arrays only need display precision, so they ship to the browser
+        # as float32 (half the payload); filtering and aggregation stay float64.
+        x_trace = x_values.astype(np.float32)
+        size_trace = size_values.astype(np.float32)
+        scatter_groups = []
+        for code, division in enumerate(divisions):
+            group_rows = np.flatnonzero(division_codes == code)
+            scatter_groups.append(
+                (
+                    group_rows,
+                    dict(
+                        x=x_trace[group_rows],
+                        hovertext=hover_names[group_rows],
+                        mode="markers",
+                        name=division,
+                        legendgroup=division,
+                        showlegend=True,
+                        marker=dict(
+                            color=colorway[code % len(colorway)],
+                            size=size_trace[group_rows],
+                            sizemode="area",
+                            sizeref=size_ref,
+                            symbol="circle",
+                        ),
+                    ),
+                )
+            )
 
         def build_scatter(
             metric_column: str,
             metric_label: str,
             title: str,
         ):
-            metric_frame = filtered[
-                [
-                    "scope_1_numeric",
-                    metric_column,
-                    "anzsic_division",
-                    "name",
-                ]
-            ].copy()
-            metric_frame[metric_column] = pd.to_numeric(
-                metric_frame[metric_column], errors="coerce"
-            )
-            available = metric_frame.dropna(subset=["scope_1_numeric", metric_column])
-            if available.empty:
+            # Both axes are float64 already, so the data check runs on the raw
+            # arrays instead of materialising a dropna copy just to test emptiness.
+            y_values = metric_arrays[metric_column]
+            has_points = bool(np.any(~np.isnan(x_values) & ~np.isnan(y_values)))
+            if not has_points:
                 fig = px.scatter(title=f"{title} (insufficient data)")
                 fig.update_layout(
                     xaxis_title="Scope 1 + 2 (kgCO2e)",
                     yaxis_title=metric_label,
                 )
                 return fig
-            fig = px.scatter(
-                metric_frame,
-                x="scope_1_numeric",
-                y=metric_column,
-                color="anzsic_division",
-                size=size_series,
-                size_max=60,
-                hover_name="name",
+            hover_prefix = "<b>%{hovertext}</b><br><br>Industry / Sector="
+            y_trace = y_values.astype(np.float32)
+            # Seven significant digits is what float32 holds exactly; without a
+            # format the hover would show float32 rounding noise.
+            hover_suffix = (
+                "<br>Scope 1 + 2 (kgCO2e)=%{x:,.7~r}"
+                f"<br>{metric_label}=%{{y:,.7~r}}"
+                "<br>size=%{marker.size:,.7~r}<extra></extra>"
+            )
+            # WebGL markers keep large scatters responsive; SVG draws one node per point.
+            fig = go.Figure(
+                data=[
+                    go.Scattergl(
+                        trace,
+                        y=y_trace[group_rows],
+                        hovertemplate=f"{hover_prefix}{trace['name']}{hover_suffix}",
+                    )
+                    for group_rows, trace in scatter_groups
+                ]
+            )
+            fig.update_layout(
                 title=title,
-                labels={
-                    "scope_1_numeric": "Scope 1 + 2 (kgCO2e)",
-                    metric_column: metric_label,
-                    "anzsic_division": "Industry / Sector",
-                },
+                xaxis_title="Scope 1 + 2 (kgCO2e)",
+                yaxis_title=metric_label,
+                legend=dict(
+                    title="Industry / Sector", tracegroupgap=0, itemsizing="constant"
+                ),
             )
             return fig
 
         net_income_fig = build_scatter(
-            "net_income_numeric",
+            "net_income_mm",
             "Net Income (MM AUD)",
             "Scope 1 + 2 vs Net Income",
         )
         revenue_fig = build_scatter(
-            "revenue_numeric",
+            "revenue_mm",
             "Revenue (MM AUD)",
             "Scope 1 + 2 vs Revenue",
         )
         ebitda_fig = build_scatter(
-            "ebitda_numeric",
+            "ebitda_mm",
             "EBITDA (MM AUD)",
             "Scope 1 + 2 vs EBITDA",
         )
         assets_fig = build_scatter(
-            "assets_numeric",
+            "assets_mm",
             "Total Assets (MM AUD)",
             "Scope 1 + 2 vs Total Assets",
         )
 
-        top_revenue = cast(
-            pd.DataFrame,
-            filtered.sort_values(by="revenue_numeric", ascending=False).head(10),
-        )
+        # The frame is already ranked by revenue, so the top ten are the first
+        # ranked rows that pass the mask; no per-callback sort is needed.
+        revenue_order = orders["revenue_mm"]
+        top_rows = revenue_order[mask[revenue_order]][:10]
+        top_revenue = cast(pd.DataFrame, df.iloc[top_rows])
 
         bar_revenue_fig = px.bar(
             top_revenue,
             x="name",
-            y="revenue_numeric",
+            y="revenue_mm",
             color="anzsic_division",
             title="Top 10 Companies by Revenue",
             labels={
-                "revenue_numeric": "Revenue (MM AUD)",
+                "revenue_mm": "Revenue (MM AUD)",
                 "anzsic_division": "Industry / Sector",
             },
         )
 
+        # Two bar traces straight from the grouped means; no long-form reshape.
         scope_avgs = cast(
             pd.DataFrame,
-            filtered.groupby("anzsic_division")[
-                ["scope_1_numeric", "scope_2_numeric"]
+            filtered.groupby("anzsic_division", observed=True)[
+                ["scope_total", "scope_2"]
             ].mean(numeric_only=True),
-        ).reset_index()
-        scope_avgs = scope_avgs.melt(
-            id_vars="anzsic_division",
-            value_vars=["scope_1_numeric", "scope_2_numeric"],
-            var_name="Scope",
-            value_name="kgCO2e",
         )
-        scope_avgs["Scope"] = scope_avgs["Scope"].replace(
-            {"scope_1_numeric": "Scope 1", "scope_2_numeric": "Scope 2"}
+        scope_divisions = scope_avgs.index.to_numpy(dtype=object)
+        scope_fig = go.Figure(
+            [
+                go.Bar(
+                    name=label,
+                    legendgroup=label,
+                    x=scope_divisions,
+                    y=scope_avgs[column].to_numpy(),
+                    marker=dict(color=color),
+                    hovertemplate=(
+                        f"Scope={label}<br>Industry / Sector=%{{x}}"
+                        "<br>kgCO2e=%{y}<extra></extra>"
+                    ),
+                )
+                for label, column, color in (
+                    ("Scope 1", "scope_total", "#636efa"),
+                    ("Scope 2", "scope_2", "#EF553B"),
+                )
+            ]
         )
-        scope_fig = px.bar(
-            scope_avgs,
-            x="anzsic_division",
-            y="kgCO2e",
-            color="Scope",
+        scope_fig.update_layout(
             title="Average Scope 1 & 2 Emissions by Industry / Sector",
-            labels={"anzsic_division": "Industry / Sector", "kgCO2e": "kgCO2e"},
+            barmode="relative",
+            legend=dict(title="Scope", tracegroupgap=0),
+            xaxis_title="Industry / Sector",
+            yaxis_title="kgCO2e",
         )
 
-        table_cols = [
-            "ticker",
-            "name",
-            "anzsic_division",
-            "scope_1",
-            "scope_2",
-            "revenue_mm",
-            "net_income_mm",
-            "ebitda_mm",
-            "assets_mm",
-            "employees",
-            "reporting_group",
-            "company_state",
-            "company_region",
-            "company_country",
-            "rbics_sector",
-            "rbics_sub_sector",
-            "rbics_industry_group",
-            "rbics_industry",
-            "analysis_method",
-        ]
+        table_cols = [column["id"] for column in company_table_columns]
+        # Take the masked rows in precomputed net income order, gathering only
+        # the table columns with one take.
+        net_income_order = orders["net_income_mm"]
         table_df = cast(
             pd.DataFrame,
-            filtered[table_cols + ["net_income_numeric"]].copy(),
-        )
-        table_df = table_df.sort_values(by="net_income_numeric", ascending=False)
-        table_df = table_df.drop(columns=["net_income_numeric"])
-        table_df = table_df.fillna("")
-
-        group_data = filtered.copy()
-        group_data["reporting_group"] = group_data["reporting_group"].fillna("None")
-        group_data["anzsic_division"] = group_data["anzsic_division"].fillna("Unknown")
-
-        pivot_counts = (
-            group_data.pivot_table(
-                index="reporting_group",
-                columns="anzsic_division",
-                values="ticker",
-                aggfunc="nunique",
-                fill_value=0,
-            )
-            if not group_data.empty
-            else pd.DataFrame()
+            df.iloc[
+                net_income_order[mask[net_income_order]],
+                df.columns.get_indexer(table_cols),
+            ],
         )
-        pivot_emissions = (
-            group_data.pivot_table(
-                index="reporting_group",
-                columns="anzsic_division",
-                values="scope_1_numeric",
-                aggfunc="sum",
-                fill_value=0.0,
-            )
-            if not group_data.empty
-            else pd.DataFrame()
+
+        group_data = pd.DataFrame(
+            {
+                "reporting_group": _fill_category(filtered["reporting_group"], "None"),
+                "anzsic_division": _fill_category(
+                    filtered["anzsic_division"], "Unknown"
+                ),
+                "ticker": filtered["ticker"].to_numpy(),
+                "scope_1_numeric": x_values,
+            }
         )
 
+        # One sorted aggregation yields both heatmap layers, instead of two
+        # pivot_table passes that each re-hash the groups.
+        if group_data.empty:
+            pivot_counts = pivot_emissions = pd.DataFrame()
+        else:
+            pivot_counts, pivot_emissions = _group_industry_matrix(group_data)
+
         if pivot_counts.empty or pivot_emissions.empty:
             matrix_fig = go.Figure()
             matrix_fig.update_layout(
@@ -943,32 +1427,26 @@ def create_dash_app(
                 ],
             )
         else:
-            z_counts = pivot_counts.reindex(sorted(pivot_counts.index)).reindex(
-                sorted(pivot_counts.columns), axis=1
-            )
-            z_emissions = pivot_emissions.reindex(sorted(pivot_emissions.index)).reindex(
-                sorted(pivot_emissions.columns), axis=1
-            )
-            annotations = []
-            for i, group in enumerate(z_counts.index):
-                for j, division in enumerate(z_counts.columns):
-                    count = z_counts.iloc[i, j]
-                    emissions_total = z_emissions.iloc[i, j]
-                    text = f"{int(count)}<br>{emissions_total:,.0f} kg"
-                    annotations.append(
-                        dict(
-                            x=j,
-                            y=i,
-                            text=text,
-                            showarrow=False,
-                            font=dict(color="white" if count > 0 else "black"),
-                        )
-                    )
+            # Read cells from the raw arrays; .iloc per cell dispatches through
+            # the pandas indexer for every annotation.
+            counts = pivot_counts.to_numpy()
+            emissions = pivot_emissions.to_numpy()
+            annotations = [
+                dict(
+                    x=j,
+                    y=i,
+                    text=f"{int(counts[i, j])}<br>{emissions[i, j]:,.0f} kg",
+                    showarrow=False,
+                    font=dict(color="white" if counts[i, j] > 0 else "black"),
+                )
+                for i in range(counts.shape[0])
+                for j in range(counts.shape[1])
+            ]
             matrix_fig = go.Figure(
                 data=go.Heatmap(
-                    z=z_counts.values,
-                    x=z_counts.columns.tolist(),
-                    y=z_counts.index.tolist(),
+                    z=pivot_counts.values,
+                    x=pivot_counts.columns.tolist(),
+                    y=pivot_counts.index.tolist(),
                     colorscale="Blues",
                     colorbar=dict(title="Company count"),
                 )
@@ -980,16 +1458,59 @@ def create_dash_app(
                 annotations=annotations,
             )
 
-        return (
-            net_income_fig,
-            revenue_fig,
-            ebitda_fig,
-            assets_fig,
-            bar_revenue_fig,
-            scope_fig,
-            matrix_fig,
-            table_df.to_dict("records"),
+        # Cache the plain figure dicts rather than Figure objects so replays skip
+        # the to_plotly_json walk Dash would otherwise repeat on every response.
+        outputs = (
+            net_income_fig.to_plotly_json(),
+            revenue_fig.to_plotly_json(),
+            ebitda_fig.to_plotly_json(),
+            assets_fig.to_plotly_json(),
+            bar_revenue_fig.to_plotly_json(),
+            scope_fig.to_plotly_json(),
+            matrix_fig.to_plotly_json(),
+            _frame_records(table_df),
         )
+        with cache_lock:
+            figure_cache[cache_key] = outputs
+            if len(figure_cache) > FIGURE_CACHE_SIZE:
+                figure_cache.popitem(last=False)
+        return remember(outputs)
+
+    @app.callback(
+        Output("company-table", "data"),
+        Output("company-table", "page_count"),
+        Input("filtered-table-store", "data"),
+        Input("company-table", "page_current"),
+        Input("company-table", "page_size"),
+        Input("company-table", "sort_by"),
+        Input("company-table", "filter_query"),
+    )
+    def page_company_table(
+        table_key: Optional[str],
+        page_current: Optional[int],
+        page_size: Optional[int],
+        sort_by: Optional[List[Dict[str, str]]],
+        filter_query: Optional[str],
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        if not table_key:
+            return [], 1
+        with cache_lock:
+            rows = table_rows.get(table_key)
+            if rows is not None:
+                table_rows.move_to_end(table_key)
+        if rows is None:
+            # Evicted by newer renders; keep the page the browser already shows.
+            raise PreventUpdate
+        if not rows:
+            return [], 1
+        frame = query_company_table(
+            pd.DataFrame.from_records(rows), filter_query, sort_by, numeric_table_columns
+        )
+        size = max(1, page_size or COMPANY_TABLE_PAGE_SIZE)
+        page_count = max(1, math.ceil(len(frame) / size))
+        page = min(max(0, page_current or 0), page_count - 1)
+        visible = frame.iloc[page * size : (page + 1) * size]
+        return _frame_records(visible, missing=""), page_count
 
     @app.callback(
         Output("verification-method-filter", "options"),
@@ -997,15 +1518,15 @@ def create_dash_app(
         Input("companies-store", "data"),
         State("verification-method-filter", "value"),
     )
+    @_holding(companies_lock)
     def refresh_method_filter(
-        store_data: Optional[List[Dict[str, Any]]],
+        store_version: Optional[int],
         selected_methods: Optional[List[str]],
     ) -> tuple[list[Dict[str, str]], Optional[List[str]]]:
-        companies_current = deserialise_companies(store_data)
         methods = sorted(
             {
                 company.analysis_record.method
-                for company in companies_current
+                for company in companies
                 if company.analysis_record and company.analysis_record.method
             }
         )
@@ -1024,22 +1545,20 @@ def create_dash_app(
         Input("verification-method-filter", "value"),
         State("verification-current-key", "data"),
     )
+    @_holding(companies_lock)
     def ensure_verification_key(
-        store_data: Optional[List[Dict[str, Any]]],
+        store_version: Optional[int],
         selected_methods: Optional[List[str]],
         current_key: Optional[str],
     ) -> Optional[str]:
-        companies_current = deserialise_companies(store_data)
-        if not companies_current:
+        if not companies:
             return None
         allowed_methods = (
             {str(value) for value in selected_methods if value}
             if selected_methods
             else None
         )
-        return next_pending_key(
-            companies_current, current_key, allowed_methods=allowed_methods
-        )
+        return pending_key(current_key, allowed_methods=allowed_methods)
 
     @app.callback(
         Output("verification-summary", "children"),
@@ -1054,119 +1573,126 @@ def create_dash_app(
     )
     def update_verification_view(
         current_key: Optional[str],
-        store_data: Optional[List[Dict[str, Any]]],
+        store_version: Optional[int],
     ):
-        companies_current = deserialise_companies(store_data)
-        if not companies_current:
-            return (
-                html.Div("No companies available."),
-                "",
-                [html.P("No previews available.")],
-                None,
-                None,
-                None,
-                "",
-            )
-
-        if not current_key:
-            return (
-                html.Div("All companies are verified."),
-                "",
-                [html.P("No pending companies.")],
-                None,
-                None,
-                None,
-                "",
-            )
+        # Read the company under the lock, then release it before the snippet
+        # file read and page rasterisation so a slow preview can't stall
+        # insight renders or saves in other sessions.
+        with companies_lock:
+            if not companies:
+                return (
+                    html.Div("No companies available."),
+                    "",
+                    [html.P("No previews available.")],
+                    None,
+                    None,
+                    None,
+                    "",
+                )
 
-        target = next(
-            (
-                company
-                for company in companies_current
-                if company_key(company) == current_key
-            ),
-            None,
-        )
-        if target is None:
-            return (
-                html.Div("Company not found."),
-                "",
-                [html.P("No previews available.")],
-                None,
-                None,
-                None,
-                "",
-            )
+            if not current_key:
+                return (
+                    html.Div("All companies are verified."),
+                    "",
+                    [html.P("No pending companies.")],
+                    None,
+                    None,
+                    None,
+                    "",
+                )
 
-        identity = target.identity
-        annotations = target.annotations
-        emissions = target.emissions
-        verification = target.verification
-        analysis = target.analysis_record
-
-        scope1 = emissions.scope_1.value if emissions.scope_1 else None
-        scope2 = emissions.scope_2.value if emissions.scope_2 else None
-        scope3 = emissions.scope_3.value if emissions.scope_3 else None
-        scope1_conf = emissions.scope_1.confidence if emissions.scope_1 else None
-        scope2_conf = emissions.scope_2.confidence if emissions.scope_2 else None
-
-        if analysis is not None:
-            method = analysis.method or "unknown"
-            confidence = analysis.confidence
-            snippet_label = analysis.snippet_label or ""
-        else:
-            method = "unknown"
-            confidence = None
-            snippet_label = ""
+            target_position = positions_by_key.get(current_key)
+            target = companies[target_position] if target_position is not None else None
+            if target is None:
+                return (
+                    html.Div("Company not found."),
+                    "",
+                    [html.P("No previews available.")],
+                    None,
+                    None,
+                    None,
+                    "",
+                )
 
-        verified_at = (
-            verification.verified_at.isoformat(timespec="seconds")
-            if verification and verification.verified_at
-            else None
-        )
+            identity = target.identity
+            annotations = target.annotations
+            emissions = target.emissions
+            verification = target.verification
+            analysis = target.analysis_record
+
+            scope1 = emissions.scope_1.value if emissions.scope_1 else None
+            scope2 = emissions.scope_2.value if emissions.scope_2 else None
+            scope3 = emissions.scope_3.value if emissions.scope_3 else None
+            scope1_conf = emissions.scope_1.confidence if emissions.scope_1 else None
+            scope2_conf = emissions.scope_2.confidence if emissions.scope_2 else None
+
+            if analysis is not None:
+                method = analysis.method or "unknown"
+                confidence = analysis.confidence
+                snippet_label = analysis.snippet_label or ""
+            else:
+                method = "unknown"
+                confidence = None
+                snippet_label = ""
+
+            verified_at = (
+                verification.verified_at.isoformat(timespec="seconds")
+                if verification and verification.verified_at
+                else None
+            )
 
-        summary = html.Div(
-            [
-                html.H3(identity.ticker or identity.name or "Unknown"),
-                html.P(f"Status: {verification.status if verification else 'pending'}"),
-                html.P(f"Verified at: {verified_at or '—'}"),
-                html.P(f"Reporting group: {annotations.reporting_group or '—'}"),
-                html.P(
-                    f"Location: {annotations.company_state or annotations.company_region or annotations.company_country or '—'}"
-                ),
-                html.P(
-                    f"Scope 1: {scope1 if scope1 is not None else '—'} "
-                    f"(conf={scope1_conf if scope1_conf is not None else '—'})"
-                ),
-                html.P(
-                    f"Scope 2: {scope2 if scope2 is not None else '—'} "
-                    f"(conf={scope2_conf if scope2_conf is not None else '—'})"
-                ),
-                html.P(f"Scope 3: {scope3 if scope3 is not None else '—'}"),
-                html.P(f"Analysis method: {method}"),
-                html.P(
-                    f"Analysis confidence: {confidence:.2f}"
-                    if confidence is not None
-                    else "Analysis confidence: —"
-                ),
-                html.P(f"Snippet label: {snippet_label or '—'}"),
-            ],
-            className="verification-summary",
-        )
+            summary = html.Div(
+                [
+                    html.H3(identity.ticker or identity.name or "Unknown"),
+                    html.P(f"Status: {verification.status if verification else 'pending'}"),
+                    html.P(f"Verified at: {verified_at or '—'}"),
+                    html.P(f"Reporting group: {annotations.reporting_group or '—'}"),
+                    html.P(
+                        f"Location: {annotations.company_state or annotations.company_region or annotations.company_country or '—'}"
+                    ),
+                    html.P(
+                        f"Scope 1: {scope1 if scope1 is not None else '—'} "
+                        f"(conf={scope1_conf if scope1_conf is not None else '—'})"
+                    ),
+                    html.P(
+                        f"Scope 2: {scope2 if scope2 is not None else '—'} "
+                        f"(conf={scope2_conf if scope2_conf is not None else '—'})"
+                    ),
+                    html.P(f"Scope 3: {scope3 if scope3 is not None else '—'}"),
+                    html.P(f"Analysis method: {method}"),
+                    html.P(
+                        f"Analysis confidence: {confidence:.2f}"
+                        if confidence is not None
+                        else "Analysis confidence: —"
+                    ),
+                    html.P(f"Snippet label: {snippet_label or '—'}"),
+                ],
+                className="verification-summary",
+            )
 
-        snippet_path = analysis.snippet_path if analysis else None
+            snippet_path = analysis.snippet_path if analysis else None
+            preview_pdf: Optional[Path] = None
+            preview_pages: List[int] = []
+            if (
+                analysis
+                and analysis.snippet_pages
+                and target.download_record
+                and target.download_record.pdf_path
+            ):
+                preview_pdf = Path(target.download_record.pdf_path)
+                preview_pages = list(analysis.snippet_pages)
+
+            # Prepopulate override fields with current emission values (fall back to saved overrides)
+            override_scope1 = verification.scope_1_override if verification.scope_1_override is not None else scope1
+            override_scope2 = verification.scope_2_override if verification.scope_2_override is not None else scope2
+            override_scope3 = verification.scope_3_override if verification.scope_3_override is not None else scope3
+            notes = verification.notes or ""
         snippet_text = read_snippet_text(snippet_path)
         snippet_display = snippet_text or "No snippet available for this analysis."
 
         image_children: List[html.Div] = []
-        if (
-            analysis
-            and analysis.snippet_pages
-            and target.download_record
-            and target.download_record.pdf_path
-        ):
-            pdf_path = Path(target.download_record.pdf_path)
-            previews = previews_as_data_urls(pdf_path, analysis.snippet_pages)
+        if preview_pdf is not None:
+            previews = previews_as_data_urls(preview_pdf, preview_pages)
             if previews:
                 for page, data_url in previews:
                     image_children.append(
@@ -1187,11 +1713,6 @@ def create_dash_app(
         if not image_children:
             image_children = [html.P("No page previews available.")]
 
-        # Prepopulate override fields with current emission values (fall back to saved overrides)
-        override_scope1 = verification.scope_1_override if verification.scope_1_override is not None else scope1
-        override_scope2 = verification.scope_2_override if verification.scope_2_override is not None else scope2
-        override_scope3 = verification.scope_3_override if verification.scope_3_override is not None else scope3
-
         return (
             summary,
             snippet_display,
@@ -1199,7 +1720,7 @@ def create_dash_app(
             override_scope1,
             override_scope2,
             override_scope3,
-            verification.notes or "",
+            notes,
         )
 
     @app.callback(
@@ -1225,6 +1746,7 @@ def create_dash_app(
         State("companies-store", "data"),
         prevent_initial_call=True,
     )
+    @_holding(companies_lock)
     def handle_verification_actions(
         accept_clicks: int,
         reject_clicks: int,
@@ -1239,15 +1761,15 @@ def create_dash_app(
         upload_contents: Optional[str],
         upload_filename: Optional[str],
         selected_methods: Optional[List[str]],
-        store_data: Optional[List[Dict[str, Any]]],
+        store_version: Optional[int],
     ):
+        nonlocal data_revision, insights_frame, ranked_rows
         ctx = dash.callback_context
-        if not ctx.triggered or store_data is None:
+        if not ctx.triggered or store_version is None:
             raise PreventUpdate
 
         triggered = ctx.triggered[0]["prop_id"].split(".")[0]
-        companies_current = deserialise_companies(store_data)
-        if not companies_current:
+        if not companies:
             raise PreventUpdate
 
         allowed_methods = (
@@ -1257,8 +1779,7 @@ def create_dash_app(
         )
 
         if triggered == "verify-skip-btn":
-            next_key = next_pending_key(
-                companies_current,
+            next_key = pending_key(
                 current_key,
                 skip_current=True,
                 allowed_methods=allowed_methods,
@@ -1269,7 +1790,7 @@ def create_dash_app(
                 else "No company selected to skip."
             )
             return (
-                store_data,
+                store_version,
                 html.Div(message),
                 no_update,
                 no_update,
@@ -1280,23 +1801,15 @@ def create_dash_app(
         if current_key is None:
             raise PreventUpdate
 
-        target = next(
-            (
-                company
-                for company in companies_current
-                if company_key(company) == current_key
-            ),
-            None,
-        )
-        if target is None:
-            next_key = next_pending_key(
-                companies_current,
+        target_position = positions_by_key.get(current_key)
+        if target_position is None:
+            next_key = pending_key(
                 current_key,
                 skip_current=True,
                 allowed_methods=allowed_methods,
             )
             return (
-                store_data,
+                store_version,
                 html.Div("Company not found."),
                 no_update,
                 no_update,
@@ -1304,6 +1817,7 @@ def create_dash_app(
                 next_key,
             )
 
+        target = companies[target_position]
         verification = target.verification
         now = datetime.utcnow()
         message = ""
@@ -1320,7 +1834,7 @@ def create_dash_app(
         elif triggered == "verify-reject-btn":
             stages_requested: List[str] = []
             sanitized_url: Optional[str] = None
-            upload_bytes: Optional[bytes] = None
+            stored_path: Optional[Path] = None
 
             if url_value:
                 candidate_url, is_pdf = normalise_pdf_url(url_value)
@@ -1332,7 +1846,7 @@ def create_dash_app(
                     or not parsed.netloc
                 ):
                     return (
-                        store_data,
+                        store_version,
                         html.Div("Provide a valid PDF URL (http/https ending with .pdf) before rejecting."),
                         url_value,
                         upload_data,
@@ -1344,10 +1858,15 @@ def create_dash_app(
 
             if upload_data:
                 try:
-                    upload_bytes = _decode_uploaded_pdf(upload_data)
+                    stored_path = _store_uploaded_pdf(
+                        companies_path.parent,
+                        target,
+                        upload_name,
+                        upload_data,
+                    )
                 except ValueError as exc:
                     return (
-                        store_data,
+                        store_version,
                         html.Div(str(exc)),
                         url_value,
                         upload_data,
@@ -1359,7 +1878,7 @@ def create_dash_app(
 
             if not stages_requested:
                 return (
-                    store_data,
+                    store_version,
                     html.Div("Provide a replacement PDF URL or upload a new PDF before rejecting."),
                     url_value,
                     upload_data,
@@ -1386,13 +1905,7 @@ def create_dash_app(
                     doc_type=doc_type,
                 )
 
-            if upload_bytes is not None:
-                stored_path = _store_uploaded_pdf(
-                    companies_path.parent,
-                    target,
-                    upload_name,
-                    upload_bytes,
-                )
+            if stored_path is not None:
                 target.download_record = DownloadRecord(pdf_path=str(stored_path))
 
             ordered = _ordered_stage_dependencies(stages_requested)
@@ -1409,7 +1922,7 @@ def create_dash_app(
         elif triggered == "verify-save-btn":
             if override_scope1 is None or override_scope2 is None:
                 return (
-                    store_data,
+                    store_version,
                     html.Div("Provide Scope 1 and Scope 2 overrides to save corrections."),
                     url_value,
                     upload_data,
@@ -1478,18 +1991,31 @@ def create_dash_app(
         else:
             raise PreventUpdate
 
-        new_store = serialise_companies(companies_current)
-        dump_companies(companies_path, payload, companies_current)
-
-        next_key = next_pending_key(
-            companies_current,
+        # Only the edited company changed, so only its record is re-derived. The
+        # frame itself is rebuilt from the records rather than patched in place:
+        # renders in flight keep reading the snapshot they took.
+        data_revision += 1
+        with cache_lock:
+            render_cache.clear()
+        df_records[target_position] = companies_to_dataframe([target]).to_dict(
+            "records"
+        )[0]
+        insights_frame = with_scope_total(records_to_dataframe(df_records))
+        ranked_rows = insights_orders(insights_frame)
+        dump_companies(companies_path, payload, companies, fsync=True)
+
+        accepted_flags[target_position] = target.verification.status == "accepted"
+        analysis_methods[target_position] = (
+            target.analysis_record.method if target.analysis_record else None
+        )
+        next_key = pending_key(
             current_key,
             skip_current=skip_current,
             allowed_methods=allowed_methods,
         )
 
         return (
-            new_store,
+            store_version + 1,
             html.Div(message),
             "",
             None,
@@ -2,39 +2,123 @@ from __future__ import annotations
 
 import json
 import os
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple
+
+import numpy as np
+from pydantic import TypeAdapter
 
 from ..models import Company
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+# Validating/dumping the whole list in one call keeps the per-company loop
+# inside pydantic-core instead of in Python.
+_COMPANIES_ADAPTER = TypeAdapter(List[Company])
+
+
+def _loads(data: bytes) -> Dict[str, object]:
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Older dumps may contain NaN/Infinity, which only the stdlib accepts.
+            pass
+    return json.loads(data.decode("utf-8"))
+
 
 def load_companies(path: Path) -> Tuple[List[Company], Dict[str, object]]:
-    raw_text = path.read_text(encoding="utf-8") if path.exists() else "{}"
-    payload = json.loads(raw_text or "{}")
+    raw_bytes = path.read_bytes() if path.exists() else b""
+    payload = _loads(raw_bytes or b"{}")
     companies_data = payload.get("companies") or []
     if not isinstance(companies_data, list):
         raise ValueError("Input JSON must contain a 'companies' list.")
-    companies = [Company.model_validate(item) for item in companies_data]
+    companies = _COMPANIES_ADAPTER.validate_python(companies_data)
     return companies, payload
 
 
 def dump_companies(
-    path: Path, payload: Dict[str, object], companies: List[Company]
+    path: Path,
+    payload: Dict[str, object],
+    companies: List[Company],
+    *,
+    fsync: bool = False,
 ) -> None:
-    payload["companies"] = [
-        company.model_dump(exclude_none=True) for company in companies
-    ]
-    serialized = json.dumps(payload, ensure_ascii=False, indent=2)
+    """Write ``payload`` with ``companies`` back to ``path``.
+
+    Pipeline loops checkpoint after every company, so the disk flush is
+    opt-in: pass ``fsync=True`` for final writes and user edits.
+    """
+    payload["companies"] = _COMPANIES_ADAPTER.dump_python(companies, exclude_none=True)
+    if orjson is not None:
+        serialized = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    else:
+        serialized = json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
+    with path.open("wb") as handle:
         handle.write(serialized)
-        handle.flush()
-        os.fsync(handle.fileno())
+        if fsync:
+            handle.flush()
+            os.fsync(handle.fileno())
 
 
-def safe_write_text(path: Path, content: str) -> None:
+def safe_write_text(path: Path, content: str, *, fsync: bool = False) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", encoding="utf-8") as handle:
         handle.write(content)
-        handle.flush()
-        os.fsync(handle.fileno())
+        if fsync:
+            handle.flush()
+            os.fsync(handle.fileno())
+
+
+def company_columns(
+    companies: Sequence[Company],
+    columns: Sequence[str],
+    annotation_columns: Mapping[str, str],
+    float_columns: Iterable[str],
+) -> Dict[str, Any]:
+    """Dashboard frame data for ``companies``, one list per entry of ``columns``.
+
+    ``annotation_columns`` maps frame columns to Annotations attributes copied
+    as-is. ``float_columns`` come back as float64 arrays, with None as NaN.
+    Building whole columns lets pandas skip dtype inference row by row.
+    """
+    data: Dict[str, Any] = {name: [] for name in columns}
+    annotation_values = attrgetter(*annotation_columns.values())
+    annotation_rows: List[Tuple[Any, ...]] = []
+    track_net_zero = "net_zero_mentions" in data
+    for company in companies:
+        identity = company.identity
+        emissions = company.emissions
+        annotations = company.annotations
+        analysis = company.analysis_record
+        scope_1 = emissions.scope_1
+        scope_2 = emissions.scope_2
+        employees = annotations.size_employee_count
+
+        data["ticker"].append(identity.ticker)
+        data["name"].append(identity.name or identity.ticker)
+        data["scope_1"].append(scope_1.value if scope_1 else None)
+        data["scope_2"].append(scope_2.value if scope_2 else None)
+        data["scope_1_conf"].append(scope_1.confidence if scope_1 else None)
+        data["scope_2_conf"].append(scope_2.confidence if scope_2 else None)
+        data["employees"].append(int(employees) if employees is not None else None)
+        data["analysis_method"].append(analysis.method if analysis else None)
+        if track_net_zero:
+            claims = annotations.net_zero_claims
+            data["net_zero_mentions"].append(
+                int(claims) if claims is not None else None
+            )
+        annotation_rows.append(annotation_values(annotations))
+
+    # Transpose the annotation tuples into their columns in one C-level pass.
+    for name, values in zip(annotation_columns, zip(*annotation_rows)):
+        data[name] = list(values)
+    for name in float_columns:
+        data[name] = np.asarray(data[name], dtype="float64")
+    return data
@@ -38,35 +38,27 @@ def classify_document_type(
     return "other"
 
 
+_CALENDAR_YEAR_RE = re.compile(r"\b(20\d{2})\b")
+_FISCAL_YEAR_RE = re.compile(r"\bfy\s*(?:20)?(\d{2})\b")
+
+
 def infer_year_from_text(*sources: str) -> Optional[str]:
-    candidate_years: list[int] = []
+    best: Optional[int] = None
     for source in sources:
         if not source:
             continue
         lowered = source.lower()
-
-        for match in re.findall(r"\b(20\d{2})\b", lowered):
-            try:
-                value = int(match)
-            except ValueError:
-                continue
-            if MIN_REPORT_YEAR <= value <= MAX_REPORT_YEAR:
-                candidate_years.append(value)
-
-        for match in re.findall(r"\bfy\s*(?:20)?(\d{2})\b", lowered):
-            try:
-                value = int(match)
-            except ValueError:
-                continue
-            if value < 0 or value > 99:
-                continue
-            inferred = 2000 + value
-            if MIN_REPORT_YEAR <= inferred <= MAX_REPORT_YEAR:
-                candidate_years.append(inferred)
-
-    if not candidate_years:
-        return None
-    return str(max(candidate_years))
+        years = [int(match) for match in _CALENDAR_YEAR_RE.findall(lowered)]
+        years.extend(2000 + int(match) for match in _FISCAL_YEAR_RE.findall(lowered))
+        for value in years:
+            if MIN_REPORT_YEAR <= value <= MAX_REPORT_YEAR and (
+                best is None or value > best
+            ):
+                best = value
+        if best == MAX_REPORT_YEAR:
+            # Nothing later is accepted, so the remaining sources can't change it.
+            break
+    return str(best) if best is not None else None
 
 
 def normalise_pdf_url(raw_url: str | None) -> tuple[str, bool]:
@@ -9,6 +9,7 @@ from typing import Iterable, Optional
 from urllib.parse import unquote, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 import urllib.error
 import urllib.request
 
@@ -18,7 +19,9 @@ class DownloadError(RuntimeError):
 
 
 REQUEST_TIMEOUT = 5
-CHUNK_SIZE = 8192
+CHUNK_SIZE = 256 * 1024
+WRITE_BUFFER_SIZE = 1024 * 1024
+PROGRESS_INTERVAL = 512 * 1024
 USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
     "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -26,6 +29,12 @@ USER_AGENT = (
 )
 ACCEPT_HEADER = "application/pdf,application/octet-stream;q=0.9,*/*;q=0.8"
 
+# One pooled session for every download, so repeat hosts reuse their TCP/TLS
+# connections. s3_download fetches on several threads; the pool is sized for it.
+_SESSION = requests.Session()
+for _prefix in ("https://", "http://"):
+    _SESSION.mount(_prefix, HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
 
 def find_existing_download(ticker: str, download_dir: Path) -> Optional[Path]:
     if not ticker:
@@ -76,6 +85,7 @@ def _save_stream_to_file(
     file_handle = None
     first_chunk = None
     downloaded = 0
+    last_reported = 0
     show_progress = sys.stdout.isatty() and total_length >= 0
     try:
         for chunk in chunk_iterator:
@@ -88,19 +98,22 @@ def _save_stream_to_file(
                     raise DownloadError(
                         f"not a PDF (Content-Type='{content_type or 'unknown'}', magic={'ok' if is_pdf_magic else 'missing'})"
                     )
-                file_handle = tmp_path.open("wb")
+                file_handle = tmp_path.open("wb", buffering=WRITE_BUFFER_SIZE)
                 file_handle.write(first_chunk)
             else:
                 if file_handle is None:
-                    file_handle = tmp_path.open("wb")
+                    file_handle = tmp_path.open("wb", buffering=WRITE_BUFFER_SIZE)
                 file_handle.write(chunk)
 
             downloaded += len(chunk)
-            if show_progress:
+            if show_progress and downloaded - last_reported >= PROGRESS_INTERVAL:
                 _print_progress(downloaded, total_length, prefix="    downloading: ")
+                last_reported = downloaded
 
         if file_handle:
             file_handle.close()
+        if show_progress and first_chunk is not None and downloaded != last_reported:
+            _print_progress(downloaded, total_length, prefix="    downloading: ")
         if first_chunk is None:
             if tmp_path.exists():
                 tmp_path.unlink(missing_ok=True)
@@ -124,7 +137,7 @@ def _download_with_requests(url: str, out_path: Path) -> None:
         "Accept-Language": "en-US,en;q=0.9",
     }
     try:
-        response = requests.get(
+        response = _SESSION.get(
             url,
             headers=headers,
             timeout=REQUEST_TIMEOUT,
@@ -137,17 +150,20 @@ def _download_with_requests(url: str, out_path: Path) -> None:
 
     content_type = (response.headers.get("Content-Type") or "").lower()
     total_length = int(response.headers.get("Content-Length") or 0)
-    try:
-        _save_stream_to_file(
-            response.iter_content(chunk_size=CHUNK_SIZE),
-            out_path=out_path,
-            content_type=content_type,
-            total_length=total_length,
-        )
-    except DownloadError:
-        raise
-    except Exception as exc:  # pylint: disable=broad-except
-        raise DownloadError(str(exc)) from exc
+    # Closing the response hands its connection back to the pool, including
+    # when the body is rejected part-way through.
+    with response:
+        try:
+            _save_stream_to_file(
+                response.iter_content(chunk_size=CHUNK_SIZE),
+                out_path=out_path,
+                content_type=content_type,
+                total_length=total_length,
+            )
+        except DownloadError:
+            raise
+        except Exception as exc:  # pylint: disable=broad-except
+            raise DownloadError(str(exc)) from exc
 
 
 def _download_with_urllib(url: str, out_path: Path) -> None:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from itertools import islice
 from pathlib import Path
 from typing import List
 
@@ -20,9 +21,12 @@ def extract_companies_from_workbook(
         sheet = workbook.active
         if sheet is None:
             raise ValueError("Error: Could not access worksheet")
-        rows = list(sheet.iter_rows(values_only=True))
         companies: List[Company] = []
-        for row in rows[header_row_index + 1 :]:
+        # Stream the rows below the header; read-only mode never holds the
+        # whole sheet in memory.
+        for row in islice(
+            sheet.iter_rows(values_only=True), header_row_index + 1, None
+        ):
             ticker_value = row[ticker_col_index]
             company_value = row[company_col_index]
             if (
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import binascii
+import hashlib
 import os
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional, Tuple
 
 
 def safe_write_text(path: Path, content: str) -> None:
@@ -12,3 +16,67 @@ def safe_write_text(path: Path, content: str) -> None:
         os.fsync(handle.fileno())
 
 
+def file_stat_key(path: Path) -> Optional[Tuple[str, int, int]]:
+    """(absolute path, mtime_ns, size) identifying a file's current contents.
+
+    Returns None when the file is missing. Caches keyed on this tuple miss as
+    soon as the file is replaced or modified. The path is made absolute
+    lexically rather than resolved, which skips a symlink walk per call.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return os.path.abspath(path), stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=256)
+def _token_for_key(key: str) -> str:
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+
+def file_cache_token(path: Path) -> str:
+    """Short hex digest of ``file_stat_key``, for naming on-disk cache entries."""
+    stat_key = file_stat_key(path)
+    if stat_key is None:
+        return _token_for_key(os.path.abspath(path))
+    return _token_for_key("::".join(str(part) for part in stat_key))
+
+
+# Base64 characters decoded per write; a multiple of 4 so every slice decodes on
+# its own and peak memory stays bounded however large the upload is.
+UPLOAD_DECODE_CHUNK_CHARS = 4 * 1024 * 1024
+
+
+def uploaded_pdf_payload(contents: str) -> str:
+    """Base64 body of a PDF data-URL upload; raises ValueError otherwise."""
+    if not contents:
+        raise ValueError("No upload payload provided.")
+    try:
+        header, encoded = contents.split(",", 1)
+    except ValueError as exc:
+        raise ValueError("Uploaded file payload is malformed.") from exc
+    if "pdf" not in header.lower():
+        raise ValueError("Uploaded file does not appear to be a PDF.")
+    return encoded
+
+
+def write_uploaded_pdf(encoded: str, destination: Path) -> None:
+    """Decode a base64 PDF payload straight into ``destination`` chunk by chunk."""
+    try:
+        with destination.open("wb") as handle:
+            for start in range(0, len(encoded), UPLOAD_DECODE_CHUNK_CHARS):
+                try:
+                    chunk = binascii.a2b_base64(
+                        encoded[start : start + UPLOAD_DECODE_CHUNK_CHARS]
+                    )
+                except (binascii.Error, ValueError) as exc:
+                    raise ValueError("Failed to decode uploaded PDF.") from exc
+                if start == 0 and not chunk.startswith(b"%PDF"):
+                    raise ValueError("Uploaded file is not a valid PDF document.")
+                handle.write(chunk)
+        if not encoded:
+            raise ValueError("Uploaded file is not a valid PDF document.")
+    except ValueError:
+        destination.unlink(missing_ok=True)
+        raise
@@ -1,54 +1,390 @@
 from __future__ import annotations
 
+import csv
 import io
+import json
+import os
+import re
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import redirect_stderr, redirect_stdout, suppress
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Pattern, Tuple
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Pattern, Tuple
 
 from PyPDF2 import PdfReader
 from PyPDF2.errors import DependencyError, PdfReadError
 
+from .files import file_cache_token, file_stat_key
+
 try:  # pragma: no cover - optional dependency
     import camelot  # type: ignore
 except ImportError:  # pragma: no cover
     camelot = None
 
+try:  # pragma: no cover - optional dependency
+    import pypdfium2 as pdfium  # type: ignore
+except ImportError:  # pragma: no cover
+    pdfium = None
+
+try:  # pragma: no cover - optional dependency
+    import pymupdf as fitz  # type: ignore
+except ImportError:  # pragma: no cover
+    try:
+        import fitz  # type: ignore  # PyMuPDF < 1.24.3
+    except ImportError:
+        fitz = None
+
+try:  # pragma: no cover - optional dependency
+    import hyperscan  # type: ignore
+except ImportError:  # pragma: no cover
+    hyperscan = None
+
+try:  # pragma: no cover - optional dependency
+    import re2  # type: ignore
+except ImportError:  # pragma: no cover
+    re2 = None
+
 CAMEL0T_AVAILABLE = camelot is not None
 
 
+# Full-document page text, one directory per file_cache_token.
+_TEXT_CACHE_BASE = Path("extracted/text_cache")
+
+# Below this many pages, starting worker processes costs more than it saves.
+PARALLEL_MIN_PAGES = 8
+
+
 def camelot_available() -> bool:
     return CAMEL0T_AVAILABLE
 
 
-def extract_pdf_text(pdf_path: Path, *, max_pages: Optional[int] = None) -> List[str]:
-    pages: List[str] = []
+@lru_cache(maxsize=4)
+def _cached_reader(pdf_path: str, mtime_ns: int, size: int) -> PdfReader:
+    return PdfReader(pdf_path)
+
+
+def _open_reader(pdf_path: str) -> PdfReader:
+    """PyPDF2 reader, reused while the file's (path, mtime, size) is unchanged.
+
+    Counting pages and then extracting them parses the xref once instead of
+    twice. Only a few readers are kept, as each holds the file in memory.
+    """
+    stat_key = file_stat_key(Path(pdf_path))
+    if stat_key is None:
+        return PdfReader(pdf_path)
+    return _cached_reader(*stat_key)
+
+
+def _pdfium_page_texts(
+    pdf_path: str, start: int, stop: Optional[int]
+) -> Optional[Iterator[str]]:
+    """Page texts via PDFium, or None when it is missing or cannot open the file."""
+    if pdfium is None:
+        return None
+    try:
+        document = pdfium.PdfDocument(pdf_path)
+    except Exception:
+        return None
+
+    def pages() -> Iterator[str]:
+        try:
+            end = len(document) if stop is None else min(stop, len(document))
+            for page_index in range(start, end):
+                text_content = ""
+                with suppress(Exception):
+                    text_content = (
+                        document[page_index]
+                        .get_textpage()
+                        .get_text_range()
+                        .replace("\r\n", "\n")
+                    )
+                yield text_content
+        finally:
+            document.close()
+
+    return pages()
+
+
+# Text-only extraction: no image blocks and no ligature glyphs (so "ﬁ" comes
+# out as "fi" for keyword matching), clipped to the visible page.
+_PYMUPDF_TEXT_FLAGS = (
+    fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP if fitz is not None else 0
+)
+
+
+def _pymupdf_page_texts(
+    pdf_path: str, start: int, stop: Optional[int]
+) -> Optional[Iterator[str]]:
+    """Page texts via PyMuPDF, or None when it is missing or cannot open the file."""
+    if fitz is None:
+        return None
+    try:
+        document = fitz.open(pdf_path)
+    except Exception:
+        return None
+
+    def pages() -> Iterator[str]:
+        try:
+            end = (
+                document.page_count if stop is None else min(stop, document.page_count)
+            )
+            for page_index in range(start, end):
+                text_content = ""
+                with suppress(Exception):
+                    text_content = document[page_index].get_text(
+                        "text", flags=_PYMUPDF_TEXT_FLAGS
+                    )
+                yield text_content
+        finally:
+            document.close()
+
+    return pages()
+
+
+# Native-code extractors, tried in order before the pure-Python PyPDF2 reader.
+_NATIVE_PAGE_TEXTS = (_pdfium_page_texts, _pymupdf_page_texts)
+
+
+def _page_texts(
+    pdf_path: str, start: int = 0, stop: Optional[int] = None
+) -> Iterator[str]:
+    """Text of pages ``start``..``stop`` from the first engine that opens the file.
+
+    PDFium and PyMuPDF extract in native code; PyPDF2 remains the fallback
+    when neither is installed or both reject the file.
+    """
+    for native_page_texts in _NATIVE_PAGE_TEXTS:
+        native_pages = native_page_texts(pdf_path, start, stop)
+        if native_pages is not None:
+            yield from native_pages
+            return
     try:
-        reader = PdfReader(str(pdf_path))
+        reader = _open_reader(pdf_path)
     except DependencyError as exc:
         print(
             f"[pdf] WARN: unable to read {pdf_path} (missing dependency: {exc})",
             flush=True,
         )
-        return pages
+        return
     except (PdfReadError, OSError):
-        return pages
-    for page_index, page in enumerate(reader.pages):
+        return
+    end = len(reader.pages) if stop is None else min(stop, len(reader.pages))
+    for page_index in range(start, end):
         text_content = ""
         with suppress(Exception):
-            text_content = page.extract_text() or ""
-        pages.append(text_content)
-        if max_pages is not None and page_index + 1 >= max_pages:
-            break
+            text_content = reader.pages[page_index].extract_text() or ""
+        yield text_content
+
+
+def _page_count(pdf_path: str) -> Optional[int]:
+    if pdfium is not None:
+        with suppress(Exception):
+            document = pdfium.PdfDocument(pdf_path)
+            try:
+                return len(document)
+            finally:
+                document.close()
+    if fitz is not None:
+        with suppress(Exception):
+            with fitz.open(pdf_path) as document:
+                return document.page_count
+    try:
+        return len(_open_reader(pdf_path).pages)
+    except (DependencyError, PdfReadError, OSError):
+        return None
+
+
+def iter_pdf_text(pdf_path: Path, *, max_pages: Optional[int] = None) -> Iterator[str]:
+    """Yield each page's text in order, one page at a time.
+
+    Unreadable documents yield nothing and pages that fail to extract yield
+    ``""``. Callers that stop early never pay for the remaining pages.
+    """
+    return _page_texts(str(pdf_path), 0, max_pages)
+
+
+def _extract_page_range(task: Tuple[str, int, int]) -> List[str]:
+    """Worker: text for pages ``start``..``stop`` of one PDF, opened once."""
+    path, start, stop = task
+    texts = list(_page_texts(path, start, stop))
+    return texts + [""] * (stop - start - len(texts))
+
+
+def extract_pdf_text(
+    pdf_path: Path,
+    *,
+    max_pages: Optional[int] = None,
+    workers: int = 1,
+) -> List[str]:
+    """Text of each page, in order.
+
+    With ``workers > 1`` and at least ``PARALLEL_MIN_PAGES`` pages, contiguous
+    page ranges are extracted in separate processes, since text extraction
+    is CPU-bound.
+    """
+    if workers <= 1:
+        return list(iter_pdf_text(pdf_path, max_pages=max_pages))
+    page_count = _page_count(str(pdf_path))
+    if page_count is None:
+        # Let the serial path report (or quietly skip) the unreadable file.
+        return list(iter_pdf_text(pdf_path, max_pages=max_pages))
+    if max_pages is not None:
+        page_count = min(page_count, max_pages)
+    if page_count < PARALLEL_MIN_PAGES:
+        return list(iter_pdf_text(pdf_path, max_pages=max_pages))
+    workers = min(workers, page_count)
+    bounds = [page_count * part // workers for part in range(workers + 1)]
+    tasks = [(str(pdf_path), start, stop) for start, stop in zip(bounds, bounds[1:])]
+    pages: List[str] = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for texts in executor.map(_extract_page_range, tasks):
+            pages.extend(texts)
     return pages
 
 
-def keyword_hit_pages(pages: List[str], keyword_re: Pattern[str]) -> List[int]:
-    hits: List[int] = []
-    for idx, text in enumerate(pages):
-        if text and keyword_re.search(text):
-            hits.append(idx)
-    return hits
+_RE2_INLINE_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"))
+
+
+@lru_cache(maxsize=32)
+def _re2_search(source: str, flags: int) -> Optional[Any]:
+    """RE2 search for a compiled ``re`` pattern, or None if RE2 can't run it."""
+    if re2 is None or isinstance(source, bytes) or flags & re.VERBOSE:
+        return None
+    inline = "".join(letter for flag, letter in _RE2_INLINE_FLAGS if flags & flag)
+    try:
+        return re2.compile(f"(?{inline}){source}" if inline else source).search
+    except Exception:
+        # Backreferences, lookaround and the like are outside RE2's syntax.
+        return None
+
+
+@lru_cache(maxsize=32)
+def _hyperscan_matcher(source: str, flags: int) -> Optional[Callable[[str], bool]]:
+    """Hyperscan "does this page match" test, or None if it can't run the pattern."""
+    if hyperscan is None or isinstance(source, bytes) or flags & re.VERBOSE:
+        return None
+    hs_flags = hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_SINGLEMATCH
+    for flag, hs_flag in (
+        (re.IGNORECASE, hyperscan.HS_FLAG_CASELESS),
+        (re.MULTILINE, hyperscan.HS_FLAG_MULTILINE),
+        (re.DOTALL, hyperscan.HS_FLAG_DOTALL),
+    ):
+        if flags & flag:
+            hs_flags |= hs_flag
+    database = None
+    # UCP keeps \s and \w Unicode-aware like ``re``, but Hyperscan rejects \b
+    # under UCP; those patterns compile with ASCII classes instead, which only
+    # differs next to non-ASCII letters.
+    for extra_flags in (hyperscan.HS_FLAG_UCP, 0):
+        candidate = hyperscan.Database()
+        try:
+            candidate.compile(
+                expressions=[source.encode("utf-8")], flags=[hs_flags | extra_flags]
+            )
+        except Exception:
+            continue
+        database = candidate
+        break
+    if database is None:
+        # Backreferences and lookaround are outside Hyperscan's syntax.
+        return None
+
+    def matches(text: str) -> bool:
+        found = False
+
+        def on_match(*_: Any) -> bool:
+            nonlocal found
+            found = True
+            return True  # stop the scan
+
+        with suppress(Exception):
+            # Stopping early surfaces as a scan-terminated error.
+            database.scan(text.encode("utf-8"), match_event_handler=on_match)
+        return found
+
+    return matches
+
+
+def _page_search(keyword_re: Pattern[str]) -> Callable[[str], Any]:
+    """Fastest available per-page test: Hyperscan, then RE2, then ``re``."""
+    return (
+        _hyperscan_matcher(keyword_re.pattern, keyword_re.flags)
+        or _re2_search(keyword_re.pattern, keyword_re.flags)
+        or keyword_re.search
+    )
+
+
+def load_or_extract_pdf_text(
+    pdf_path: Path, *, max_pages: Optional[int] = None
+) -> List[str]:
+    """``extract_pdf_text`` backed by an on-disk cache of the full page list.
+
+    Entries are keyed by the PDF's path, mtime and size, so an edited file
+    misses. Only complete extractions are written; a ``max_pages`` call is
+    served from an existing entry but never creates a truncated one.
+    """
+    cache_path = _TEXT_CACHE_BASE / file_cache_token(pdf_path) / "pages.json"
+    with suppress(OSError, ValueError):
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        if isinstance(cached, list):
+            return cached if max_pages is None else cached[:max_pages]
+    pages = extract_pdf_text(pdf_path, max_pages=max_pages)
+    if max_pages is None and pages:
+        with suppress(OSError):
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".json.part")
+            tmp_path.write_text(json.dumps(pages, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, cache_path)
+    return pages
+
+
+@dataclass(frozen=True)
+class PdfScan:
+    """Keyword scan of one PDF; ``pages`` keeps text only for hit pages."""
+
+    page_count: int
+    total_chars: int
+    hit_pages: List[int]
+    pages: List[str]
+
+
+def scan_pdf(
+    pdf_path: Path,
+    keyword_re: Pattern[str],
+    *,
+    max_pages: Optional[int] = None,
+    workers: int = 1,
+) -> PdfScan:
+    """Extract and keyword-scan a PDF in one pass, dropping non-hit page text.
+
+    Each page is searched as it is extracted, so only hit pages are retained;
+    the rest are kept as ``""`` so indices still line up for
+    ``build_text_snippet``.
+    """
+    search = _page_search(keyword_re)
+    texts: Iterable[str] = (
+        extract_pdf_text(pdf_path, max_pages=max_pages, workers=workers)
+        if workers > 1
+        else iter_pdf_text(pdf_path, max_pages=max_pages)
+    )
+    pages: List[str] = []
+    hit_pages: List[int] = []
+    total_chars = 0
+    for idx, text in enumerate(texts):
+        total_chars += len(text)
+        if text and search(text):
+            hit_pages.append(idx)
+            pages.append(text)
+        else:
+            pages.append("")
+    return PdfScan(
+        page_count=len(pages),
+        total_chars=total_chars,
+        hit_pages=hit_pages,
+        pages=pages,
+    )
 
 
 def build_text_snippet(
@@ -60,21 +396,21 @@ def build_text_snippet(
     if not selected_pages:
         return "", []
     chosen: List[int] = []
-    seen: set[int] = set()
+    seen = bytearray(len(pages))
     for index in selected_pages:
-        if index in seen:
-            continue
-        if 0 <= index < len(pages):
+        if 0 <= index < len(pages) and not seen[index]:
+            seen[index] = 1
             chosen.append(index)
-            seen.add(index)
     buffer: List[str] = []
+    total_chars = 0
     for index in chosen:
         page_text = (pages[index] or "").strip()
         if not page_text:
             continue
-        header = f"\n\n=== Page {index + 1} ===\n"
-        buffer.append(header + page_text)
-        if sum(len(segment) for segment in buffer) >= max_chars:
+        segment = f"\n\n=== Page {index + 1} ===\n" + page_text
+        buffer.append(segment)
+        total_chars += len(segment)
+        if total_chars >= max_chars:
             break
     return "".join(buffer).strip(), chosen
 
@@ -112,8 +448,18 @@ def extract_scope_tables(
         dataframe = table.df
         if dataframe is None or dataframe.empty:
             continue
+        rows = dataframe.values.tolist()
+        # Cheap reject on the raw cells before building CSV text. Joining every
+        # cell with newlines keeps row-spanning matches, and patterns that never
+        # touch commas or quotes can only match the CSV where they match here.
+        if pattern and not pattern.search(
+            "\n".join(cell for row in rows for cell in row)
+        ):
+            continue
+        # camelot cells are plain strings, so csv.writer over the raw rows gives
+        # the same text as DataFrame.to_csv without its per-cell formatting.
         csv_buffer = io.StringIO()
-        dataframe.to_csv(csv_buffer, index=False, header=False)
+        csv.writer(csv_buffer, lineterminator="\n").writerows(rows)
         csv_text = csv_buffer.getvalue()
         if not csv_text.strip():
             continue
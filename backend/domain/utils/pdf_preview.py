@@ -1,65 +1,157 @@
 from __future__ import annotations
 
 import base64
-import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable, List, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .files import file_cache_token
 
 try:  # pragma: no cover - optional dependency
     from pdf2image import convert_from_path
 except ImportError:  # pragma: no cover
     convert_from_path = None
 
+try:  # pragma: no cover - optional dependency
+    import pymupdf as fitz  # type: ignore
+except ImportError:  # pragma: no cover
+    try:
+        import fitz  # type: ignore  # PyMuPDF < 1.24.3
+    except ImportError:
+        fitz = None
+
 _PREVIEW_BASE = Path("extracted/previews")
+# pdftoppm runs in its own process per page, so threads render in parallel.
+_MAX_RENDER_WORKERS = min(8, os.cpu_count() or 1)
+# Encoded previews keyed by PNG path. The path embeds the PDF's mtime and size,
+# so a replaced PDF never hits a stale entry.
+_DATA_URL_CACHE_SIZE = 64
+_data_url_cache: "OrderedDict[Path, str]" = OrderedDict()
+# Previews are served from the API threadpool, Dash callbacks and the render
+# workers, so every cache read-modify happens under this lock.
+_data_url_lock = threading.Lock()
 
 
-def _cache_token(pdf_path: Path) -> str:
-    try:
-        stat = pdf_path.stat()
-        key = f"{pdf_path.resolve()}::{stat.st_mtime_ns}::{stat.st_size}"
-    except FileNotFoundError:
-        key = str(pdf_path.resolve())
-    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
-    return digest[:16]
+def _remember_data_url(image_path: Path, png_bytes: bytes) -> str:
+    data_url = "data:image/png;base64," + base64.b64encode(png_bytes).decode("ascii")
+    with _data_url_lock:
+        _data_url_cache[image_path] = data_url
+        if len(_data_url_cache) > _DATA_URL_CACHE_SIZE:
+            _data_url_cache.popitem(last=False)
+    return data_url
+
 
+def _cached_data_url(image_path: Path) -> Optional[str]:
+    with _data_url_lock:
+        data_url = _data_url_cache.get(image_path)
+        if data_url is not None:
+            _data_url_cache.move_to_end(image_path)
+    return data_url
 
-def _preview_path(pdf_path: Path, page_number: int) -> Path:
-    token = _cache_token(pdf_path)
+
+def _preview_path(token: str, page_number: int) -> Path:
     return _PREVIEW_BASE / token / f"page-{page_number}.png"
 
 
+def _render_page(pdf_path: Path, page: int, dpi: int, out_path: Path) -> bool:
+    try:
+        images = convert_from_path(
+            str(pdf_path),
+            dpi=dpi,
+            first_page=page,
+            last_page=page,
+            fmt="png",
+        )
+    except Exception:  # pragma: no cover - pdf2image runtime errors
+        return False
+    if not images:
+        return False
+    images[0].save(out_path, format="PNG")
+    return True
+
+
+def _render_with_pymupdf(
+    pdf_path: Path, pages: List[int], dpi: int, out_paths: Dict[int, Path]
+) -> Dict[int, bool]:
+    """Render ``pages`` in-process from one open document.
+
+    Returns an empty dict when PyMuPDF cannot open the file, so the caller
+    can fall back to pdf2image.
+    """
+    try:
+        document = fitz.open(str(pdf_path))
+    except Exception:
+        return {}
+    rendered: Dict[int, bool] = {}
+    try:
+        for page in pages:
+            rendered[page] = False
+            if page > document.page_count:
+                continue
+            try:
+                pixmap = document.load_page(page - 1).get_pixmap(dpi=dpi)
+                png_bytes = pixmap.tobytes("png")
+                out_paths[page].write_bytes(png_bytes)
+            except Exception:  # pragma: no cover - MuPDF runtime errors
+                continue
+            # Encode from the bytes already in hand so the data URL never
+            # reads the PNG back from disk.
+            _remember_data_url(out_paths[page], png_bytes)
+            rendered[page] = True
+    finally:
+        document.close()
+    return rendered
+
+
+def _render_with_pdf2image(
+    pdf_path: Path, pages: List[int], dpi: int, out_paths: Dict[int, Path]
+) -> Dict[int, bool]:
+    workers = min(_MAX_RENDER_WORKERS, len(pages))
+    if workers <= 1:
+        outcomes = [_render_page(pdf_path, page, dpi, out_paths[page]) for page in pages]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(
+                executor.map(
+                    lambda page: _render_page(pdf_path, page, dpi, out_paths[page]),
+                    pages,
+                )
+            )
+    return dict(zip(pages, outcomes))
+
+
 def ensure_page_previews(
     pdf_path: Path,
     pages: Iterable[int],
     *,
     dpi: int = 160,
 ) -> List[Tuple[int, Path]]:
-    if convert_from_path is None:
+    if fitz is None and convert_from_path is None:
         return []
     unique_pages = sorted({page for page in pages if page and page > 0})
     if not unique_pages:
         return []
 
-    results: List[Tuple[int, Path]] = []
-    for page in unique_pages:
-        out_path = _preview_path(pdf_path, page)
-        if not out_path.exists():
-            out_path.parent.mkdir(parents=True, exist_ok=True)
-            try:
-                images = convert_from_path(
-                    str(pdf_path),
-                    dpi=dpi,
-                    first_page=page,
-                    last_page=page,
-                    fmt="png",
-                )
-            except Exception:  # pragma: no cover - pdf2image runtime errors
-                continue
-            if not images:
-                continue
-            images[0].save(out_path, format="PNG")
-        results.append((page, out_path))
-    return results
+    token = file_cache_token(pdf_path)
+    out_paths = {page: _preview_path(token, page) for page in unique_pages}
+    missing = [page for page in unique_pages if not out_paths[page].exists()]
+    rendered = {page: True for page in unique_pages}
+    if missing:
+        out_paths[missing[0]].parent.mkdir(parents=True, exist_ok=True)
+        # PyMuPDF renders in-process without a pdftoppm spawn per page;
+        # pdf2image remains the fallback.
+        outcomes = (
+            _render_with_pymupdf(pdf_path, missing, dpi, out_paths)
+            if fitz is not None
+            else {}
+        )
+        if not outcomes and convert_from_path is not None:
+            outcomes = _render_with_pdf2image(pdf_path, missing, dpi, out_paths)
+        rendered.update({page: outcomes.get(page, False) for page in missing})
+    return [(page, out_paths[page]) for page in unique_pages if rendered[page]]
 
 
 def previews_as_data_urls(
@@ -68,11 +160,14 @@ def previews_as_data_urls(
     previews = ensure_page_previews(pdf_path, pages)
     data_urls: List[Tuple[int, str]] = []
     for page, image_path in previews:
-        try:
-            encoded = base64.b64encode(image_path.read_bytes()).decode("ascii")
-        except OSError:
-            continue
-        data_urls.append((page, f"data:image/png;base64,{encoded}"))
+        data_url = _cached_data_url(image_path)
+        if data_url is None:
+            try:
+                png_bytes = image_path.read_bytes()
+            except OSError:
+                continue
+            data_url = _remember_data_url(image_path, png_bytes)
+        data_urls.append((page, data_url))
     return data_urls
 
 
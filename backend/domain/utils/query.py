@@ -14,6 +14,37 @@ from backend.domain.utils.documents import (
 )
 from ..models import SearchRecord
 
+# Extensions derive_filename keeps; anything else is saved as report.pdf.
+_FILENAME_EXTENSIONS = frozenset({"pdf", "csv", "xlsx", "txt", "html", "htm"})
+# Every (overlapping) year or FY token, so set lookups match substring tests.
+_YEAR_TOKEN_RE = re.compile(r"(?=(20\d\d|fy\d\d))")
+# execute_llm_search instructions, dedented once; only the query varies.
+_INSTRUCTIONS_TEMPLATE = dedent(
+    """
+    ## Objective
+    Return the direct .pdf URL for the company's official 2025 (or FY25) sustainability/ESG/climate/annual report.
+    Output only the minimal fields listed below.
+
+    ## One-shot web search
+    - You have ONE web_search call. Form a precise query:
+      "{search_prompt}"
+    - Selection priorities:
+      1) Prefer a 2025 sustainability/ESG/climate/TCFD PDF.
+      2) If no 2025 (or FY25) sustainability/ESG/climate/TCFD PDF exists, return a 2025 (or FY25) annual report PDF.
+      3) Only fall back to a 2024 sustainability/ESG/climate/TCFD PDF if no 2025 PDFs exist.
+    - Never return 2023 (or earlier) documents unless explicitly instructed.
+    - Ensure the link is a direct PDF (ends with .pdf) on an official domain/CDN.
+
+    ## Output (structured, ONLY these fields)
+    - url: direct .pdf URL (empty if none qualify)
+    - title: report title
+    - filename: file name
+    - year: "2025" or "2024"
+
+    The URL you provide MUST end in ".pdf".
+    """
+).strip()
+
 
 @dataclass(frozen=True)
 class QueryConfig:
@@ -68,31 +99,7 @@ def execute_llm_search(
     input_text = f'{{"name": "{company}", "ticker": "{ticker}"}}'
     search_prompt = build_web_search_prompt(company)
     dbg(f"[s0] search prompt: {search_prompt}")
-    instructions = dedent(
-        f"""
-        ## Objective
-        Return the direct .pdf URL for the company's official 2025 (or FY25) sustainability/ESG/climate/annual report.
-        Output only the minimal fields listed below.
-
-        ## One-shot web search
-        - You have ONE web_search call. Form a precise query:
-          "{search_prompt}"
-        - Selection priorities:
-          1) Prefer a 2025 sustainability/ESG/climate/TCFD PDF.
-          2) If no 2025 (or FY25) sustainability/ESG/climate/TCFD PDF exists, return a 2025 (or FY25) annual report PDF.
-          3) Only fall back to a 2024 sustainability/ESG/climate/TCFD PDF if no 2025 PDFs exist.
-        - Never return 2023 (or earlier) documents unless explicitly instructed.
-        - Ensure the link is a direct PDF (ends with .pdf) on an official domain/CDN.
-
-        ## Output (structured, ONLY these fields)
-        - url: direct .pdf URL (empty if none qualify)
-        - title: report title
-        - filename: file name
-        - year: "2025" or "2024"
-
-        The URL you provide MUST end in ".pdf".
-        """
-    ).strip()
+    instructions = _INSTRUCTIONS_TEMPLATE.format(search_prompt=search_prompt)
 
     dbg(
         f"[s0] Invoking responses.parse with web_search tool, instructions: {instructions}"
@@ -132,18 +139,17 @@ def map_llm_response_to_record(
         filename = derive_filename(url, record.filename or "")
         title = (record.title or "").strip() or filename
 
-        text = f"{title} {filename} {url}".lower()
-        has_2025 = ("2025" in text) or ("fy25" in text)
-        has_2024 = ("2024" in text) or ("fy24" in text)
-        has_2023 = ("2023" in text) or ("fy23" in text)
-
         selected_year = infer_year_from_text(title, filename, url)
         if not selected_year:
-            if has_2025:
+            # One scan collects every year token instead of six substring scans.
+            tokens = set(
+                _YEAR_TOKEN_RE.findall(f"{title} {filename} {url}".lower())
+            )
+            if "2025" in tokens or "fy25" in tokens:
                 selected_year = "2025"
-            elif has_2024:
+            elif "2024" in tokens or "fy24" in tokens:
                 selected_year = "2024"
-            elif has_2023:
+            elif "2023" in tokens or "fy23" in tokens:
                 selected_year = "2023"
             else:
                 dbg(
@@ -178,6 +184,7 @@ def derive_filename(url: str, fallback: str) -> str:
     except (AttributeError, ValueError):
         path_name = ""
     source = path_name or (fallback or "").strip()
-    if not re.search(r"\.(pdf|csv|xlsx|txt|html|htm)$", (source or "").lower()):
+    _, dot, extension = source.rpartition(".")
+    if not dot or extension.lower() not in _FILENAME_EXTENSIONS:
         return "report.pdf"
     return source
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from pathlib import Path
+import os
+from enum import IntEnum
 from typing import Optional
 
 from ..models import Company, EmissionsData
@@ -9,7 +10,9 @@ from ..models import Company, EmissionsData
 def _path_exists(path: Optional[str]) -> bool:
     if not path:
         return False
-    return Path(path).expanduser().resolve().exists()
+    # exists() already follows symlinks, so resolve()'s per-component lstat
+    # walk bought nothing but syscalls.
+    return os.path.exists(os.path.expanduser(path))
 
 
 def emissions_complete(emissions: Optional[EmissionsData]) -> bool:
@@ -24,43 +27,79 @@ def emissions_complete(emissions: Optional[EmissionsData]) -> bool:
     return True
 
 
-def needs_search(company: Company) -> bool:
-    record = company.search_record
-    return not (record and record.url)
-
-
-def needs_download(company: Company, verify_path: bool = True) -> bool:
-    if needs_search(company):
-        return False
-    record = company.download_record
-    pdf_path = record.pdf_path if record else None
-    if not pdf_path:
-        return True
-    if verify_path and not _path_exists(pdf_path):
-        return True
-    return False
+class Stage(IntEnum):
+    SEARCH = 0
+    DOWNLOAD = 1
+    EXTRACT = 2
+    VERIFY = 3
+    DONE = 4
 
 
-def needs_extraction(company: Company, verify_path: bool = True) -> bool:
-    if needs_download(company, verify_path=verify_path):
-        return False
+def _extraction_complete(company: Company, verify_path: bool) -> bool:
     record = company.extraction_record
     if record is None:
-        return True
+        return False
 
     has_text = bool(record.text_path)
     has_tables = record.table_count > 0 and bool(record.table_path)
 
     if not has_text and not has_tables:
-        return True
+        return False
 
     if not verify_path:
-        return False
+        return True
 
     text_exists = _path_exists(record.text_path) if has_text else False
     table_exists = _path_exists(record.table_path) if has_tables else False
 
-    return not (text_exists or table_exists)
+    return text_exists or table_exists
+
+
+def compute_next_stage(
+    company: Company,
+    verify_path: bool = True,
+    *,
+    upto: Stage = Stage.DONE,
+) -> Stage:
+    """Return the earliest pipeline stage this company has not completed.
+
+    Checks stop at ``upto``: if every earlier stage is complete, ``upto`` is
+    returned without looking at it, which spares callers that only care about
+    one stage the stat() calls for the ones after it.
+    """
+    record = company.search_record
+    if not (record and record.url):
+        return Stage.SEARCH
+    if upto <= Stage.DOWNLOAD:
+        return upto
+    download = company.download_record
+    pdf_path = download.pdf_path if download else None
+    if not pdf_path or (verify_path and not _path_exists(pdf_path)):
+        return Stage.DOWNLOAD
+    if upto <= Stage.EXTRACT:
+        return upto
+    if not _extraction_complete(company, verify_path):
+        return Stage.EXTRACT
+    if upto <= Stage.VERIFY:
+        return upto
+    if not emissions_complete(company.emissions):
+        return Stage.VERIFY
+    return Stage.DONE
+
+
+def needs_search(company: Company) -> bool:
+    record = company.search_record
+    return not (record and record.url)
+
+
+def needs_download(company: Company, verify_path: bool = True) -> bool:
+    stage = compute_next_stage(company, verify_path=verify_path, upto=Stage.EXTRACT)
+    return stage == Stage.DOWNLOAD
+
+
+def needs_extraction(company: Company, verify_path: bool = True) -> bool:
+    stage = compute_next_stage(company, verify_path=verify_path, upto=Stage.VERIFY)
+    return stage == Stage.EXTRACT
 
 
 def needs_verification(company: Company) -> bool:
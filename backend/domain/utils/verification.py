@@ -1,15 +1,18 @@
 from __future__ import annotations
 
+import json
 import re
 import time
 from contextlib import suppress
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from openai import OpenAI
 from pydantic import BaseModel, Field
 
-from rapidfuzz import fuzz
+import numpy as np
+from rapidfuzz import fuzz, process
 from backend.domain.models import (
     AnalysisRecord,
     Company,
@@ -61,6 +64,9 @@ def get_or_create_vector_store(client: OpenAI, store_file: Path) -> str:
     return store.id
 
 
+_ATTACH_POLL_DELAYS = (0.05, 0.1, 0.2, 0.5, 1.0, 2.0)
+
+
 def attach_file_to_vector_store(
     client: OpenAI,
     vector_store_id: str,
@@ -68,11 +74,20 @@ def attach_file_to_vector_store(
 ) -> None:
     with path.open("rb") as file_handle:
         file_resource = client.files.create(file=file_handle, purpose="assistants")
-    client.vector_stores.files.create(
+    attached = client.vector_stores.files.create(
         vector_store_id=vector_store_id,
         file_id=file_resource.id,
     )
-    time.sleep(1.0)
+    # Wait for indexing to finish rather than a fixed pause, backing off
+    # between polls and giving up after a few seconds.
+    status = attached.status
+    for delay in _ATTACH_POLL_DELAYS:
+        if status in ("completed", "failed", "cancelled"):
+            break
+        time.sleep(delay)
+        status = client.vector_stores.files.retrieve(
+            file_resource.id, vector_store_id=vector_store_id
+        ).status
 
 
 _SCOPE_PATTERNS = {
@@ -96,10 +111,33 @@ _SCOPE_PATTERNS = {
     ),
 }
 
+
+def _flatten_scope_patterns() -> tuple[list[str], dict[str, slice]]:
+    """All scope patterns as one list for cdist, plus each scope's column slice."""
+    flat: list[str] = []
+    columns: dict[str, slice] = {}
+    for scope_key, patterns in _SCOPE_PATTERNS.items():
+        columns[scope_key] = slice(len(flat), len(flat) + len(patterns))
+        flat.extend(patterns)
+    return flat, columns
+
+
+_ALL_SCOPE_PATTERNS, _SCOPE_PATTERN_COLUMNS = _flatten_scope_patterns()
+# Minimum partial_ratio for a line to be taken as a scope's candidate.
+_MIN_SCOPE_SCORE = 60
+
+# Lines that name a scope ("scope 1", "scope ii", ...). Only these are fuzzy
+# scored, unless the snippet has none.
+_SCOPE_LINE_RE = re.compile(r"scope\s*[1-3i]{1,3}")
+
+# The number part is possessive (Python 3.11+): everything after it is
+# optional, so backtracking into it could never turn a failure into a match.
 _VALUE_RE = re.compile(
-    r"(-?\d[\d,\s]*(?:\.\d+)?)\s*(mt|kt|t|kg)?(?:\s*(?:co2e|co₂e|co2|tonnes|tons))?",
+    r"(-?\d[\d,\s]*+(?:\.\d+)?+)\s*(mt|kt|t|kg)?(?:\s*(?:co2e|co₂e|co2|tonnes|tons))?",
     re.IGNORECASE,
 )
+# _VALUE_RE needs a digit to match, so lines without one can skip it.
+_HAS_DIGIT = re.compile(r"\d").search
 
 _UNIT_HINTS = (
     ("mtco2", "mt"),
@@ -114,6 +152,10 @@ _UNIT_HINTS = (
     ("tons co2", "t"),
 )
 
+_UNIT_FACTORS = {"kg": 1, "t": 1_000, "kt": 1_000_000, "mt": 1_000_000_000}
+_NEAR_UNIT_TOKENS = ("mt", "kt", "tco", "t ", "kg")
+_UNIT_TOKENS = ("tco", "tonne", "ton ", "co2", "ghg", "kt", "mt")
+
 _METHOD_HINTS = (
     ("market-based", "market"),
     ("market based", "market"),
@@ -135,24 +177,46 @@ _CONTEXT_KEYWORDS = (
     "ktco",
     "mtco",
 )
+_CONTEXT_KEYWORD_RE = re.compile("|".join(map(re.escape, _CONTEXT_KEYWORDS)))
+
+
+def _scope_candidate_lines(lowered_lines: list[str]) -> list[tuple[int, str]]:
+    """Lines worth fuzzy-scoring: those naming a scope, else every line."""
+    candidates = [
+        (idx, lowered)
+        for idx, lowered in enumerate(lowered_lines)
+        if _SCOPE_LINE_RE.search(lowered)
+    ]
+    return candidates or list(enumerate(lowered_lines))
+
+
+def _find_scope_candidates(
+    candidates: list[tuple[int, str]],
+) -> dict[str, tuple[Optional[int], float]]:
+    """Best (line index, score) per scope, from one score matrix."""
+    if not candidates:
+        return {scope_key: (None, 0) for scope_key in _SCOPE_PATTERNS}
+    indices = [idx for idx, _ in candidates]
+    matrix = process.cdist(
+        [lowered for _, lowered in candidates],
+        _ALL_SCOPE_PATTERNS,
+        scorer=fuzz.partial_ratio,
+        dtype=np.float64,
+        # Lines below the acceptance threshold are rejected anyway, so let
+        # RapidFuzz stop scoring them early (they come back as 0).
+        score_cutoff=_MIN_SCOPE_SCORE,
+    )
+    best: dict[str, tuple[Optional[int], float]] = {}
+    for scope_key, columns in _SCOPE_PATTERN_COLUMNS.items():
+        line_scores = matrix[:, columns].max(axis=1)
+        row = int(line_scores.argmax())
+        best[scope_key] = (indices[row], float(line_scores[row]))
+    return best
 
 
-def _find_scope_candidate(lines: list[str], patterns: tuple[str, ...]):
-    best_idx: Optional[int] = None
-    best_score = 0
-    for idx, line in enumerate(lines):
-        lowered = line.lower()
-        for pattern in patterns:
-            score = fuzz.partial_ratio(lowered, pattern)
-            if score > best_score:
-                best_score = score
-                best_idx = idx
-    return best_idx, best_score
-
-
-def _infer_unit(context: str, explicit: Optional[str]) -> str:
+def _infer_unit(lowered: str, explicit: Optional[str]) -> str:
+    """Unit for a match, given the already-lowercased context it sits in."""
     unit = (explicit or "").lower()
-    lowered = context.lower()
     for hint, mapped in _UNIT_HINTS:
         if hint in lowered:
             return mapped
@@ -168,7 +232,7 @@ def _infer_unit(context: str, explicit: Optional[str]) -> str:
 
 
 def _extract_numeric_value(
-    lines: list[str], base_index: int
+    lines: list[str], lowered_lines: list[str], base_index: int
 ) -> tuple[Optional[int], Optional[str], int, bool]:
     search_order = [0, 1, -1, 2, -2, 3]
     for offset in search_order:
@@ -176,9 +240,14 @@ def _extract_numeric_value(
         if idx < 0 or idx >= len(lines):
             continue
         line = lines[idx]
+        if not _HAS_DIGIT(line):
+            continue
         matches = list(_VALUE_RE.finditer(line))
         if not matches:
             continue
+        context = f"{lines[base_index]} {line}"
+        context_lower = f"{lowered_lines[base_index]} {lowered_lines[idx]}"
+        context_has_unit = any(token in context_lower for token in _UNIT_TOKENS)
         best_candidate: Optional[tuple[int, int, float, str, str, bool]] = None
         for match in matches:
             raw_value = match.group(1)
@@ -190,14 +259,8 @@ def _extract_numeric_value(
             except ValueError:
                 continue
             explicit_unit = match.group(2)
-            context = f"{lines[base_index]} {line}"
-            unit = _infer_unit(context, explicit_unit)
-            factor = {
-                "kg": 1,
-                "t": 1_000,
-                "kt": 1_000_000,
-                "mt": 1_000_000_000,
-            }.get(unit, 1_000)
+            unit = _infer_unit(context_lower, explicit_unit)
+            factor = _UNIT_FACTORS.get(unit, 1_000)
             value = int(round(number * factor))
             if value <= 0:
                 continue
@@ -205,12 +268,9 @@ def _extract_numeric_value(
                 max(0, match.start() - 6) : match.end() + 12
             ].lower()
             near_unit = bool(explicit_unit) or any(
-                token in lowered_segment for token in ("mt", "kt", "tco", "t ", "kg")
-            )
-            unit_tokens = ("tco", "tonne", "ton ", "co2", "ghg", "kt", "mt")
-            unit_present = bool(explicit_unit) or any(
-                token in context.lower() for token in unit_tokens
+                token in lowered_segment for token in _NEAR_UNIT_TOKENS
             )
+            unit_present = bool(explicit_unit) or context_has_unit
             if not unit_present:
                 continue
             priority = 0
@@ -261,13 +321,8 @@ def _adjust_value_from_context(
     except ValueError:
         return raw_value
     explicit_unit = match.group(2)
-    unit = _infer_unit(context, explicit_unit)
-    factor = {
-        "kg": 1,
-        "t": 1_000,
-        "kt": 1_000_000,
-        "mt": 1_000_000_000,
-    }.get(unit, 1_000)
+    unit = _infer_unit(context.lower(), explicit_unit)
+    factor = _UNIT_FACTORS.get(unit, 1_000)
     expected = int(round(numeric * factor))
     if expected <= 0:
         return raw_value
@@ -295,24 +350,41 @@ def _detect_scope2_method(context: Optional[str]) -> Optional[str]:
 
 
 def parse_data_fuzzy(snippet_text: str) -> Optional[ParsedResult]:
-    lines = [line.strip() for line in snippet_text.splitlines() if line.strip()]
+    parsed = _parse_data_fuzzy_cached(snippet_text)
+    # Callers rewrite the contexts in place, so never hand out the cached object.
+    return parsed.model_copy() if parsed is not None else None
+
+
+@lru_cache(maxsize=256)
+def _parse_data_fuzzy_cached(snippet_text: str) -> Optional[ParsedResult]:
+    # Scope 1 and scope 2 each need their own mention; anything less can only
+    # produce both values by reading one line twice.
+    if snippet_text.lower().count("scope") < 2:
+        return None
+    lines = [
+        stripped for line in snippet_text.splitlines() if (stripped := line.strip())
+    ]
     if not lines:
         return None
 
+    lowered_lines = [line.lower() for line in lines]
+    candidates = _scope_candidate_lines(lowered_lines)
+
     values: dict[str, int] = {}
     scores: dict[str, float] = {}
     contexts: dict[str, Optional[str]] = {}
-    for scope_key, patterns in _SCOPE_PATTERNS.items():
-        idx, score = _find_scope_candidate(lines, patterns)
-        if idx is None or score < 60:
+    for scope_key, (idx, score) in _find_scope_candidates(candidates).items():
+        if idx is None or score < _MIN_SCOPE_SCORE:
             continue
-        value, context, distance, unit_present = _extract_numeric_value(lines, idx)
+        value, context, distance, unit_present = _extract_numeric_value(
+            lines, lowered_lines, idx
+        )
         if value is None or not context:
             continue
         if not unit_present:
             continue
         normalized_context = context.lower()
-        if not any(keyword in normalized_context for keyword in _CONTEXT_KEYWORDS):
+        if not _CONTEXT_KEYWORD_RE.search(normalized_context):
             continue
         values[scope_key] = value
         contexts[scope_key] = context
@@ -327,7 +399,9 @@ def parse_data_fuzzy(snippet_text: str) -> Optional[ParsedResult]:
     score_floor = min(scores["scope_1"], scores["scope_2"])
     confidence = max(0.1, min(0.95, score_floor / 100.0))
 
-    return ParsedResult(
+    # Every field here is built by this function (ints, strings, a clamped
+    # confidence), so skip pydantic validation.
+    return ParsedResult.model_construct(
         scope_1=values["scope_1"],
         scope_1_context=contexts.get("scope_1"),
         scope_2=values["scope_2"],
@@ -340,24 +414,26 @@ def parse_data_fuzzy(snippet_text: str) -> Optional[ParsedResult]:
     )
 
 
+_LOCAL_INSTRUCTIONS = (
+    "You will be given a snippet of PDF text from a company's 2025-period report.\n"
+    "- Extract total Scope 1, Scope 2, and optionally Scope 3 greenhouse gas emissions in kgCO2e as integers.\n"
+    "- If values are presented in tCO2e, ktCO2e, or MtCO2e, convert to kgCO2e.\n"
+    "- If a field is not present, set it to null. If values are placeholders or uncertain, prefer null.\n"
+    "- Include brief qualifiers (e.g., market vs location, boundary) if present.\n"
+    "- If you can identify the Scope 2 reporting method (market or location), include scope_2_method.\n"
+    "- Only provide a scope value when the snippet explicitly states a greenhouse gas figure with a unit "
+    '(e.g., "tCO2e", "tonnes CO2e", "kt CO2e"); otherwise set the value to null.\n'
+    "- Provide the sentence or short excerpt that justifies each scope value (scope_1_context, scope_2_context, scope_3_context).\n"
+    "- Copy the supporting text verbatim from the snippet; do not paraphrase or summarise it.\n"
+    "- Return a numeric confidence from 0.0 to 1.0 that reflects how likely these values are correct given the snippet.\n"
+    "Return only JSON with keys: scope_1, scope_1_context, scope_2, scope_2_context, scope_3, scope_3_context, qualifiers, scope_2_method, confidence."
+)
+
+
 def parse_data_local(client: OpenAI, snippet_text: str) -> Optional[ParsedResult]:
-    instructions = (
-        "You will be given a snippet of PDF text from a company's 2025-period report.\n"
-        "- Extract total Scope 1, Scope 2, and optionally Scope 3 greenhouse gas emissions in kgCO2e as integers.\n"
-        "- If values are presented in tCO2e, ktCO2e, or MtCO2e, convert to kgCO2e.\n"
-        "- If a field is not present, set it to null. If values are placeholders or uncertain, prefer null.\n"
-        "- Include brief qualifiers (e.g., market vs location, boundary) if present.\n"
-        "- If you can identify the Scope 2 reporting method (market or location), include scope_2_method.\n"
-        "- Only provide a scope value when the snippet explicitly states a greenhouse gas figure with a unit "
-        '(e.g., "tCO2e", "tonnes CO2e", "kt CO2e"); otherwise set the value to null.\n'
-        "- Provide the sentence or short excerpt that justifies each scope value (scope_1_context, scope_2_context, scope_3_context).\n"
-        "- Copy the supporting text verbatim from the snippet; do not paraphrase or summarise it.\n"
-        "- Return a numeric confidence from 0.0 to 1.0 that reflects how likely these values are correct given the snippet.\n"
-        "Return only JSON with keys: scope_1, scope_1_context, scope_2, scope_2_context, scope_3, scope_3_context, qualifiers, scope_2_method, confidence."
-    )
     with suppress(Exception):
         resp = client.responses.parse(
-            instructions=instructions,
+            instructions=_LOCAL_INSTRUCTIONS,
             input=snippet_text,
             text_format=ParsedResult,
             model="gpt-4o-mini",
@@ -367,20 +443,97 @@ def parse_data_local(client: OpenAI, snippet_text: str) -> Optional[ParsedResult
     return None
 
 
+def _batch_output_text(body: dict[str, Any]) -> Optional[str]:
+    for item in body.get("output") or []:
+        if item.get("type") != "message":
+            continue
+        for part in item.get("content") or []:
+            if part.get("type") == "output_text":
+                return part.get("text")
+    return None
+
+
+def parse_data_local_batch(
+    client: OpenAI,
+    snippets: dict[str, str],
+    *,
+    poll_interval: float = 30.0,
+    log: Optional[Callable[[str], None]] = None,
+) -> dict[str, Optional[ParsedResult]]:
+    """Run parse_data_local over many snippets through the OpenAI Batch API.
+
+    ``snippets`` maps a caller-chosen id to snippet text; the result maps each
+    id to its ParsedResult (None when the request failed or didn't parse).
+    Blocks until the batch finishes, which can take up to the 24h window.
+    """
+    results: dict[str, Optional[ParsedResult]] = dict.fromkeys(snippets)
+    if not snippets:
+        return results
+    request_lines = [
+        json.dumps(
+            {
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/responses",
+                "body": {
+                    "model": "gpt-4o-mini",
+                    "temperature": 0,
+                    "instructions": _LOCAL_INSTRUCTIONS,
+                    "input": snippet_text,
+                    "text": {"format": {"type": "json_object"}},
+                },
+            }
+        )
+        for custom_id, snippet_text in snippets.items()
+    ]
+    batch_input = client.files.create(
+        file=("ai_snippet_batch.jsonl", "\n".join(request_lines).encode("utf-8")),
+        purpose="batch",
+    )
+    batch = client.batches.create(
+        input_file_id=batch_input.id,
+        endpoint="/v1/responses",
+        completion_window="24h",
+    )
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        if log is not None:
+            log(f"[batch] {batch.id} {batch.status}; waiting {poll_interval:.0f}s")
+        time.sleep(poll_interval)
+        batch = client.batches.retrieve(batch.id)
+    if log is not None:
+        log(f"[batch] {batch.id} finished with status {batch.status}")
+    if not batch.output_file_id:
+        return results
+    output = client.files.content(batch.output_file_id).text
+    for raw_line in output.splitlines():
+        with suppress(Exception):
+            record = json.loads(raw_line)
+            custom_id = record["custom_id"]
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                continue
+            text = _batch_output_text(response.get("body") or {})
+            if text and custom_id in results:
+                results[custom_id] = ParsedResult.model_validate_json(
+                    _clean_json_response(text)
+                )
+    return results
+
+
 def _clean_json_response(text: str) -> str:
     text = text.strip()
     if text.startswith("```"):
-        # Remove optional ```json fences
-        parts = text.split("```")
-        text = ""
-        for part in parts:
-            part = part.strip()
-            if not part:
-                continue
-            if part.lower().startswith("json"):
-                part = part[4:].strip()
-            text = part
-            break
+        # Keep the first non-empty fenced segment, minus an optional json tag
+        start = 3
+        while True:
+            end = text.find("```", start)
+            part = text[start : end if end != -1 else None].strip()
+            if part or end == -1:
+                break
+            start = end + 3
+        if part.lower().startswith("json"):
+            part = part[4:].strip()
+        text = part
     if text.endswith("```"):
         text = text[: text.rfind("```")].strip()
     start = text.find("{")
@@ -390,24 +543,25 @@ def _clean_json_response(text: str) -> str:
     return text
 
 
+_LLAMA_PROMPT_PREFIX = (
+    "You will be given a snippet of PDF text from a company's 2025-period report.\n"
+    "Extract total Scope 1, Scope 2, and optionally Scope 3 greenhouse gas emissions in kgCO2e as integers. "
+    "If the values use units like tCO2e, ktCO2e, or MtCO2e, convert them to kgCO2e. "
+    "Set any missing values to null. Capture qualifiers (e.g., boundary or method) if present. "
+    "If you can detect the Scope 2 reporting method (market or location), include it. "
+    "Only provide a scope value when the snippet explicitly states a greenhouse gas figure with a unit "
+    '(e.g., "tCO2e", "tonnes CO2e", "kt CO2e"); otherwise set the value to null. '
+    "For each scope value, include the sentence or short excerpt that supports it (scope_1_context, scope_2_context, scope_3_context). "
+    "Return a JSON object with keys: scope_1, scope_1_context, scope_2, scope_2_context, scope_3, scope_3_context, qualifiers, scope_2_method, confidence "
+    "(confidence should be between 0.0 and 1.0).\n\n"
+    "Snippet:\n"
+)
+
+
 def parse_data_llama(llm: Any, snippet_text: str) -> Optional[ParsedResult]:
     if llm is None:
         return None
-    prompt = (
-        "You will be given a snippet of PDF text from a company's 2025-period report.\n"
-        "Extract total Scope 1, Scope 2, and optionally Scope 3 greenhouse gas emissions in kgCO2e as integers. "
-        "If the values use units like tCO2e, ktCO2e, or MtCO2e, convert them to kgCO2e. "
-        "Set any missing values to null. Capture qualifiers (e.g., boundary or method) if present. "
-        "If you can detect the Scope 2 reporting method (market or location), include it. "
-        "Only provide a scope value when the snippet explicitly states a greenhouse gas figure with a unit "
-        '(e.g., "tCO2e", "tonnes CO2e", "kt CO2e"); otherwise set the value to null. '
-        "For each scope value, include the sentence or short excerpt that supports it (scope_1_context, scope_2_context, scope_3_context). "
-        "Return a JSON object with keys: scope_1, scope_1_context, scope_2, scope_2_context, scope_3, scope_3_context, qualifiers, scope_2_method, confidence "
-        "(confidence should be between 0.0 and 1.0).\n\n"
-        "Snippet:\n"
-        f"{snippet_text}\n\n"
-        "JSON:"
-    )
+    prompt = f"{_LLAMA_PROMPT_PREFIX}{snippet_text}\n\nJSON:"
     with suppress(Exception):
         response = llm.create_completion(
             prompt=prompt, temperature=0, max_tokens=512, stop=["\n\n"]
@@ -418,6 +572,14 @@ def parse_data_llama(llm: Any, snippet_text: str) -> Optional[ParsedResult]:
     return None
 
 
+_ADVICE_INSTRUCTIONS = (
+    "You are given a snippet of text extracted from a PDF and the expected company name and reporting year. "
+    "Determine why Scope 1/2 emissions could not be confirmed and provide a short recommendation. "
+    "Return JSON with: label(one of retry_search, needs_ocr, wrong_company, wrong_report_type, year_mismatch, "
+    "insufficient_content, give_up, unknown), reason, suggestion (optional concise query or next step)."
+)
+
+
 def advise_on_failure(
     client: OpenAI,
     snippet_text: str,
@@ -425,16 +587,10 @@ def advise_on_failure(
     company_name: str,
     year: str = "2025",
 ) -> Optional[Advice]:
-    instructions = (
-        "You are given a snippet of text extracted from a PDF and the expected company name and reporting year. "
-        "Determine why Scope 1/2 emissions could not be confirmed and provide a short recommendation. "
-        "Return JSON with: label(one of retry_search, needs_ocr, wrong_company, wrong_report_type, year_mismatch, "
-        "insufficient_content, give_up, unknown), reason, suggestion (optional concise query or next step)."
-    )
     payload = f"Company: {company_name}\nExpected year: {year}\nPDF file: {pdf_path.name}\n\nSnippet:\n{snippet_text[:8000]}"
     with suppress(Exception):
         resp = client.responses.parse(
-            instructions=instructions,
+            instructions=_ADVICE_INSTRUCTIONS,
             input=payload,
             text_format=Advice,
             model="gpt-4o-mini",
@@ -444,28 +600,30 @@ def advise_on_failure(
     return None
 
 
+_FILESEARCH_INSTRUCTIONS = (
+    "Search the provided vector store for this company's 2025-period report content and extract total Scope 1, "
+    "Scope 2, and optionally Scope 3 greenhouse gas emissions in kgCO2e as integers. Convert any units to kgCO2e. "
+    "Include qualifiers if method (market vs location) or boundary is specified. If a field is not present, set null. "
+    "If you can identify the Scope 2 reporting method (market or location), include scope_2_method. "
+    "Only provide a scope value when the retrieved text explicitly states a greenhouse gas figure with a unit "
+    '(e.g., "tCO2e", "tonnes CO2e", "kt CO2e"); otherwise set the value to null. '
+    "Provide the sentence or short excerpt that supports each scope value (scope_1_context, scope_2_context, scope_3_context). "
+    "Copy the supporting text verbatim from the retrieved content; do not paraphrase or summarise it. "
+    "Also return a numeric confidence from 0.0 to 1.0.\n"
+    "Return only JSON with keys: scope_1, scope_1_context, scope_2, scope_2_context, scope_3, scope_3_context, qualifiers, scope_2_method, confidence."
+)
+
+
 def parse_data_filesearch(
     client: OpenAI,
     vector_store_id: str,
     company_name: str,
     ticker: str,
 ) -> Optional[ParsedResult]:
-    instructions = (
-        "Search the provided vector store for this company's 2025-period report content and extract total Scope 1, "
-        "Scope 2, and optionally Scope 3 greenhouse gas emissions in kgCO2e as integers. Convert any units to kgCO2e. "
-        "Include qualifiers if method (market vs location) or boundary is specified. If a field is not present, set null. "
-        "If you can identify the Scope 2 reporting method (market or location), include scope_2_method. "
-        "Only provide a scope value when the retrieved text explicitly states a greenhouse gas figure with a unit "
-        '(e.g., "tCO2e", "tonnes CO2e", "kt CO2e"); otherwise set the value to null. '
-        "Provide the sentence or short excerpt that supports each scope value (scope_1_context, scope_2_context, scope_3_context). "
-        "Copy the supporting text verbatim from the retrieved content; do not paraphrase or summarise it. "
-        "Also return a numeric confidence from 0.0 to 1.0.\n"
-        "Return only JSON with keys: scope_1, scope_1_context, scope_2, scope_2_context, scope_3, scope_3_context, qualifiers, scope_2_method, confidence."
-    )
     query = f"Company: {company_name}\nTicker: {ticker}\nTask: Extract Scope 1, Scope 2, Scope 3 totals (kgCO2e)."
     with suppress(Exception):
         resp = client.responses.parse(
-            instructions=instructions,
+            instructions=_FILESEARCH_INSTRUCTIONS,
             input=query,
             text_format=ParsedResult,
             tools=[